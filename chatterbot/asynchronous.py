@@ -0,0 +1,86 @@
+"""
+The asynchronous response pipeline used by ``ChatBot.get_response_async``.
+
+This module uses the ``async`` and ``await`` keywords and requires Python 3.5
+or later. It is only imported when a chat bot's asynchronous methods are used.
+"""
+from chatterbot import utils
+
+
+def get_async_storage(chatbot):
+    """
+    Return the asynchronous interface to the chat bot's storage adapter.
+
+    The storage adapter and the logic adapters are not guaranteed to be thread
+    safe, so by default the same single worker thread is used to access storage
+    and to generate responses. The async_executor parameter of the chat bot can
+    be used to set a different executor.
+    """
+    if chatbot.async_storage is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        if chatbot.async_executor is None:
+            chatbot.async_executor = ThreadPoolExecutor(max_workers=1)
+
+        AsyncStorageAdapter = utils.import_module(chatbot.async_storage_adapter)
+
+        chatbot.async_storage = AsyncStorageAdapter(
+            chatbot.storage, executor=chatbot.async_executor
+        )
+
+    return chatbot.async_storage
+
+
+def process_input(chatbot, input_item):
+    """
+    Return the preprocessed input statement for an input value.
+    """
+    input_statement = chatbot.input.process_input_statement(input_item)
+
+    # Preprocess the input statement
+    for preprocessor in chatbot.preprocessors:
+        input_statement = preprocessor(chatbot, input_statement)
+
+    return input_statement
+
+
+async def get_response(chatbot, input_item, conversation_id=None):
+    """
+    Return the chat bot's response based on the input.
+    This follows the same steps as ``ChatBot.get_response``.
+
+    :param chatbot: The chat bot to get a response from.
+    :param input_item: An input value.
+    :param conversation_id: The id of a conversation.
+    :returns: A response to the input.
+    :rtype: Statement
+    """
+    storage = get_async_storage(chatbot)
+
+    if not conversation_id:
+        if not chatbot.default_conversation_id:
+            default_conversation_id = await storage.create_conversation()
+
+            # Another response may have created the default conversation first
+            if not chatbot.default_conversation_id:
+                chatbot.default_conversation_id = default_conversation_id
+
+        conversation_id = chatbot.default_conversation_id
+
+    # Processing the input looks up the input statement in storage
+    input_statement = await storage.run(process_input, chatbot, input_item)
+
+    # Comparing statements is CPU bound, so it is run in the executor as well
+    statement, response = await storage.run(
+        chatbot.generate_response, input_statement, conversation_id
+    )
+
+    if not chatbot.read_only:
+        # Learn that the user's input was a valid response to the chat bot's previous output
+        previous_statement = await storage.get_latest_response(conversation_id)
+
+        await storage.run(chatbot.learn_response, statement, previous_statement)
+        await storage.add_to_conversation(conversation_id, statement, response)
+
+    # Process the response output with the output adapter, which may send it over the network
+    return await storage.run(chatbot.output.process_response, response, conversation_id)
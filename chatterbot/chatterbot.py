@@ -85,15 +85,29 @@ class ChatBot(object):
         # Allow the bot to save input it receives so that it can learn
         self.read_only = kwargs.get('read_only', False)
 
+        # The executor that responses are generated in by get_response_async
+        self.async_executor = kwargs.get('async_executor')
+        self.async_storage_adapter = kwargs.get(
+            'async_storage_adapter', 'chatterbot.storage.async_storage.AsyncStorageAdapter'
+        )
+        self.async_storage = None
+
         if kwargs.get('initialize', True):
             self.initialize()
 
     def initialize(self):
         """
         Do any work that needs to be done before the responses can be returned.
+        This includes loading the models used to compare statements, so that
+        the first response takes as long as any other.
         """
         self.logic.initialize()
 
+        durations = self.logic.prepare()
+
+        for name, duration in sorted(durations.items()):
+            self.logger.info('{} took {:.3f} seconds'.format(name, duration))
+
     def get_response(self, input_item, conversation_id=None):
         """
         Return the bot's response based on the input.
@@ -103,28 +117,77 @@ class ChatBot(object):
         :returns: A response to the input.
         :rtype: Statement
         """
+        return next(self.get_responses([input_item], conversation_id))
+
+    def get_responses(self, input_items, conversation_id=None, read_only=None):
+        """
+        Return the bot's response to each input in turn. The responses are
+        generated lazily, so that large numbers of inputs can be processed
+        without holding every response in memory.
+
+        Work that does not depend on an individual input, such as finding
+        the conversation, is done once for the batch.
+
+        :param input_items: An iterable of input values.
+        :param conversation_id: The id of a conversation that every input belongs to.
+
+        :param read_only: If True, the inputs are not saved and nothing is
+                          learned from them. Defaults to the chat bot's
+                          read_only setting.
+        :type read_only: bool
+
+        :returns: A generator of responses to the inputs.
+        """
+        if read_only is None:
+            read_only = self.read_only
+
         if not conversation_id:
             if not self.default_conversation_id:
                 self.default_conversation_id = self.storage.create_conversation()
             conversation_id = self.default_conversation_id
 
-        input_statement = self.input.process_input_statement(input_item)
+        for input_item in input_items:
+
+            # Share a database connection and cache repeated lookups while responding
+            self.storage.start_request()
 
-        # Preprocess the input statement
-        for preprocessor in self.preprocessors:
-            input_statement = preprocessor(self, input_statement)
+            try:
+                input_statement = self.input.process_input_statement(input_item)
 
-        statement, response = self.generate_response(input_statement, conversation_id)
+                # Preprocess the input statement
+                for preprocessor in self.preprocessors:
+                    input_statement = preprocessor(self, input_statement)
 
-        # Learn that the user's input was a valid response to the chat bot's previous output
-        previous_statement = self.storage.get_latest_response(conversation_id)
+                statement, response = self.generate_response(input_statement, conversation_id)
 
-        if not self.read_only:
-            self.learn_response(statement, previous_statement)
-            self.storage.add_to_conversation(conversation_id, statement, response)
+                if not read_only:
+                    # Learn that the user's input was a valid response to the chat bot's previous output
+                    previous_statement = self.storage.get_latest_response(conversation_id)
 
-        # Process the response output with the output adapter
-        return self.output.process_response(response, conversation_id)
+                    self.learn_response(statement, previous_statement)
+                    self.storage.add_to_conversation(conversation_id, statement, response)
+
+                # Process the response output with the output adapter
+                response = self.output.process_response(response, conversation_id)
+            finally:
+                self.storage.finish_request()
+
+            yield response
+
+    def get_response_async(self, input_item, conversation_id=None):
+        """
+        Return a coroutine that returns the bot's response based on the input.
+        Storage access and response generation are run in an executor,
+        so that the event loop is not blocked while a response is selected.
+        This method requires Python 3.5 or later.
+
+        :param input_item: An input value.
+        :param conversation_id: The id of a conversation.
+        :returns: A coroutine that returns a response to the input.
+        """
+        from .asynchronous import get_response
+
+        return get_response(self, input_item, conversation_id)
 
     def generate_response(self, input_statement, conversation_id):
         """
@@ -155,6 +218,13 @@ class ChatBot(object):
         # Save the statement after selecting a response
         self.storage.update(statement)
 
+    def close(self):
+        """
+        Stop any threads or processes that the chat bot's logic adapters have
+        started. The chat bot starts them again if it is used after this.
+        """
+        self.logic.close()
+
     def set_trainer(self, training_class, **kwargs):
         """
         Set the module used to train the chatbot.
@@ -2,6 +2,7 @@
 This module contains various text-comparison algorithms
 designed to compare one statement to another.
 """
+from chatterbot import constants
 
 # Use python-Levenshtein if available
 try:
@@ -18,6 +19,51 @@ class Comparator:
     def compare(self, statement_a, statement_b):
         return 0
 
+    def compare_many(self, statement, other_statements):
+        """
+        Compare the statement to each statement in a list of statements.
+        This may be overridden by a child class to provide a more efficient
+        method to score a large list of statements.
+
+        :return: The similarity of the statement to each of the other statements.
+        :rtype: list
+        """
+        return [
+            self.compare(statement, other_statement) for other_statement in other_statements
+        ]
+
+    def get_feature_functions(self):
+        """
+        Return a dictionary of functions that compute features of the text
+        of a statement that can be reused each time the statement is compared.
+        Each function takes the text of a statement as its only parameter.
+        """
+        return {}
+
+    def get_extra_data_functions(self):
+        """
+        Return a dictionary of functions that compute features of the text
+        of a statement which should be saved in the statement's extra data,
+        so that they are computed when the statement is trained rather than
+        when it is compared. Each dictionary key is used as the extra data key.
+        """
+        return {}
+
+    def get_features(self, statement, name, function):
+        """
+        Return a feature of the statement's text. The value stored in the
+        candidate index, or in the statement's extra data, is used if it is available.
+        """
+        if hasattr(statement, 'get_feature'):
+            return statement.get_feature(name, function)
+
+        extra_data = getattr(statement, 'extra_data', None)
+
+        if isinstance(extra_data, dict) and name in extra_data:
+            return extra_data[name]
+
+        return function(statement.text)
+
     def get_initialization_functions(self):
         """
         Return all initialization methods for the comparison algorithm.
@@ -35,6 +81,43 @@ class Comparator:
             key: value for (key, value) in initialization_methods
         }
 
+    def get_preparation_functions(self):
+        """
+        Return all preparation methods for the comparison algorithm.
+        Preparation methods must start with 'prepare_' and
+        take no parameters.
+        """
+        preparation_methods = [
+            (
+                method,
+                getattr(self, method),
+            ) for method in dir(self) if method.startswith('prepare_')
+        ]
+
+        return {
+            key: value for (key, value) in preparation_methods
+        }
+
+    def prepare(self):
+        """
+        Load the models that the comparison algorithm uses so that they are
+        held for the life of the process, rather than being loaded when the
+        first statement is compared.
+
+        :returns: The number of seconds that each preparation method took.
+        :rtype: dict
+        """
+        import time
+
+        durations = {}
+
+        for name, function in self.get_preparation_functions().items():
+            start_time = time.time()
+            function()
+            durations[name] = time.time() - start_time
+
+        return durations
+
 
 class LevenshteinDistance(Comparator):
     """
@@ -73,6 +156,60 @@ class LevenshteinDistance(Comparator):
 
         return percent
 
+    def compare_many(self, statement, other_statements):
+        """
+        Compare the input statement to each statement in a list of statements.
+
+        The lowercase text of each statement in the candidate index is computed
+        once and then reused. One sequence matcher is created for each call,
+        holding the input text as its first sequence, and only the second
+        sequence is replaced for each statement. The matcher is not shared
+        between calls, so the same candidates can be compared concurrently.
+
+        :return: The percent of similarity between the input statement and each statement.
+        :rtype: list
+        """
+        if not statement.text:
+            return [0] * len(other_statements)
+
+        similarity = SequenceMatcher(None, str(statement.text.lower()), '')
+
+        results = []
+
+        for other_statement in other_statements:
+            if not other_statement.text:
+                results.append(0)
+                continue
+
+            other_statement_text = self.get_features(
+                other_statement, 'levenshtein_lowercase_text', self.get_lowercase_text
+            )
+
+            similarity.set_seq2(other_statement_text)
+
+            results.append(round(similarity.ratio(), 2))
+
+        return results
+
+    def length_upper_bound(self, length, other_length):
+        """
+        Return the greatest similarity that two statements with text of the
+        given lengths can have. The number of matching characters can be no
+        more than the length of the shorter text.
+
+        :rtype: float
+        """
+        if not length or not other_length:
+            return 0
+
+        return round(2.0 * min(length, other_length) / (length + other_length), 2)
+
+    def get_lowercase_text(self, text):
+        """
+        Return the lowercase version of the text.
+        """
+        return str(text.lower())
+
 
 class SynsetDistance(Comparator):
     """
@@ -84,6 +221,13 @@ class SynsetDistance(Comparator):
     This is essentially an evaluation of the closeness of synonyms.
     """
 
+    # The maximum number of synset pairs to keep the path similarity of
+    SIMILARITY_CACHE_SIZE = 100000
+
+    def __init__(self):
+        self.similarity_cache = {}
+        self.stopwords = None
+
     def initialize_nltk_wordnet(self):
         """
         Download required NLTK corpora if they have not already been downloaded.
@@ -108,6 +252,81 @@ class SynsetDistance(Comparator):
 
         nltk_download_corpus('corpora/stopwords')
 
+    def prepare_wordnet(self):
+        """
+        Load the WordNet corpus reader.
+        """
+        from nltk.corpus import wordnet
+
+        wordnet.synsets('prepare')
+
+    def prepare_punkt(self):
+        """
+        Load the Punkt word tokenizer.
+        """
+        from nltk import word_tokenize
+
+        word_tokenize('Prepare the tokenizer.')
+
+    def prepare_stopwords(self):
+        """
+        Load the set of English stopwords.
+        """
+        self.get_stopwords()
+
+    def get_stopwords(self):
+        """
+        Return the set of default English stopwords.
+        """
+        if self.stopwords is None:
+            from nltk.corpus import stopwords
+
+            self.stopwords = set(stopwords.words('english'))
+
+        return self.stopwords
+
+    def get_feature_functions(self):
+        """
+        Return the function used to compute the synsets of a statement.
+        """
+        return {
+            'synset_distance': self.get_synset_features
+        }
+
+    def get_synset_features(self, text):
+        """
+        Return the number of words in the text and the set of synsets
+        for each token in the text that is not a stopword.
+        """
+        from nltk.corpus import wordnet
+        from nltk import word_tokenize
+
+        tokens = word_tokenize(text.lower())
+
+        # Remove all stop words from the list of word tokens
+        tokens = set(tokens) - self.get_stopwords()
+
+        synsets = set()
+        for token in tokens:
+            synsets.update(wordnet.synsets(token))
+
+        return len(text.split()), frozenset(synsets)
+
+    def get_path_similarity(self, synset, other_synset):
+        """
+        Return the path similarity of two synsets.
+        The result is kept so that each pair of synsets is only compared once.
+        """
+        key = (synset, other_synset, )
+
+        if key not in self.similarity_cache:
+            if len(self.similarity_cache) >= self.SIMILARITY_CACHE_SIZE:
+                self.similarity_cache = {}
+
+            self.similarity_cache[key] = synset.path_similarity(other_synset)
+
+        return self.similarity_cache[key]
+
     def compare(self, statement, other_statement):
         """
         Compare the two input statements.
@@ -118,48 +337,50 @@ class SynsetDistance(Comparator):
         .. _wordnet: http://www.nltk.org/howto/wordnet.html
         .. _NLTK: http://www.nltk.org/
         """
-        from nltk.corpus import wordnet
-        from nltk import word_tokenize
-        from chatterbot import utils
-        import itertools
+        return self.compare_many(statement, [other_statement])[0]
 
-        tokens1 = word_tokenize(statement.text.lower())
-        tokens2 = word_tokenize(other_statement.text.lower())
+    def compare_many(self, statement, other_statements):
+        """
+        Compare the input statement to each statement in a list of statements.
+        The synsets of the input statement are only looked up once.
 
-        # Remove all stop words from the list of word tokens
-        tokens1 = utils.remove_stopwords(tokens1, language='english')
-        tokens2 = utils.remove_stopwords(tokens2, language='english')
-
-        # The maximum possible similarity is an exact match
-        # Because path_similarity returns a value between 0 and 1,
-        # max_possible_similarity is the number of words in the longer
-        # of the two input statements.
-        max_possible_similarity = max(
-            len(statement.text.split()),
-            len(other_statement.text.split())
+        :return: The percent of similarity between the closest synset distance for each statement.
+        :rtype: list
+        """
+        word_count, synsets = self.get_features(
+            statement, 'synset_distance', self.get_synset_features
         )
 
-        max_similarity = 0.0
+        results = []
+
+        for other_statement in other_statements:
+            other_word_count, other_synsets = self.get_features(
+                other_statement, 'synset_distance', self.get_synset_features
+            )
 
-        # Get the highest matching value for each possible combination of words
-        for combination in itertools.product(*[tokens1, tokens2]):
+            # The maximum possible similarity is an exact match
+            # Because path_similarity returns a value between 0 and 1,
+            # max_possible_similarity is the number of words in the longer
+            # of the two input statements.
+            max_possible_similarity = max(word_count, other_word_count)
 
-            synset1 = wordnet.synsets(combination[0])
-            synset2 = wordnet.synsets(combination[1])
+            if max_possible_similarity == 0:
+                results.append(0)
+                continue
 
-            if synset1 and synset2:
+            max_similarity = 0.0
 
-                # Get the highest similarity for each combination of synsets
-                for synset in itertools.product(*[synset1, synset2]):
-                    similarity = synset[0].path_similarity(synset[1])
+            # Get the highest similarity for each combination of synsets
+            for synset in synsets:
+                for other_synset in other_synsets:
+                    similarity = self.get_path_similarity(synset, other_synset)
 
                     if similarity and (similarity > max_similarity):
                         max_similarity = similarity
 
-        if max_possible_similarity == 0:
-            return 0
+            results.append(max_similarity / max_possible_similarity)
 
-        return max_similarity / max_possible_similarity
+        return results
 
 
 class SentimentComparison(Comparator):
@@ -168,6 +389,12 @@ class SentimentComparison(Comparator):
     the sentiment value calculated for each statement.
     """
 
+    # The sentiment analyzer is shared by every instance in the process
+    sentiment_analyzer = None
+
+    # The extra data key that the sentiment of each statement is saved under
+    extra_data_key = constants.COMPUTED_EXTRA_DATA_PREFIX + 'sentiment'
+
     def initialize_nltk_vader_lexicon(self):
         """
         Download the NLTK vader lexicon for sentiment analysis
@@ -177,6 +404,49 @@ class SentimentComparison(Comparator):
 
         nltk_download_corpus('sentiment/vader_lexicon')
 
+    def prepare_vader_lexicon(self):
+        """
+        Load the VADER sentiment analyzer and its lexicon.
+        """
+        self.get_sentiment_analyzer()
+
+    def get_sentiment_analyzer(self):
+        """
+        Return the VADER sentiment analyzer, loading its lexicon
+        the first time that it is requested.
+        """
+        if SentimentComparison.sentiment_analyzer is None:
+            from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+            SentimentComparison.sentiment_analyzer = SentimentIntensityAnalyzer()
+
+        return SentimentComparison.sentiment_analyzer
+
+    def get_extra_data_functions(self):
+        """
+        Return the function used to compute the sentiment of a statement.
+        """
+        return {
+            self.extra_data_key: self.get_sentiment
+        }
+
+    def get_sentiment(self, text):
+        """
+        Return the polarity with the greatest score for the
+        text and the value of that score.
+        """
+        sentiment_analyzer = self.get_sentiment_analyzer()
+        polarity_scores = sentiment_analyzer.polarity_scores(text.lower())
+
+        greatest_polarity = 'neu'
+        greatest_score = -1
+        for polarity in sorted(polarity_scores):
+            if polarity_scores[polarity] > greatest_score:
+                greatest_polarity = polarity
+                greatest_score = polarity_scores[polarity]
+
+        return greatest_polarity, greatest_score
+
     def compare(self, statement, other_statement):
         """
         Return the similarity of two statements based on
@@ -185,34 +455,37 @@ class SentimentComparison(Comparator):
         :return: The percent of similarity between the sentiment value.
         :rtype: float
         """
-        from nltk.sentiment.vader import SentimentIntensityAnalyzer
+        return self.compare_many(statement, [other_statement])[0]
 
-        sentiment_analyzer = SentimentIntensityAnalyzer()
-        statement_polarity = sentiment_analyzer.polarity_scores(statement.text.lower())
-        statement2_polarity = sentiment_analyzer.polarity_scores(other_statement.text.lower())
+    def compare_many(self, statement, other_statements):
+        """
+        Compare the sentiment of the input statement to each statement
+        in a list of statements. The sentiment of each statement in the list
+        is read from its extra data if it was saved when the statement was trained.
 
-        statement_greatest_polarity = 'neu'
-        statement_greatest_score = -1
-        for polarity in sorted(statement_polarity):
-            if statement_polarity[polarity] > statement_greatest_score:
-                statement_greatest_polarity = polarity
-                statement_greatest_score = statement_polarity[polarity]
+        :return: The percent of similarity between the sentiment value for each statement.
+        :rtype: list
+        """
+        statement_polarity, statement_score = self.get_sentiment(statement.text)
 
-        statement2_greatest_polarity = 'neu'
-        statement2_greatest_score = -1
-        for polarity in sorted(statement2_polarity):
-            if statement2_polarity[polarity] > statement2_greatest_score:
-                statement2_greatest_polarity = polarity
-                statement2_greatest_score = statement2_polarity[polarity]
+        results = []
 
-        # Check if the polarity if of a different type
-        if statement_greatest_polarity != statement2_greatest_polarity:
-            return 0
+        for other_statement in other_statements:
+            other_polarity, other_score = self.get_features(
+                other_statement, self.extra_data_key, self.get_sentiment
+            )
 
-        values = [statement_greatest_score, statement2_greatest_score]
-        difference = max(values) - min(values)
+            # Check if the polarity if of a different type
+            if statement_polarity != other_polarity:
+                results.append(0)
+                continue
 
-        return 1.0 - difference
+            values = [statement_score, other_score]
+            difference = max(values) - min(values)
+
+            results.append(1.0 - difference)
+
+        return results
 
 
 class JaccardSimilarity(Comparator):
@@ -243,6 +516,10 @@ class JaccardSimilarity(Comparator):
 
     SIMILARITY_THRESHOLD = 0.5
 
+    def __init__(self):
+        self.stopwords = None
+        self.lemmatizer = None
+
     def initialize_nltk_wordnet(self):
         """
         Download the NLTK wordnet corpora that is required for this algorithm
@@ -252,23 +529,80 @@ class JaccardSimilarity(Comparator):
 
         nltk_download_corpus('corpora/wordnet')
 
-    def compare(self, statement, other_statement):
+    def prepare_punkt(self):
         """
-        Return the calculated similarity of two
-        statements based on the Jaccard index.
+        Load the Punkt word tokenizer.
+        """
+        import nltk
+
+        nltk.tokenize.word_tokenize('Prepare the tokenizer.')
+
+    def prepare_averaged_perceptron_tagger(self):
+        """
+        Load the part of speech tagger.
+        """
+        import nltk
+
+        nltk.pos_tag(['Prepare', 'the', 'tagger'])
+
+    def prepare_stopwords(self):
+        """
+        Load the set of English stopwords.
+        """
+        self.get_stopwords()
+
+    def prepare_lemmatizer(self):
+        """
+        Load the WordNet lemmatizer and the WordNet corpus reader that it uses.
+        """
+        self.get_lemmatizer().lemmatize('preparations')
+
+    def get_stopwords(self):
+        """
+        Return the set of default English stopwords, extended with punctuation.
+        """
+        if self.stopwords is None:
+            import nltk
+            import string
+
+            stopwords = set(nltk.corpus.stopwords.words('english'))
+            stopwords.update(string.punctuation)
+            stopwords.add('')
+
+            self.stopwords = stopwords
+
+        return self.stopwords
+
+    def get_lemmatizer(self):
+        """
+        Return the WordNet lemmatizer.
+        """
+        if self.lemmatizer is None:
+            import nltk
+
+            self.lemmatizer = nltk.stem.wordnet.WordNetLemmatizer()
+
+        return self.lemmatizer
+
+    def get_feature_functions(self):
+        """
+        Return the function used to compute the lemmas of a statement.
+        """
+        return {
+            'jaccard_similarity': self.get_lemmas
+        }
+
+    def get_lemmas(self, text):
+        """
+        Return the set of lemmas for the nouns in the text
+        that are not stopwords or punctuation.
         """
         from nltk.corpus import wordnet
         import nltk
         import string
 
-        a = statement.text.lower()
-        b = other_statement.text.lower()
-
-        # Get default English stopwords and extend with punctuation
-        stopwords = nltk.corpus.stopwords.words('english')
-        stopwords.extend(string.punctuation)
-        stopwords.append('')
-        lemmatizer = nltk.stem.wordnet.WordNetLemmatizer()
+        stopwords = self.get_stopwords()
+        lemmatizer = self.get_lemmatizer()
 
         def get_wordnet_pos(pos_tag):
             if pos_tag[1].startswith('J'):
@@ -282,34 +616,49 @@ class JaccardSimilarity(Comparator):
             else:
                 return (pos_tag[0], wordnet.NOUN)
 
-        ratio = 0
-        pos_a = map(get_wordnet_pos, nltk.pos_tag(nltk.tokenize.word_tokenize(a)))
-        pos_b = map(get_wordnet_pos, nltk.pos_tag(nltk.tokenize.word_tokenize(b)))
-        lemma_a = [
-            lemmatizer.lemmatize(
-                token.strip(string.punctuation),
-                pos
-            ) for token, pos in pos_a if pos == wordnet.NOUN and token.strip(
-                string.punctuation
-            ) not in stopwords
-        ]
-        lemma_b = [
+        pos_tags = map(get_wordnet_pos, nltk.pos_tag(nltk.tokenize.word_tokenize(text.lower())))
+
+        return frozenset(
             lemmatizer.lemmatize(
                 token.strip(string.punctuation),
                 pos
-            ) for token, pos in pos_b if pos == wordnet.NOUN and token.strip(
+            ) for token, pos in pos_tags if pos == wordnet.NOUN and token.strip(
                 string.punctuation
             ) not in stopwords
-        ]
+        )
+
+    def compare(self, statement, other_statement):
+        """
+        Return the calculated similarity of two
+        statements based on the Jaccard index.
+        """
+        return self.compare_many(statement, [other_statement])[0]
+
+    def compare_many(self, statement, other_statements):
+        """
+        Return the calculated similarity of the input statement to each
+        statement in a list of statements, based on the Jaccard index.
+        The lemmas of the input statement are only computed once.
+        """
+        lemmas = self.get_lemmas(statement.text)
+
+        results = []
+
+        for other_statement in other_statements:
+            other_lemmas = self.get_features(
+                other_statement, 'jaccard_similarity', self.get_lemmas
+            )
+
+            # Calculate Jaccard similarity
+            ratio = 0
+            denominator = float(len(lemmas | other_lemmas))
+
+            if denominator:
+                ratio = len(lemmas & other_lemmas) / denominator
+
+            results.append(ratio >= self.SIMILARITY_THRESHOLD)
 
-        # Calculate Jaccard similarity
-        try:
-            numerator = len(set(lemma_a).intersection(lemma_b))
-            denominator = float(len(set(lemma_a).union(lemma_b)))
-            ratio = numerator / denominator
-        except Exception as e:
-            print('Error', e)
-        return ratio >= self.SIMILARITY_THRESHOLD
+        return results
 
 
 # ---------------------------------------- #
@@ -12,4 +12,19 @@ STATEMENT_TEXT_MAX_LENGTH = 400
 # The maximum length of characters that the name of a tag can contain
 TAG_NAME_MAX_LENGTH = 50
 
+# The maximum length of characters that an indexed extra data key can contain
+EXTRA_DATA_KEY_MAX_LENGTH = 50
+
+# The number of random ids that are looked up before a random statement is
+# selected from the first id after a random id, when statements have been removed
+RANDOM_STATEMENT_ATTEMPTS = 3
+
+# The number of changes to the candidate index that are kept so that copies
+# of the candidates can be updated without loading every candidate again
+CANDIDATE_INDEX_MAX_CHANGES = 1000
+
+# The prefix of the extra data keys that values computed by ChatterBot are saved
+# under, so that they do not replace extra data that was set on a statement
+COMPUTED_EXTRA_DATA_PREFIX = 'chatterbot_'
+
 DEFAULT_DJANGO_APP_NAME = 'django_chatterbot'
@@ -1,9 +1,15 @@
+from datetime import datetime
+from sys import intern
+
+
 class StatementMixin(object):
     """
     This class has shared methods used to
     normalize different statement models.
     """
 
+    __slots__ = ()
+
     def get_tags(self):
         """
         Return the list of tags for this statement.
@@ -18,12 +24,134 @@ class StatementMixin(object):
             self.tags.append(tag)
 
 
+class ResponseList(list):
+    """
+    The list of responses that a statement is in response to. The
+    responses are also held by their text, so that a response can
+    be found without comparing it to each response in the list.
+    """
+
+    __slots__ = ('responses',)
+
+    def __init__(self, responses=()):
+        super(ResponseList, self).__init__(responses)
+        self.responses = {}
+        self._index()
+
+    def __reduce__(self):
+        return (self.__class__, (list(self), ))
+
+    def _index(self):
+        """
+        Hold each response by its text. The first of several
+        responses with the same text is the one that is found.
+        """
+        self.responses.clear()
+
+        for response in reversed(self):
+            self.responses[response.text] = response
+
+    def get(self, text):
+        """
+        Return the response with the given text,
+        or None if it is not in the list.
+        """
+        return self.responses.get(text)
+
+    def __contains__(self, item):
+        text = getattr(item, 'text', item)
+
+        if not item or not isinstance(text, str):
+            return super(ResponseList, self).__contains__(item)
+
+        return text in self.responses
+
+    def append(self, response):
+        super(ResponseList, self).append(response)
+        self.responses.setdefault(response.text, response)
+
+    def extend(self, responses):
+        for response in responses:
+            self.append(response)
+
+    def __iadd__(self, responses):
+        self.extend(responses)
+        return self
+
+    def insert(self, index, response):
+        super(ResponseList, self).insert(index, response)
+        self._index()
+
+    def remove(self, response):
+        has_duplicates = self.has_duplicates()
+        super(ResponseList, self).remove(response)
+        self._remove_text(getattr(response, 'text', response), has_duplicates)
+
+    def pop(self, *args):
+        has_duplicates = self.has_duplicates()
+        response = super(ResponseList, self).pop(*args)
+        self._remove_text(response.text, has_duplicates)
+        return response
+
+    def clear(self):
+        super(ResponseList, self).clear()
+        self.responses.clear()
+
+    def sort(self, *args, **kwargs):
+        super(ResponseList, self).sort(*args, **kwargs)
+        if self.has_duplicates():
+            self._index()
+
+    def reverse(self):
+        super(ResponseList, self).reverse()
+        if self.has_duplicates():
+            self._index()
+
+    def __setitem__(self, index, value):
+        super(ResponseList, self).__setitem__(index, value)
+        self._index()
+
+    def __delitem__(self, index):
+        super(ResponseList, self).__delitem__(index)
+        self._index()
+
+    def has_duplicates(self):
+        """
+        Return True if more than one response in the list has the same text.
+        """
+        return len(self.responses) != len(self)
+
+    def _remove_text(self, text, has_duplicates):
+        """
+        Stop holding the response with the text after it has been removed,
+        unless the list has another response with the same text.
+        """
+        self.responses.pop(text, None)
+
+        if has_duplicates:
+            for response in self:
+                if response.text == text:
+                    self.responses[text] = response
+                    break
+
+
 class Statement(StatementMixin):
     """
     A statement represents a single spoken entity, sentence or
     phrase that someone can say.
     """
 
+    # Slots are used instead of a dictionary of attributes for each statement,
+    # because many statements are held in memory when they are compared
+    __slots__ = (
+        'text',
+        'tags',
+        '_in_response_to',
+        'extra_data',
+        'confidence',
+        'storage',
+    )
+
     def __init__(self, text, **kwargs):
 
         # Try not to allow non-string types to be passed to statements
@@ -32,7 +160,8 @@ class Statement(StatementMixin):
         except UnicodeEncodeError:
             pass
 
-        self.text = text
+        # The same text is often loaded for many statements and responses
+        self.text = intern(text)
         self.tags = kwargs.pop('tags', [])
         self.in_response_to = kwargs.pop('in_response_to', [])
 
@@ -87,6 +216,17 @@ class Statement(StatementMixin):
         """
         self.extra_data[key] = value
 
+    @property
+    def in_response_to(self):
+        return self._in_response_to
+
+    @in_response_to.setter
+    def in_response_to(self, in_response_to):
+        if not isinstance(in_response_to, ResponseList):
+            in_response_to = ResponseList(in_response_to)
+
+        self._in_response_to = in_response_to
+
     def add_response(self, response):
         """
         Add the response to the list of statements that this statement is in response to.
@@ -103,13 +243,11 @@ class Statement(StatementMixin):
                 )
             )
 
-        updated = False
-        for index in range(0, len(self.in_response_to)):
-            if response.text == self.in_response_to[index].text:
-                self.in_response_to[index].occurrence += 1
-                updated = True
+        existing_response = self.in_response_to.get(response.text)
 
-        if not updated:
+        if existing_response is not None:
+            existing_response.occurrence += 1
+        else:
             self.in_response_to.append(response)
 
     def remove_response(self, response_text):
@@ -120,11 +258,13 @@ class Statement(StatementMixin):
         :param response_text: The text of the response to be removed.
         :type response_text: str
         """
-        for response in self.in_response_to:
-            if response_text == response.text:
-                self.in_response_to.remove(response)
-                return True
-        return False
+        response = self.in_response_to.get(response_text)
+
+        if response is None:
+            return False
+
+        self.in_response_to.remove(response)
+        return True
 
     def get_response_count(self, statement):
         """
@@ -137,11 +277,12 @@ class Statement(StatementMixin):
         :returns: Return the number of times the statement has been used as a response.
         :rtype: int
         """
-        for response in self.in_response_to:
-            if statement.text == response.text:
-                return response.occurrence
+        response = self.in_response_to.get(statement.text)
 
-        return 0
+        if response is None:
+            return 0
+
+        return response.occurrence
 
     def serialize(self):
         """
@@ -181,16 +322,37 @@ class Response(object):
     A response represents an entity which response to a statement.
     """
 
+    __slots__ = (
+        'text',
+        'occurrence',
+        '_created_at',
+    )
+
     def __init__(self, text, **kwargs):
-        from datetime import datetime
-        from dateutil import parser as date_parser
+        if isinstance(text, str):
+            text = intern(text)
 
         self.text = text
-        self.created_at = kwargs.get('created_at', datetime.now())
         self.occurrence = kwargs.get('occurrence', 1)
 
-        if not isinstance(self.created_at, datetime):
-            self.created_at = date_parser.parse(self.created_at)
+        # A date that is saved as a string is only parsed when it is used
+        if 'created_at' in kwargs:
+            self._created_at = kwargs['created_at']
+        else:
+            self._created_at = datetime.now()
+
+    @property
+    def created_at(self):
+        if not isinstance(self._created_at, datetime):
+            from dateutil import parser as date_parser
+
+            self._created_at = date_parser.parse(self._created_at)
+
+        return self._created_at
+
+    @created_at.setter
+    def created_at(self, created_at):
+        self._created_at = created_at
 
     def __str__(self):
         return self.text
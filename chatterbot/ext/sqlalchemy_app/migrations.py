@@ -0,0 +1,143 @@
+"""
+Upgrades the tables of databases that were created by
+earlier versions of the SQLAlchemy models.
+"""
+
+# The tables that are rebuilt to add primary keys and integer foreign keys
+REBUILT_TABLE_NAMES = (
+    'response',
+    'tag_association',
+    'conversation_association',
+)
+
+
+def requires_migration(engine):
+    """
+    Return True if the database has the tables of an earlier
+    version of the models that need to be upgraded.
+    """
+    from sqlalchemy import inspect
+
+    inspector = inspect(engine)
+
+    if 'response' not in inspector.get_table_names():
+        return False
+
+    column_names = [column['name'] for column in inspector.get_columns('response')]
+
+    return 'statement_id' not in column_names
+
+
+def get_copy_queries(tables, old_tables):
+    """
+    Return the query that selects the rows of each old table in
+    the columns of the new table, by the name of the table.
+    """
+    from sqlalchemy import and_, select
+
+    statement = tables['statement']
+    response = old_tables['response']
+    tag_association = old_tables['tag_association']
+    conversation_association = old_tables['conversation_association']
+
+    return {
+        # Responses refer to the id of their statement instead of its text.
+        # Their ids are not copied, so that the id sequence of the new table
+        # continues past the copied rows on databases such as PostgreSQL,
+        # but the rows are copied in the order of their ids.
+        'response': (
+            ['text', 'created_at', 'occurrence', 'statement_id'],
+            select([
+                response.c.text,
+                response.c.created_at,
+                response.c.occurrence,
+                statement.c.id
+            ]).select_from(
+                response.join(statement, statement.c.text == response.c.statement_text)
+            ).order_by(response.c.id)
+        ),
+        # Tags can only be added to a statement once
+        'tag_association': (
+            ['tag_id', 'statement_id'],
+            select([
+                tag_association.c.tag_id,
+                tag_association.c.statement_id
+            ]).where(and_(
+                tag_association.c.tag_id.isnot(None),
+                tag_association.c.statement_id.isnot(None)
+            )).distinct()
+        ),
+        # The new ids give the order that statements were added to a
+        # conversation in, which was the order of their statement ids
+        'conversation_association': (
+            ['conversation_id', 'statement_id'],
+            select([
+                conversation_association.c.conversation_id,
+                conversation_association.c.statement_id
+            ]).where(and_(
+                conversation_association.c.conversation_id.isnot(None),
+                conversation_association.c.statement_id.isnot(None)
+            )).order_by(
+                conversation_association.c.conversation_id,
+                conversation_association.c.statement_id
+            )
+        ),
+    }
+
+
+def migrate(engine):
+    """
+    Upgrade the tables of a database that was created by an earlier version
+    of the models. The data in each table that changed is copied to a new
+    table in a single transaction, and indexes are added to the other tables.
+
+    :returns: True if the database was upgraded.
+    :rtype: bool
+    """
+    from sqlalchemy import MetaData, Table, inspect
+    from chatterbot.ext.sqlalchemy_app.models import Base
+
+    if not requires_migration(engine):
+        return False
+
+    with engine.begin() as connection:
+        old_metadata = MetaData()
+        old_tables = dict(
+            (name, Table(name, old_metadata, autoload=True, autoload_with=connection))
+            for name in REBUILT_TABLE_NAMES
+        )
+
+        # The new tables are created under a temporary name, so that the names
+        # of their constraints do not conflict with those of the old tables
+        new_metadata = MetaData()
+        tables = {}
+
+        for name, table in Base.metadata.tables.items():
+            if name in REBUILT_TABLE_NAMES:
+                tables[name] = table.tometadata(new_metadata, name=name + '_migrated')
+            else:
+                tables[name] = table.tometadata(new_metadata)
+
+        for name, (column_names, query) in get_copy_queries(tables, old_tables).items():
+            tables[name].create(connection)
+            connection.execute(tables[name].insert().from_select(column_names, query))
+
+        for name in REBUILT_TABLE_NAMES:
+            old_tables[name].drop(connection)
+            connection.execute('ALTER TABLE {0}_migrated RENAME TO {0}'.format(name))
+
+        # Add the indexes of the tables that were not rebuilt
+        inspector = inspect(connection)
+        table_names = inspector.get_table_names()
+
+        for name, table in Base.metadata.tables.items():
+            if name not in table_names:
+                table.create(connection)
+            elif name not in REBUILT_TABLE_NAMES:
+                index_names = set(index['name'] for index in inspector.get_indexes(name))
+
+                for index in table.indexes:
+                    if index.name not in index_names:
+                        index.create(connection)
+
+    return True
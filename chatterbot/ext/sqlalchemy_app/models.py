@@ -1,6 +1,10 @@
-from sqlalchemy import Table, Column, Integer, String, DateTime, ForeignKey, PickleType
+import json
+import pickle
+
+from sqlalchemy import Table, Column, Integer, String, DateTime, ForeignKey, Index, LargeBinary
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declared_attr, declarative_base
 
 from chatterbot.conversation import StatementMixin
@@ -29,11 +33,93 @@ class ModelBase(object):
 Base = declarative_base(cls=ModelBase)
 
 
+class LegacyExtraDataUnpickler(pickle.Unpickler):
+    """
+    Loads extra data that was pickled by earlier versions of the models.
+    Only built-in values such as dictionaries, lists, strings and numbers
+    are loaded, so that a pickle cannot import and call other objects.
+    """
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(
+            'The pickled extra data refers to {}.{}, but only built-in '
+            'values can be loaded from extra data saved by earlier '
+            'versions.'.format(module, name)
+        )
+
+
+class ExtraData(TypeDecorator):
+    """
+    A column that holds the extra data dictionary of a statement.
+
+    Dictionaries are saved as compact JSON by default, or in the MessagePack
+    format if the ``extra_data_format`` attribute of the dialect of the engine
+    that they are saved with is set to ``msgpack``. Empty dictionaries are
+    saved as NULL and are loaded without being decoded. The format of each
+    saved value is detected when it is loaded, so values saved in either
+    format can always be loaded.
+
+    Values that were pickled by earlier versions are recognized by the
+    header of the pickle protocol that they used, and only built-in values
+    are loaded from them. Any other value raises a ValueError.
+    """
+
+    impl = LargeBinary
+
+    def process_bind_param(self, value, dialect):
+        if not value:
+            return None
+
+        extra_data_format = getattr(dialect, 'extra_data_format', 'json')
+
+        try:
+            if extra_data_format == 'msgpack':
+                import msgpack
+
+                return msgpack.packb(value, use_bin_type=True)
+
+            return json.dumps(value, separators=(',', ':')).encode('utf-8')
+        except TypeError as error:
+            raise TypeError(
+                'The extra data of a statement can only hold values that can be '
+                'saved as {}, such as strings, numbers, lists and dictionaries: '
+                '{}'.format(extra_data_format, error)
+            )
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return {}
+
+        value = bytes(value)
+
+        # A JSON object
+        if value[:1] == b'{':
+            return json.loads(value.decode('utf-8'))
+
+        # A MessagePack map, pickles start with 0x80 followed by the protocol
+        if value[:1] in (b'\xde', b'\xdf') or b'\x81' <= value[:1] <= b'\x8f':
+            import msgpack
+
+            return msgpack.unpackb(value, raw=False)
+
+        # Extra data saved by earlier versions is pickled with protocol 2 or later
+        if value[:1] == b'\x80' and b'\x02' <= value[1:2] <= bytes([pickle.HIGHEST_PROTOCOL]):
+            from io import BytesIO
+
+            return LegacyExtraDataUnpickler(BytesIO(value)).load() or {}
+
+        raise ValueError(
+            'The extra data of a statement is not saved as JSON, MessagePack '
+            'or a pickle from an earlier version: {!r}'.format(value[:20])
+        )
+
+
 tag_association_table = Table(
     'tag_association',
     Base.metadata,
-    Column('tag_id', Integer, ForeignKey('tag.id')),
-    Column('statement_id', Integer, ForeignKey('statement.id'))
+    Column('tag_id', Integer, ForeignKey('tag.id'), primary_key=True),
+    Column('statement_id', Integer, ForeignKey('statement.id'), primary_key=True),
+    Index('ix_tag_association_statement_id', 'statement_id')
 )
 
 
@@ -42,11 +128,25 @@ class Tag(Base):
     A tag that describes a statement.
     """
 
+    __table_args__ = (
+        Index('ix_tag_name', 'name'),
+    )
+
     name = Column(
         String(constants.TAG_NAME_MAX_LENGTH)
     )
 
 
+extra_data_index_table = Table(
+    'extra_data_index',
+    Base.metadata,
+    Column('statement_id', Integer, ForeignKey('statement.id'), primary_key=True),
+    Column('key', String(constants.EXTRA_DATA_KEY_MAX_LENGTH), primary_key=True),
+    Column('value', String(constants.STATEMENT_TEXT_MAX_LENGTH)),
+    Index('ix_extra_data_index_key_value', 'key', 'value')
+)
+
+
 class Statement(Base, StatementMixin):
     """
     A Statement represents a sentence or phrase.
@@ -63,7 +163,7 @@ class Statement(Base, StatementMixin):
         backref='statements'
     )
 
-    extra_data = Column(PickleType)
+    extra_data = Column(ExtraData)
 
     in_response_to = relationship(
         'Response',
@@ -83,7 +183,7 @@ class Statement(Base, StatementMixin):
         statement = StatementObject(
             self.text,
             tags=[tag.name for tag in self.tags],
-            extra_data=self.extra_data
+            extra_data=self.extra_data or {}
         )
         for response in self.in_response_to:
             statement.add_response(
@@ -97,6 +197,12 @@ class Response(Base):
     Response, contains responses related to a given statement.
     """
 
+    __table_args__ = (
+        # Responses are looked up by the statement they belong to and their text
+        Index('ix_response_statement_id_text', 'statement_id', 'text'),
+        Index('ix_response_text', 'text'),
+    )
+
     text = Column(
         String(constants.STATEMENT_TEXT_MAX_LENGTH)
     )
@@ -108,9 +214,9 @@ class Response(Base):
 
     occurrence = Column(Integer, default=1)
 
-    statement_text = Column(
-        String(constants.STATEMENT_TEXT_MAX_LENGTH),
-        ForeignKey('statement.text')
+    statement_id = Column(
+        Integer,
+        ForeignKey('statement.id')
     )
 
     statement_table = relationship(
@@ -124,8 +230,12 @@ class Response(Base):
 conversation_association_table = Table(
     'conversation_association',
     Base.metadata,
+    # The order that statements were added to a conversation in
+    Column('id', Integer, primary_key=True, autoincrement=True),
     Column('conversation_id', Integer, ForeignKey('conversation.id')),
-    Column('statement_id', Integer, ForeignKey('statement.id'))
+    Column('statement_id', Integer, ForeignKey('statement.id')),
+    Index('ix_conversation_association_conversation_id', 'conversation_id'),
+    Index('ix_conversation_association_statement_id', 'statement_id')
 )
 
 
@@ -1,3 +1,6 @@
+from bisect import bisect_left
+from chatterbot import utils
+from chatterbot.conversation import Statement
 from .logic_adapter import LogicAdapter
 
 
@@ -5,14 +8,77 @@ class BestMatch(LogicAdapter):
     """
     A logic adapter that returns a response based on known responses to
     the closest matches to the input statement.
+
+    :kwargs:
+        * *candidate_search* (``str``) or (``Search``) --
+          The import path of a search method that selects a short list of
+          candidate statements for the comparison function to score.
+          By default every known statement is compared.
+        * *prune_comparisons* (``bool``) --
+          Skip comparing statements whose length alone limits their similarity
+          to less than the closest match found so far, and stop once a perfect
+          match is found. This requires a comparison function that provides a
+          ``length_upper_bound`` method, such as ``levenshtein_distance``.
+          The selected statement is the same as when every statement is compared.
+          Defaults to False.
+        * *parallel_workers* (``int``) --
+          The number of worker processes to compare statements in. Each worker
+          holds a share of the known statements, so that only the input statement
+          is sent to the workers for each response. This is used instead of
+          pruning, and only when no candidate search is set. The comparison
+          function must be importable by the worker processes.
+          By default statements are compared in the current process.
+        * *parallel_minimum_statements* (``int``) --
+          The number of known statements below which the statements are
+          compared in the current process, even when worker processes are
+          configured. Defaults to 1000.
     """
 
+    def __init__(self, **kwargs):
+        super(BestMatch, self).__init__(**kwargs)
+
+        candidate_search = kwargs.get('candidate_search')
+
+        if isinstance(candidate_search, str):
+            candidate_search = utils.initialize_class(candidate_search, **kwargs)
+
+        self.candidate_search = candidate_search
+
+        self.prune_comparisons = kwargs.get('prune_comparisons', False)
+
+        self.parallel_workers = kwargs.get('parallel_workers')
+        self.parallel_minimum_statements = kwargs.get('parallel_minimum_statements', 1000)
+        self.comparison_pool = None
+
+        # The number of comparisons that were skipped by the last pruned match
+        self.comparisons_skipped = 0
+
+        self._length_order_list = None
+        self._length_order = ([], [])
+
+    def set_chatbot(self, chatbot):
+        """
+        Set the chat bot and register the features of known statements that
+        the comparison function can compute once, when they are stored.
+        """
+        super(BestMatch, self).set_chatbot(chatbot)
+
+        get_feature_functions = getattr(self.compare_statements, 'get_feature_functions', None)
+
+        if get_feature_functions is not None:
+            chatbot.storage.add_candidate_features(get_feature_functions())
+
+        get_extra_data_functions = getattr(self.compare_statements, 'get_extra_data_functions', None)
+
+        if get_extra_data_functions is not None:
+            chatbot.storage.add_extra_data_functions(get_extra_data_functions())
+
     def get(self, input_statement):
         """
         Takes a statement string and a list of statement strings.
         Returns the closest matching statement from the list.
         """
-        statement_list = self.chatbot.storage.get_response_statements()
+        statement_list = self.chatbot.storage.get_response_candidates()
 
         if not statement_list:
             if self.chatbot.storage.count():
@@ -27,16 +93,197 @@ class BestMatch(LogicAdapter):
             else:
                 raise self.EmptyDatasetException()
 
+        if self.candidate_search:
+            statement_list = self.candidate_search.search(input_statement, statement_list)
+
+        if self.use_comparison_pool(statement_list):
+            closest_match, confidence = self.get_closest_match_parallel(input_statement, statement_list)
+        elif self.prune_comparisons and hasattr(self.compare_statements, 'length_upper_bound'):
+            closest_match, confidence = self.get_closest_match_pruned(input_statement, statement_list)
+        else:
+            closest_match, confidence = self.get_closest_match(input_statement, statement_list)
+
+        return self.get_full_statement(closest_match, confidence)
+
+    def get_closest_match(self, input_statement, statement_list):
+        """
+        Compare the input statement to every statement in the list
+        and return the closest match, along with its confidence.
+
+        The confidence is not set on the statements in the list, because
+        the candidates in the storage adapter's index are shared between
+        requests.
+        """
         closest_match = input_statement
-        closest_match.confidence = 0
+        closest_confidence = 0
+
+        confidences = self.compare_statement_list(input_statement, statement_list)
 
         # Find the closest matching known statement
-        for statement in statement_list:
-            confidence = self.compare_statements(input_statement, statement)
+        for statement, confidence in zip(statement_list, confidences):
+            if confidence > closest_confidence:
+                closest_match = statement
+                closest_confidence = confidence
+
+        return closest_match, closest_confidence
+
+    def close(self):
+        """
+        Stop the worker processes of the comparison pool.
+        """
+        if self.comparison_pool is not None:
+            self.comparison_pool.shutdown()
+            self.comparison_pool = None
+
+    def use_comparison_pool(self, statement_list):
+        """
+        Return True if the statement list should be compared
+        to the input statement in worker processes.
+        """
+        if not self.parallel_workers or self.parallel_workers < 2:
+            return False
+
+        if self.candidate_search:
+            return False
+
+        return len(statement_list) >= self.parallel_minimum_statements
+
+    def get_closest_match_parallel(self, input_statement, statement_list):
+        """
+        Return the same closest match and confidence as get_closest_match,
+        comparing shards of the statement list in separate worker processes.
+        """
+        from chatterbot.parallel import ShardedComparisonPool
+
+        if self.comparison_pool is None:
+            self.comparison_pool = ShardedComparisonPool(
+                self.compare_statements, self.parallel_workers
+            )
 
-            if confidence > closest_match.confidence:
-                statement.confidence = confidence
+        # Only the changes to the candidate index need to be sent to
+        # the worker processes when the candidates come from the index
+        candidate_index = self.chatbot.storage.candidate_index
+
+        if candidate_index is not None and statement_list is not candidate_index.get_candidates():
+            candidate_index = None
+
+        closest_match, confidence = self.comparison_pool.get_closest_match(
+            input_statement, statement_list, candidate_index
+        )
+
+        if closest_match is None:
+            return input_statement, 0
+
+        return closest_match, confidence
+
+    def get_length_order(self, statement_list):
+        """
+        Return the length of the lowercase text of each statement in the list,
+        sorted from shortest to longest, along with the position of each
+        of these statements in the list.
+        """
+        if statement_list is not self._length_order_list:
+            lengths = [len(str(statement.text).lower()) for statement in statement_list]
+            order = sorted(range(len(statement_list)), key=lambda position: lengths[position])
+
+            self._length_order = ([lengths[position] for position in order], order)
+            self._length_order_list = statement_list
+
+        return self._length_order
+
+    def get_closest_match_pruned(self, input_statement, statement_list):
+        """
+        Return the same closest match and confidence as get_closest_match,
+        comparing the statements with the highest possible similarity first
+        and skipping statements that cannot be a closer match.
+        """
+        length_upper_bound = self.compare_statements.length_upper_bound
+        input_length = len(str(input_statement.text).lower())
+        lengths, order = self.get_length_order(statement_list)
+
+        # Visit statements outwards from the length of the input statement
+        # because the upper bound on the similarity decreases in both directions
+        shorter = bisect_left(lengths, input_length) - 1
+        longer = shorter + 1
+
+        closest_match = input_statement
+        closest_confidence = 0
+        closest_position = None
+        comparisons = 0
+
+        while shorter >= 0 or longer < len(order):
+            shorter_bound = length_upper_bound(input_length, lengths[shorter]) if shorter >= 0 else -1
+            longer_bound = length_upper_bound(input_length, lengths[longer]) if longer < len(order) else -1
+
+            if longer_bound >= shorter_bound:
+                position = order[longer]
+                upper_bound = longer_bound
+                longer += 1
+            else:
+                position = order[shorter]
+                upper_bound = shorter_bound
+                shorter -= 1
+
+            # None of the remaining statements can be a closer match
+            if upper_bound < closest_confidence:
+                break
+
+            # An equally close match only replaces one that appears later in the list
+            if upper_bound == closest_confidence:
+                if closest_position is None or position > closest_position:
+                    continue
+
+            statement = statement_list[position]
+            confidence = self.compare_statement_list(input_statement, [statement])[0]
+            comparisons += 1
+
+            if confidence > closest_confidence or (
+                confidence == closest_confidence and closest_position is not None and position < closest_position
+            ):
                 closest_match = statement
+                closest_confidence = confidence
+                closest_position = position
+
+        self.comparisons_skipped = len(statement_list) - comparisons
+
+        self.logger.info('Skipped {} of {} statement comparisons.'.format(
+            self.comparisons_skipped, len(statement_list)
+        ))
+
+        return closest_match, closest_confidence
+
+    def compare_statement_list(self, input_statement, statement_list):
+        """
+        Return the confidence of the input statement matching each
+        statement in the list. A comparison function that can score
+        the whole list at once is used to do so when possible.
+        """
+        compare_many = getattr(self.compare_statements, 'compare_many', None)
+
+        if compare_many is not None:
+            return compare_many(input_statement, statement_list)
+
+        return [
+            self.compare_statements(input_statement, statement) for statement in statement_list
+        ]
+
+    def get_full_statement(self, closest_match, confidence):
+        """
+        Return the full statement object for the closest match, with the
+        confidence of the match set on it. A match that was selected from
+        the storage adapter's candidate index is loaded from the database.
+        """
+        from chatterbot.storage.candidate_index import Candidate
+
+        if isinstance(closest_match, Candidate):
+            statement = self.chatbot.storage.find(closest_match.text)
+
+            if statement is None:
+                statement = Statement(closest_match.text)
+
+            closest_match = statement
+
+        closest_match.confidence = confidence
 
         return closest_match
 
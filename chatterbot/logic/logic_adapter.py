@@ -12,6 +12,11 @@ class LogicAdapter(Adapter):
 
     :param response_selection_method: The a response selection method.
                                       Defaults to ``get_first_response``.
+
+    :param process_timeout: The number of seconds that the chat bot waits for a
+                            response from this logic adapter before its response
+                            is left out. Defaults to the ``logic_adapter_timeout``
+                            parameter of the chat bot, which defaults to no limit.
     """
 
     def __init__(self, **kwargs):
@@ -42,6 +47,8 @@ class LogicAdapter(Adapter):
             get_first_response
         )
 
+        self.process_timeout = kwargs.get('process_timeout')
+
     def get_initialization_functions(self):
         """
         Return a dictionary of functions to be run once when the chat bot is instantiated.
@@ -52,6 +59,28 @@ class LogicAdapter(Adapter):
         for function in self.get_initialization_functions().values():
             function()
 
+    def prepare(self):
+        """
+        Load the models used by the statement comparison function once,
+        so that they are held for the life of the chat bot.
+
+        :returns: The number of seconds that each preparation method took.
+        :rtype: dict
+        """
+        prepare = getattr(self.compare_statements, 'prepare', None)
+
+        if prepare is None:
+            return {}
+
+        return prepare()
+
+    def close(self):
+        """
+        Release any threads or processes that the logic adapter has started.
+        This method may be overridden by a child class that starts them.
+        """
+        pass
+
     def can_process(self, statement):
         """
         A preliminary check that is called to determine if a
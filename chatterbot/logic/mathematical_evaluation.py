@@ -30,8 +30,13 @@ class MathematicalEvaluation(LogicAdapter):
         adapter to respond to the user input.
         """
         response = self.process(statement)
-        self.cache[statement.text] = response
-        return response.confidence == 1
+
+        # Only a response that will be processed is kept
+        if response.confidence == 1:
+            self.cache[statement.text] = response
+            return True
+
+        return False
 
     def process(self, statement):
         """
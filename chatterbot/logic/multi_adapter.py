@@ -9,6 +9,34 @@ class MultiLogicAdapter(LogicAdapter):
     adapters. It has methods that allow ChatterBot to add an
     adapter, set the chat bot, and process an input statement
     to get a response.
+
+    :param logic_confidence_threshold: Stop processing the input statement once
+                                       a logic adapter returns a response with at
+                                       least this confidence. The logic adapters
+                                       are checked in the order they were added,
+                                       even when they are run in threads, so the
+                                       same response is selected either way.
+                                       By default every logic adapter processes
+                                       the statement.
+    :type logic_confidence_threshold: float
+
+    :param logic_workers: The number of threads that logic adapters are run in at
+                          the same time. By default each logic adapter is run in
+                          turn. The logic adapters and the storage adapter must be
+                          thread safe to use this. The threads are kept until
+                          ``close`` is called.
+    :type logic_workers: int
+
+    :param logic_adapter_timeout: The number of seconds to wait for the response of
+                                  each logic adapter that does not have its own
+                                  process_timeout. By default there is no limit.
+                                  Logic adapters are run in threads when a timeout
+                                  is set, unless logic_workers is 1, in which case
+                                  they are run in turn and the timeout is not used.
+                                  A logic adapter that runs out of time is not
+                                  stopped. Its response is left out, but its thread
+                                  is busy until the adapter returns.
+    :type logic_adapter_timeout: float
     """
 
     def __init__(self, **kwargs):
@@ -20,6 +48,14 @@ class MultiLogicAdapter(LogicAdapter):
         # Required logic adapters that must always be present
         self.system_adapters = []
 
+        self.confidence_threshold = kwargs.get('logic_confidence_threshold')
+        self.workers = kwargs.get('logic_workers', 0)
+        self.adapter_timeout = kwargs.get('logic_adapter_timeout')
+
+        # The threads that logic adapters are run in, which are started
+        # the first time that they are needed and stopped by close
+        self.executor = None
+
     def get_initialization_functions(self):
         """
         Get the initialization functions for each logic adapter.
@@ -33,6 +69,34 @@ class MultiLogicAdapter(LogicAdapter):
 
         return functions_dict
 
+    def prepare(self):
+        """
+        Prepare the statement comparison function of each logic adapter.
+
+        :returns: The number of seconds that each preparation method took.
+        :rtype: dict
+        """
+        durations = {}
+
+        for logic_adapter in self.get_adapters():
+            durations.update(logic_adapter.prepare())
+
+        return durations
+
+    def close(self):
+        """
+        Stop the threads that logic adapters are run in, and release the
+        resources of each logic adapter. Logic adapters that are still running
+        after running out of time are not interrupted, so this does not wait
+        for their threads to finish.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+        for adapter in self.get_adapters():
+            adapter.close()
+
     def process(self, statement):
         """
         Returns the output of a selection of logic adapters
@@ -40,29 +104,40 @@ class MultiLogicAdapter(LogicAdapter):
 
         :param statement: The input statement to be processed.
         """
-        results = []
-        result = None
-        max_confidence = -1
+        outputs = []
 
-        for adapter in self.get_adapters():
-            if adapter.can_process(statement):
+        adapter_outputs = self.get_adapter_outputs(statement)
 
-                output = adapter.process(statement)
-                results.append((output.confidence, output, ))
+        try:
+            for index, output in adapter_outputs:
+                outputs.append((index, output, ))
 
-                self.logger.info(
-                    '{} selected "{}" as a response with a confidence of {}'.format(
-                        adapter.class_name, output.text, output.confidence
+                if self.confidence_threshold is not None and output.confidence >= self.confidence_threshold:
+                    self.logger.info(
+                        'Not processing the statement using the remaining adapters, '
+                        'because a response with a confidence of {} was selected'.format(
+                            output.confidence
+                        )
                     )
-                )
+                    break
+        finally:
+            adapter_outputs.close()
 
-                if output.confidence > max_confidence:
-                    result = output
-                    max_confidence = output.confidence
-            else:
-                self.logger.info(
-                    'Not processing the statement using {}'.format(adapter.class_name)
-                )
+        if not outputs:
+            raise self.EmptyDatasetException(
+                'None of the logic adapters returned a response to the statement.'
+            )
+
+        results = []
+        result = None
+        max_confidence = -1
+
+        for _, output in outputs:
+            results.append((output.confidence, output, ))
+
+            if output.confidence > max_confidence:
+                result = output
+                max_confidence = output.confidence
 
         # If multiple adapters agree on the same statement,
         # then that statement is more likely to be the correct response
@@ -77,6 +152,131 @@ class MultiLogicAdapter(LogicAdapter):
         result.confidence = max_confidence
         return result
 
+    def process_adapter(self, adapter, statement):
+        """
+        Return the response of a logic adapter to the input statement,
+        or None if the logic adapter cannot process the statement.
+        """
+        if not adapter.can_process(statement):
+            self.logger.info(
+                'Not processing the statement using {}'.format(adapter.class_name)
+            )
+            return None
+
+        output = adapter.process(statement)
+
+        self.logger.info(
+            '{} selected "{}" as a response with a confidence of {}'.format(
+                adapter.class_name, output.text, output.confidence
+            )
+        )
+
+        return output
+
+    def get_timeout(self, adapter):
+        """
+        Return the number of seconds to wait for the response
+        of a logic adapter, or None if there is no limit.
+        """
+        timeout = getattr(adapter, 'process_timeout', None)
+
+        if timeout is None:
+            return self.adapter_timeout
+
+        return timeout
+
+    def get_adapter_outputs(self, statement):
+        """
+        Yield the position of each logic adapter that processes the input
+        statement along with its response, in the order of the logic adapters.
+        When the logic adapters are run in threads, a response is yielded once
+        every earlier logic adapter has returned or run out of time, and the
+        responses of logic adapters that run out of time are left out. A logic
+        adapter that runs out of time cannot be cancelled once it has started,
+        so it keeps running in its thread.
+        """
+        adapters = self.get_adapters()
+        timeouts = [self.get_timeout(adapter) for adapter in adapters]
+
+        run_in_turn = self.workers == 1 or (
+            not self.workers and all(timeout is None for timeout in timeouts)
+        )
+
+        if run_in_turn:
+            for index, adapter in enumerate(adapters):
+                output = self.process_adapter(adapter, statement)
+
+                if output is not None:
+                    yield index, output
+            return
+
+        from concurrent.futures import FIRST_COMPLETED, wait
+        from time import time
+
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self.executor = ThreadPoolExecutor(max_workers=self.workers or len(adapters))
+
+        start_time = time()
+
+        futures = dict(
+            (self.executor.submit(self.process_adapter, adapter, statement), index)
+            for index, adapter in enumerate(adapters)
+        )
+
+        pending = set(futures)
+
+        # The response of each logic adapter that has finished, or None if it
+        # did not return one, until the responses before it have been yielded
+        finished = {}
+        next_index = 0
+
+        try:
+            while pending:
+                deadlines = [
+                    start_time + timeouts[futures[future]] for future in pending
+                    if timeouts[futures[future]] is not None
+                ]
+
+                if deadlines:
+                    wait_timeout = max(0, min(deadlines) - time())
+                else:
+                    wait_timeout = None
+
+                done, pending = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    finished[futures[future]] = future.result()
+
+                current_time = time()
+
+                for future in list(pending):
+                    timeout = timeouts[futures[future]]
+
+                    if timeout is not None and current_time >= start_time + timeout:
+                        pending.remove(future)
+                        future.cancel()
+                        finished[futures[future]] = None
+
+                        self.logger.warning(
+                            '{} did not return a response within {} seconds'.format(
+                                adapters[futures[future]].class_name, timeout
+                            )
+                        )
+
+                while next_index in finished:
+                    output = finished.pop(next_index)
+
+                    if output is not None:
+                        yield next_index, output
+
+                    next_index += 1
+        finally:
+            # Adapters that have not started are not run once a response is selected
+            for future in pending:
+                future.cancel()
+
     def get_greatest_confidence(self, statement, options):
         """
         Returns the greatest confidence value for a statement that occurs
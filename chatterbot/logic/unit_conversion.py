@@ -137,8 +137,13 @@ class UnitConversion(LogicAdapter):
 
     def can_process(self, statement):
         response = self.process(statement)
-        self.cache[statement.text] = response
-        return response.confidence == 1.0
+
+        # Only a response that will be processed is kept
+        if response.confidence == 1.0:
+            self.cache[statement.text] = response
+            return True
+
+        return False
 
     def process(self, statement):
         response = Statement(text='')
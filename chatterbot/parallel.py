@@ -0,0 +1,280 @@
+"""
+Parallel scoring of candidate statements across a pool of worker processes.
+
+The candidate statements are split into contiguous shards and each shard is
+held by its own worker process. Once the shards are loaded, only the text of
+the input statement is sent to the workers for each comparison, along with
+any statements that have been added to or removed from the candidates since.
+"""
+
+# The shard of candidate statements held by a worker process
+_shard = {
+    'candidates': {},
+    'compare_statements': None
+}
+
+
+def load_shard(compare_statements, entries):
+    """
+    Hold a shard of the candidate statements in the current worker process.
+
+    :param compare_statements: The statement comparison function.
+
+    :param entries: The position of each statement of the shard in the order
+                    of the candidate statements, along with its text.
+    :type entries: list
+    """
+    from chatterbot.storage.candidate_index import Candidate
+
+    if _shard['compare_statements'] is None:
+        prepare = getattr(compare_statements, 'prepare', None)
+
+        if prepare is not None:
+            prepare()
+
+    _shard['candidates'] = {
+        position: Candidate(text) for position, text in entries
+    }
+    _shard['compare_statements'] = compare_statements
+
+
+def update_shard(changes):
+    """
+    Add statements to or remove statements from the shard
+    held by the current worker process.
+
+    :param changes: Tuples of the operation, the position of the statement
+                    in the order of the candidate statements and its text.
+    :type changes: list
+    """
+    from chatterbot.storage.candidate_index import Candidate
+
+    candidates = _shard['candidates']
+
+    for operation, position, text in changes:
+        if operation == 'add':
+            candidates[position] = Candidate(text)
+        else:
+            candidates.pop(position, None)
+
+
+def get_shard_closest_match(text):
+    """
+    Compare the input text to each statement in the shard held by the
+    current worker process.
+
+    :returns: The position of the closest match in the order of the
+              candidate statements, its text and its confidence. The position
+              is None if no statement in the shard has a confidence above zero.
+    :rtype: tuple
+    """
+    from chatterbot.conversation import Statement
+
+    statement = Statement(text)
+    positions = list(_shard['candidates'].keys())
+    candidates = list(_shard['candidates'].values())
+    compare_statements = _shard['compare_statements']
+
+    compare_many = getattr(compare_statements, 'compare_many', None)
+
+    if compare_many is not None:
+        confidences = compare_many(statement, candidates)
+    else:
+        confidences = [
+            compare_statements(statement, candidate) for candidate in candidates
+        ]
+
+    closest = (None, None, 0)
+
+    for position, candidate, confidence in zip(positions, candidates, confidences):
+        if is_closer_match(position, confidence, closest):
+            closest = (position, candidate.text, confidence)
+
+    return closest
+
+
+def is_closer_match(position, confidence, closest):
+    """
+    Return True if the statement at the given position is a closer match
+    than the closest match so far. Of several equally close matches, the
+    first in the order of the candidate statements is the closest.
+    """
+    closest_position, _, closest_confidence = closest
+
+    if confidence > closest_confidence:
+        return True
+
+    return confidence == closest_confidence and confidence > 0 and position < closest_position
+
+
+class ShardedComparisonPool(object):
+    """
+    A pool of worker processes that each hold one shard of the
+    candidate statements and compare input statements to it.
+
+    When the candidates come from a candidate index, only the statements
+    that were added or removed since the shards were loaded are sent to the
+    workers. The shards are loaded again if the index has changed more than
+    it keeps a record of.
+
+    :param compare_statements: The statement comparison function.
+                               It must be possible to pickle this function.
+
+    :param workers: The number of worker processes to start.
+    :type workers: int
+    """
+
+    def __init__(self, compare_statements, workers):
+        self.compare_statements = compare_statements
+        self.workers = workers
+
+        # One single process executor for each shard, so that each
+        # worker process keeps its shard for the life of the pool
+        self.executors = []
+
+        self.statement_list = None
+        self.candidate_index = None
+        self.version = None
+
+        # The shard that the next added statement is sent to
+        self.next_shard = 0
+
+    def start(self):
+        """
+        Start the worker processes.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        if not self.executors:
+            self.executors = [
+                ProcessPoolExecutor(max_workers=1) for _ in range(self.workers)
+            ]
+
+    def shutdown(self):
+        """
+        Stop the worker processes.
+        """
+        for executor in self.executors:
+            executor.shutdown()
+
+        self.executors = []
+        self.statement_list = None
+        self.candidate_index = None
+        self.version = None
+
+    def load(self, statement_list, candidate_index=None):
+        """
+        Bring the shards held by the worker processes up to date with the
+        statement list. If the statement list is the list of candidates of
+        the candidate index, only the changes to the index since the shards
+        were loaded are sent to the workers.
+        """
+        if candidate_index is not None and candidate_index is self.candidate_index:
+            changes = candidate_index.get_changes(self.version)
+
+            if changes is not None:
+                if changes:
+                    self.update_shards(changes)
+
+                self.statement_list = statement_list
+                self.version = candidate_index.version
+                return
+
+        elif candidate_index is None and statement_list is self.statement_list:
+            return
+
+        if candidate_index is not None:
+            entries = [
+                (candidate_index.order[statement.text], statement.text)
+                for statement in statement_list
+            ]
+        else:
+            entries = [
+                (position, statement.text)
+                for position, statement in enumerate(statement_list)
+            ]
+
+        self.load_shards(entries)
+
+        self.statement_list = statement_list
+        self.candidate_index = candidate_index
+        self.version = candidate_index.version if candidate_index is not None else None
+
+    def load_shards(self, entries):
+        """
+        Send a contiguous shard of the entries to each worker process.
+        """
+        self.start()
+
+        shard_size = -(-len(entries) // len(self.executors))
+
+        futures = [
+            executor.submit(
+                load_shard,
+                self.compare_statements,
+                entries[index * shard_size:(index + 1) * shard_size]
+            )
+            for index, executor in enumerate(self.executors)
+        ]
+
+        for future in futures:
+            future.result()
+
+    def update_shards(self, changes):
+        """
+        Send each added statement to one of the worker processes in turn,
+        and each removed statement to every worker process.
+        """
+        updates = [[] for _ in self.executors]
+
+        for operation, position, text in changes:
+            if operation == 'add':
+                updates[self.next_shard].append((operation, position, text))
+                self.next_shard = (self.next_shard + 1) % len(self.executors)
+            else:
+                for shard_changes in updates:
+                    shard_changes.append((operation, position, text))
+
+        futures = [
+            executor.submit(update_shard, shard_changes)
+            for executor, shard_changes in zip(self.executors, updates)
+            if shard_changes
+        ]
+
+        for future in futures:
+            future.result()
+
+    def get_closest_match(self, input_statement, statement_list, candidate_index=None):
+        """
+        Return the closest match to the input statement in the statement
+        list, along with its confidence. This is the same statement that is
+        selected by comparing each statement in turn. The match is None if
+        no statement has a confidence above zero.
+
+        :param candidate_index: The candidate index that the statement
+                                list was returned from, if any.
+        """
+        self.load(statement_list, candidate_index)
+
+        futures = [
+            executor.submit(get_shard_closest_match, input_statement.text)
+            for executor in self.executors
+        ]
+
+        closest = (None, None, 0)
+
+        for future in futures:
+            position, text, confidence = future.result()
+
+            if position is not None and is_closer_match(position, confidence, closest):
+                closest = (position, text, confidence)
+
+        closest_position, closest_text, closest_confidence = closest
+
+        if closest_position is None:
+            return None, 0
+
+        if candidate_index is not None:
+            return candidate_index.entries[closest_text], closest_confidence
+
+        return statement_list[closest_position], closest_confidence
@@ -0,0 +1,207 @@
+"""
+Search methods narrow down the list of statements that a logic adapter
+compares an input statement to, so that the statement comparison function
+only has to score a short list of likely matches.
+"""
+import heapq
+
+
+class Search(object):
+    """
+    A search method that returns every candidate statement.
+    This results in an exhaustive scan by the logic adapter.
+    """
+
+    def __init__(self, **kwargs):
+        pass
+
+    def search(self, statement, candidates):
+        """
+        Return the candidate statements that should be compared
+        to the input statement.
+
+        :param statement: The input statement.
+        :type statement: Statement
+
+        :param candidates: The statements that can be matched to the input statement.
+        :type candidates: list
+
+        :rtype: list
+        """
+        return candidates
+
+
+class InvertedIndexSearch(Search):
+    """
+    A base class for search methods that keep an inverted index of the
+    terms in the text of each candidate statement.
+    Child classes must implement the get_terms method.
+    """
+
+    # The name of the candidate feature that holds the terms of its text
+    feature_name = None
+
+    def __init__(self, **kwargs):
+        super(InvertedIndexSearch, self).__init__(**kwargs)
+
+        # The terms in the text of each indexed candidate
+        self.terms = {}
+
+        # The text of each candidate that contains a given term
+        self.postings = {}
+
+        # The position of each indexed candidate in the candidate list
+        self.positions = {}
+
+        self.candidates = None
+
+    def get_terms(self, text):
+        """
+        Return the set of terms in the text.
+        """
+        raise NotImplementedError()
+
+    def update_index(self, candidates):
+        """
+        Add new candidates to the inverted index and remove the
+        candidates that are no longer in the candidate list.
+        """
+        if candidates is self.candidates:
+            return
+
+        positions = {}
+        for position, candidate in enumerate(candidates):
+            positions[candidate.text] = position
+
+        for text in set(self.terms) - set(positions):
+            for term in self.terms.pop(text):
+                self.postings[term].discard(text)
+
+        for candidate in candidates:
+            if candidate.text not in self.terms:
+                if hasattr(candidate, 'get_feature'):
+                    terms = candidate.get_feature(self.feature_name, self.get_terms)
+                else:
+                    terms = self.get_terms(candidate.text)
+
+                self.terms[candidate.text] = terms
+
+                for term in terms:
+                    self.postings.setdefault(term, set()).add(candidate.text)
+
+        self.positions = positions
+        self.candidates = candidates
+
+    def get_shared_term_counts(self, terms):
+        """
+        Return the number of terms that each indexed
+        candidate shares with the given terms.
+        """
+        shared_counts = {}
+
+        for term in terms:
+            for text in self.postings.get(term, ()):
+                shared_counts[text] = shared_counts.get(text, 0) + 1
+
+        return shared_counts
+
+    def get_candidates(self, candidates, texts):
+        """
+        Return the candidates with the given texts, in the
+        order that they appear in the candidate list.
+        """
+        return [
+            candidates[position] for position in sorted(self.positions[text] for text in texts)
+        ]
+
+
+class TrigramSearch(InvertedIndexSearch):
+    """
+    A search method that keeps an inverted index of the character
+    trigrams in the text of each candidate statement. The candidates
+    that share the greatest proportion of trigrams with the input statement
+    are returned, in the same order that they appear in the candidate list.
+
+    :kwargs:
+        * *search_shortlist_size* (``int``) --
+          The maximum number of candidates to return. Larger values
+          make it more likely that the closest match is found by the
+          statement comparison function, at the cost of speed.
+          Defaults to 100.
+        * *search_ngram_size* (``int``) --
+          The number of characters in each n-gram. Defaults to 3.
+    """
+
+    feature_name = 'ngrams'
+
+    def __init__(self, **kwargs):
+        super(TrigramSearch, self).__init__(**kwargs)
+
+        self.shortlist_size = kwargs.get('search_shortlist_size', 100)
+        self.ngram_size = kwargs.get('search_ngram_size', 3)
+
+    def get_terms(self, text):
+        """
+        Return the set of n-grams in the lowercase version of the text.
+        """
+        text = ' {} '.format(text.lower())
+
+        if len(text) <= self.ngram_size:
+            return set([text])
+
+        return set(
+            text[index:index + self.ngram_size] for index in range(len(text) - self.ngram_size + 1)
+        )
+
+    def search(self, statement, candidates):
+        """
+        Return the candidates that share the most n-grams with the input statement.
+        """
+        if len(candidates) <= self.shortlist_size:
+            return candidates
+
+        self.update_index(candidates)
+
+        statement_ngrams = self.get_terms(statement.text)
+        shared_counts = self.get_shared_term_counts(statement_ngrams)
+
+        def similarity(text):
+            return 2.0 * shared_counts[text] / (len(statement_ngrams) + len(self.terms[text]))
+
+        shortlist = heapq.nlargest(self.shortlist_size, shared_counts, key=similarity)
+
+        return self.get_candidates(candidates, shortlist)
+
+
+class LemmaSearch(InvertedIndexSearch):
+    """
+    A search method that keeps an inverted index of the noun lemmas in the
+    text of each candidate statement, as computed by the Jaccard similarity
+    comparison. Only candidates that share at least one lemma with the input
+    statement are returned, because any other candidate has a Jaccard
+    similarity of zero.
+    """
+
+    feature_name = 'jaccard_similarity'
+
+    def __init__(self, **kwargs):
+        super(LemmaSearch, self).__init__(**kwargs)
+        from chatterbot.comparisons import jaccard_similarity
+
+        self.jaccard_similarity = jaccard_similarity
+
+    def get_terms(self, text):
+        """
+        Return the set of noun lemmas in the text.
+        """
+        return self.jaccard_similarity.get_lemmas(text)
+
+    def search(self, statement, candidates):
+        """
+        Return the candidates that share at least one lemma with the input statement.
+        """
+        self.update_index(candidates)
+
+        shared_counts = self.get_shared_term_counts(self.get_terms(statement.text))
+
+        return self.get_candidates(candidates, shared_counts)
@@ -0,0 +1,91 @@
+"""
+An asynchronous interface to ChatterBot's storage adapters.
+
+This module uses the ``async`` and ``await`` keywords and requires Python 3.5
+or later. It is only imported when a chat bot's asynchronous methods are used.
+"""
+import asyncio
+import functools
+
+
+class AsyncStorageAdapter(object):
+    """
+    The interface that the asynchronous response pipeline uses to access a
+    storage adapter. Each method is a coroutine with the same parameters and
+    return value as the storage adapter method of the same name.
+
+    By default each method of the storage adapter is run in an executor, so
+    that database access does not block the event loop. A child class can
+    override these methods to use a database driver that supports asyncio
+    natively instead.
+
+    :param storage: The storage adapter to access.
+    :type storage: StorageAdapter
+
+    :param executor: The executor that the storage adapter methods are run in.
+                     Defaults to an executor with a single worker thread, because
+                     storage adapters are not guaranteed to be thread safe.
+    :type executor: concurrent.futures.Executor
+    """
+
+    def __init__(self, storage, executor=None):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.storage = storage
+        self.executor = executor or ThreadPoolExecutor(max_workers=1)
+
+    async def run(self, function, *args, **kwargs):
+        """
+        Run a function in the executor and return its result.
+        """
+        loop = asyncio.get_event_loop()
+
+        return await loop.run_in_executor(
+            self.executor, functools.partial(self.run_request, function, *args, **kwargs)
+        )
+
+    def run_request(self, function, *args, **kwargs):
+        """
+        Call a function in a request of the storage adapter, as
+        ``ChatBot.get_response`` does for each response, so that one database
+        connection is shared and repeated lookups are cached during the call.
+        The request is held by the executor thread that calls the function.
+        """
+        self.storage.start_request()
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.storage.finish_request()
+
+    async def count(self):
+        return await self.run(self.storage.count)
+
+    async def find(self, statement_text):
+        return await self.run(self.storage.find, statement_text)
+
+    async def remove(self, statement_text):
+        return await self.run(self.storage.remove, statement_text)
+
+    async def filter(self, **kwargs):
+        return await self.run(self.storage.filter, **kwargs)
+
+    async def update(self, statement):
+        return await self.run(self.storage.update, statement)
+
+    async def get_latest_response(self, conversation_id):
+        return await self.run(self.storage.get_latest_response, conversation_id)
+
+    async def create_conversation(self):
+        return await self.run(self.storage.create_conversation)
+
+    async def add_to_conversation(self, conversation_id, statement, response):
+        return await self.run(
+            self.storage.add_to_conversation, conversation_id, statement, response
+        )
+
+    async def get_random(self):
+        return await self.run(self.storage.get_random)
+
+    async def drop(self):
+        return await self.run(self.storage.drop)
@@ -0,0 +1,247 @@
+from collections import OrderedDict
+from chatterbot import constants
+
+
+class Candidate(object):
+    """
+    A lightweight stand-in for a stored statement that is held in the
+    candidate index. Only the text of the statement and any features
+    computed from it are kept, the full statement object is loaded from
+    the storage adapter only when it is needed.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.features = {}
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return '<Candidate text:%s>' % (self.text)
+
+    def __hash__(self):
+        return hash(self.text)
+
+    def __eq__(self, other):
+        if not other:
+            return False
+
+        return self.text == getattr(other, 'text', other)
+
+    def get_feature(self, name, function):
+        """
+        Return the value of a feature of the candidate's text.
+        The value is computed with the given function the first time it is
+        requested and then kept for as long as the candidate is indexed.
+
+        :param name: A unique name for the feature.
+        :type name: str
+
+        :param function: A function that takes the text of the candidate
+                         and returns the value of the feature.
+        """
+        if name not in self.features:
+            self.features[name] = function(self.text)
+
+        return self.features[name]
+
+
+class CandidateIndex(object):
+    """
+    An in-memory index of the statements that are known responses to
+    other statements. These are the statements that a logic adapter can
+    match an input statement against.
+
+    The index is built once from the database and is then updated
+    incrementally by the storage adapter as statements are saved or removed.
+
+    Each time a candidate is added or removed the version of the index is
+    incremented and the change is recorded, so that copies of the candidates
+    can be brought up to date without loading every candidate again.
+
+    :param feature_functions: A dictionary of feature names and the functions
+                              used to compute each feature for the text of a
+                              statement when it is added to the index.
+    """
+
+    def __init__(self, feature_functions=None):
+        self.feature_functions = feature_functions or {}
+
+        # The candidate for each stored statement, in the order it was stored
+        self.entries = OrderedDict()
+
+        # The response texts that have been saved for each statement
+        self.responses = {}
+
+        # The number of statements that list a given text as a response
+        self.references = {}
+
+        # The position of each stored statement in the order it was stored
+        self.order = {}
+        self.next_order = 0
+
+        self.version = 0
+
+        # The most recent changes to the candidates and
+        # the version of the index before the first of them
+        self.changes = []
+        self.changes_version = 0
+
+        self._candidates = None
+
+    def __len__(self):
+        return len(self.get_candidates())
+
+    def add_text(self, text, extra_data=None):
+        """
+        Add a statement to the index by its text if it is not already indexed.
+        Features that were saved in the statement's extra data are used
+        instead of being computed again.
+        """
+        if text not in self.entries:
+            candidate = Candidate(text)
+
+            if isinstance(extra_data, dict):
+                for name in self.feature_functions:
+                    if name in extra_data:
+                        candidate.features[name] = extra_data[name]
+
+            for name, function in self.feature_functions.items():
+                candidate.get_feature(name, function)
+
+            self.entries[text] = candidate
+            self.responses[text] = set()
+            self.order[text] = self.next_order
+            self.next_order += 1
+
+            if self.references.get(text):
+                self.record_change('add', text)
+
+    def add(self, statement):
+        """
+        Add a statement to the index, or add any new responses
+        of a statement that has already been indexed.
+        """
+        self.add_text(statement.text, getattr(statement, 'extra_data', None))
+
+        for response in statement.in_response_to:
+            self.add_response(statement.text, response.text)
+
+    def add_response(self, statement_text, response_text):
+        """
+        Record that the response text has been saved as a response
+        of the statement with the given text.
+        """
+        response_texts = self.responses.setdefault(statement_text, set())
+
+        if response_text in response_texts:
+            return
+
+        response_texts.add(response_text)
+
+        count = self.references.get(response_text, 0)
+        self.references[response_text] = count + 1
+
+        if count == 0 and response_text in self.entries:
+            self.record_change('add', response_text)
+
+    def remove_response(self, statement_text, response_text):
+        """
+        Remove a response from the statement with the given text.
+        """
+        response_texts = self.responses.get(statement_text, set())
+
+        if response_text not in response_texts:
+            return
+
+        response_texts.remove(response_text)
+
+        count = self.references.get(response_text, 0) - 1
+
+        if count > 0:
+            self.references[response_text] = count
+        else:
+            self.references.pop(response_text, None)
+
+            if response_text in self.entries:
+                self.record_change('remove', response_text)
+
+    def remove(self, statement_text):
+        """
+        Remove the statement with the given text from the index.
+        """
+        for response_text in list(self.responses.get(statement_text, [])):
+            self.remove_response(statement_text, response_text)
+
+        self.responses.pop(statement_text, None)
+
+        if statement_text in self.entries:
+            if self.references.get(statement_text):
+                self.record_change('remove', statement_text)
+
+            del self.entries[statement_text]
+            del self.order[statement_text]
+
+    def add_feature_functions(self, feature_functions):
+        """
+        Compute additional features for every statement in the index,
+        and for each statement that is added to the index afterwards.
+        """
+        self.feature_functions.update(feature_functions)
+
+        for candidate in self.entries.values():
+            for name, function in feature_functions.items():
+                candidate.get_feature(name, function)
+
+    def clear(self):
+        """
+        Remove all statements from the index.
+        """
+        self.entries.clear()
+        self.responses.clear()
+        self.references.clear()
+        self.order.clear()
+        self._candidates = None
+
+        # Copies of the candidates cannot be updated past this point
+        self.version += 1
+        self.changes = []
+        self.changes_version = self.version
+
+    def record_change(self, operation, text):
+        """
+        Record that the statement with the given text was added
+        to or removed from the candidates.
+        """
+        self._candidates = None
+        self.version += 1
+        self.changes.append((operation, self.order[text], text))
+
+        if len(self.changes) > constants.CANDIDATE_INDEX_MAX_CHANGES:
+            self.changes = []
+            self.changes_version = self.version
+
+    def get_changes(self, version):
+        """
+        Return the changes to the candidates since the given version of
+        the index, as tuples of the operation, the position of the statement
+        in the order statements were stored, and the statement's text.
+        Returns None if the changes since that version are no longer known.
+        """
+        if version is None or not self.changes_version <= version <= self.version:
+            return None
+
+        return self.changes[version - self.changes_version:]
+
+    def get_candidates(self):
+        """
+        Return the candidates for each statement that is in response to
+        another statement, in the order that the statements were stored.
+        """
+        if self._candidates is None:
+            self._candidates = [
+                candidate for text, candidate in self.entries.items() if text in self.references
+            ]
+
+        return self._candidates
@@ -0,0 +1,85 @@
+from collections import OrderedDict, deque
+
+
+class ConversationCache(object):
+    """
+    An in-process cache of the text of the latest statements in each
+    conversation. Storage adapters update the cache when statements are
+    added to a conversation, so that the latest response in a conversation
+    can be found by its text without querying the conversation's statements.
+
+    A conversation is only cached once it has been created or added to
+    through the same storage adapter. Conversations that are not cached are
+    looked up in the database. The cache is not updated when another process
+    adds to a conversation, so it should only be used when a single process
+    adds statements to the conversations, or replaced with a cache that is
+    shared between the processes.
+
+    :kwargs:
+        * *conversation_cache_limit* (``int``) --
+          The number of conversations to keep. The least recently used
+          conversation is removed when the limit is reached.
+          Defaults to 10000.
+    """
+
+    def __init__(self, **kwargs):
+        self.limit = kwargs.get('conversation_cache_limit', 10000)
+
+        self.conversations = OrderedDict()
+
+    def __contains__(self, conversation_id):
+        return conversation_id in self.conversations
+
+    def __len__(self):
+        return len(self.conversations)
+
+    def set(self, conversation_id, statement_texts):
+        """
+        Cache the text of the most recent statements in a conversation.
+        """
+        # The latest response is the second to last statement in a conversation
+        self.conversations[conversation_id] = deque(statement_texts, maxlen=2)
+        self.conversations.move_to_end(conversation_id)
+
+        while len(self.conversations) > self.limit:
+            self.conversations.popitem(last=False)
+
+    def create(self, conversation_id):
+        """
+        Cache a new conversation that does not have any statements.
+        """
+        self.set(conversation_id, [])
+
+    def add(self, conversation_id, statement, response):
+        """
+        Add a statement and its response to the end of a conversation.
+        A conversation that is not cached is cached from this point on, because
+        its latest response is always the statement that was added last.
+        """
+        statement_texts = [statement.text, response.text]
+
+        if conversation_id in self.conversations:
+            self.conversations[conversation_id].extend(statement_texts)
+            self.conversations.move_to_end(conversation_id)
+        else:
+            self.set(conversation_id, statement_texts)
+
+    def get_latest_response_text(self, conversation_id):
+        """
+        Return the text of the latest response in a cached conversation,
+        or None if there are no statements in the conversation.
+        """
+        statement_texts = self.conversations[conversation_id]
+        self.conversations.move_to_end(conversation_id)
+
+        if not statement_texts:
+            return None
+
+        # Handle the case of the first statement in the list
+        return statement_texts[0]
+
+    def clear(self):
+        """
+        Remove all conversations from the cache.
+        """
+        self.conversations.clear()
@@ -93,6 +93,22 @@ class DjangoStorageAdapter(StorageAdapter):
 
         return statements
 
+    def filter_iter(self, **kwargs):
+        """
+        Return an iterator over the statements in the database that match
+        the parameters specified. The statements are read from the database
+        in batches of filter_batch_size statements.
+        """
+        import django
+
+        statements = self.filter(**kwargs)
+
+        # The size of each batch can only be set in Django 2.0 and later
+        if django.VERSION < (2, 0):
+            return statements.iterator()
+
+        return statements.iterator(chunk_size=self.filter_batch_size)
+
     def update(self, statement):
         """
         Update the provided statement.
@@ -123,10 +139,35 @@ class DjangoStorageAdapter(StorageAdapter):
 
     def get_random(self):
         """
-        Returns a random statement from the database
+        Returns a random statement from the database.
+
+        A random id between the lowest and highest statement id is selected,
+        so that the statement is found with the primary key instead of by
+        sorting the table. If statements have been removed and no statement
+        has the selected id, another id is tried. The first statement after
+        the last id that was tried is returned if no statement is found.
         """
+        import random
+        from django.db.models import Max, Min
+
         Statement = self.get_model('statement')
-        return Statement.objects.order_by('?').first()
+
+        id_range = Statement.objects.aggregate(Min('id'), Max('id'))
+        min_id = id_range['id__min']
+        max_id = id_range['id__max']
+
+        if max_id is None:
+            return None
+
+        for _ in range(constants.RANDOM_STATEMENT_ATTEMPTS):
+            statement = Statement.objects.filter(id=random.randint(min_id, max_id)).first()
+
+            if statement:
+                return statement
+
+        return Statement.objects.filter(
+            id__gte=random.randint(min_id, max_id)
+        ).order_by('id').first()
 
     def remove(self, statement_text):
         """
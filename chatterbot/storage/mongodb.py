@@ -1,3 +1,4 @@
+from copy import deepcopy
 from chatterbot.storage import StorageAdapter
 
 
@@ -74,15 +75,34 @@ class MongoDatabaseAdapter(StorageAdapter):
 
     def __init__(self, **kwargs):
         super(MongoDatabaseAdapter, self).__init__(**kwargs)
-        from pymongo import MongoClient
+        from pymongo import MongoClient, monitoring
         from pymongo.errors import OperationFailure
 
         self.database_uri = self.kwargs.get(
             'database_uri', 'mongodb://localhost:27017/chatterbot-database'
         )
 
+        storage = self
+
+        class RoundTripListener(monitoring.CommandListener):
+            """
+            Count the commands that are sent to the database.
+            """
+
+            def started(self, event):
+                storage.round_trips += 1
+
+            def succeeded(self, event):
+                pass
+
+            def failed(self, event):
+                pass
+
         # Use the default host and port
-        self.client = MongoClient(self.database_uri)
+        self.client = MongoClient(
+            self.database_uri,
+            event_listeners=[RoundTripListener()]
+        )
 
         # Increase the sort buffer to 42M if possible
         try:
@@ -102,19 +122,30 @@ class MongoDatabaseAdapter(StorageAdapter):
         # Set a requirement for the text attribute to be unique
         self.statements.create_index('text', unique=True)
 
+        # Index the extra data keys that statements are filtered by
+        for key in self.extra_data_index_keys:
+            self.statements.create_index('extra_data.' + key)
+
         self.base_query = Query()
 
+        self.adapter_supports_candidate_index = True
+
+        # The documents that have been found or updated since a bulk
+        # update was started, and the operations that have not been written
+        self.bulk_documents = None
+        self.bulk_operations = None
+        self.bulk_database_empty = False
+
+        self.bulk_update_batch_size = self.kwargs.get('bulk_update_batch_size', 10000)
+        self.bulk_write_batches = True
+
     def get_statement_model(self):
         """
         Return the class for the statement model.
         """
         from chatterbot.conversation import Statement
 
-        # Create a storage-aware statement
-        statement = Statement
-        statement.storage = self
-
-        return statement
+        return Statement
 
     def get_response_model(self):
         """
@@ -122,20 +153,20 @@ class MongoDatabaseAdapter(StorageAdapter):
         """
         from chatterbot.conversation import Response
 
-        # Create a storage-aware response
-        response = Response
-        response.storage = self
-
-        return response
+        return Response
 
     def count(self):
-        return self.statements.count()
+        return self.get_request_cached('count', self.statements.count)
 
     def find(self, statement_text):
         Statement = self.get_model('statement')
-        query = self.base_query.statement_text_equals(statement_text)
 
-        values = self.statements.find_one(query.value())
+        if self.bulk_documents is not None:
+            values = deepcopy(self.get_bulk_document(statement_text))
+        else:
+            query = self.base_query.statement_text_equals(statement_text)
+
+            values = self.statements.find_one(query.value())
 
         if not values:
             return None
@@ -147,7 +178,10 @@ class MongoDatabaseAdapter(StorageAdapter):
             values.get('in_response_to', [])
         )
 
-        return Statement(statement_text, **values)
+        statement = Statement(statement_text, **values)
+        statement.storage = self
+
+        return statement
 
     def deserialize_responses(self, response_list):
         """
@@ -181,13 +215,24 @@ class MongoDatabaseAdapter(StorageAdapter):
             statement_data.get('in_response_to', [])
         )
 
-        return Statement(statement_text, **statement_data)
+        statement = Statement(statement_text, **statement_data)
+        statement.storage = self
+
+        return statement
 
     def filter(self, **kwargs):
         """
         Returns a list of statements in the database
         that match the parameters specified.
         """
+        return list(self.filter_iter(**kwargs))
+
+    def filter_iter(self, **kwargs):
+        """
+        Yield the statements in the database that match the parameters
+        specified. The documents are read from the cursor in batches
+        of filter_batch_size documents.
+        """
         import pymongo
 
         query = self.base_query
@@ -209,9 +254,14 @@ class MongoDatabaseAdapter(StorageAdapter):
             )
             del kwargs['in_response_to__contains']
 
+        # Parameters such as extra_data__speaker filter by the value of an extra data key
+        for parameter in list(kwargs):
+            if parameter.startswith('extra_data__'):
+                kwargs['extra_data.' + parameter[len('extra_data__'):]] = kwargs.pop(parameter)
+
         query = query.raw(kwargs)
 
-        matches = self.statements.find(query.value())
+        matches = self.statements.find(query.value()).batch_size(self.filter_batch_size)
 
         if order_by:
 
@@ -223,17 +273,115 @@ class MongoDatabaseAdapter(StorageAdapter):
 
             matches = matches.sort(order_by, direction)
 
-        results = []
+        for match in matches:
+            yield self.mongo_to_object(match)
+
+    def start_bulk_update(self, write_batches=True):
+        """
+        Start buffering the operations that update statements. The buffered
+        operations are written in order, in batches of bulk_update_batch_size
+        operations unless write_batches is False, and when flush_bulk_update
+        or finish_bulk_update is called.
+        """
+        if self.bulk_documents is not None:
+            return
+
+        self.bulk_write_batches = write_batches
+        self.bulk_documents = {}
+        self.bulk_operations = []
+
+        # Statements do not need to be looked up in an empty database
+        self.bulk_database_empty = self.count() == 0
+
+    def flush_bulk_update(self):
+        """
+        Write the buffered operations and continue buffering updates.
+        """
+        if self.bulk_documents is not None:
+            self.write_bulk_update()
+
+    def finish_bulk_update(self):
+        """
+        Write the buffered operations and stop buffering updates.
+        """
+        if self.bulk_documents is None:
+            return
+
+        self.write_bulk_update()
+
+        self.bulk_documents = None
+        self.bulk_operations = None
+
+    def discard_bulk_update(self):
+        """
+        Discard the buffered operations that have not been written
+        and stop buffering updates.
+        """
+        if self.bulk_documents is None:
+            return
+
+        self.bulk_documents = None
+        self.bulk_operations = None
+
+        self.clear_request_cache()
+
+        # The discarded statements may have been added to the candidate index
+        self.candidate_index = None
+
+    def get_bulk_document(self, statement_text):
+        """
+        Return the buffered document of a statement, loading it from the
+        database if it has not been buffered yet. None is returned if the
+        statement does not exist.
+        """
+        if statement_text not in self.bulk_documents:
+            document = None
+
+            if not self.bulk_database_empty:
+                document = self.statements.find_one({'text': statement_text})
+
+            self.bulk_documents[statement_text] = document
+
+        return self.bulk_documents[statement_text]
+
+    def buffer_operation(self, operation, statement_text, values):
+        """
+        Buffer an operation that sets values on the document of a statement,
+        and apply the same change to the buffered document.
+        """
+        document = self.get_bulk_document(statement_text)
+
+        if document is None:
+            document = {'text': statement_text}
+            self.bulk_documents[statement_text] = document
+
+        document.update(deepcopy(values))
+
+        self.bulk_operations.append(operation)
 
-        for match in list(matches):
-            results.append(self.mongo_to_object(match))
+    def write_bulk_update(self):
+        """
+        Write the buffered operations in the order they were made.
+        """
+        from pymongo.errors import BulkWriteError
+
+        if not self.bulk_operations:
+            return
 
-        return results
+        try:
+            self.statements.bulk_write(self.bulk_operations, ordered=True)
+        except BulkWriteError as bwe:
+            # Log the details of a bulk write error
+            self.logger.error(str(bwe.details))
+
+        self.bulk_operations = []
 
     def update(self, statement):
         from pymongo import UpdateOne
         from pymongo.errors import BulkWriteError
 
+        self.add_computed_extra_data(statement)
+
         data = statement.serialize()
 
         operations = []
@@ -257,11 +405,28 @@ class MongoDatabaseAdapter(StorageAdapter):
             )
             operations.append(update_operation)
 
-        try:
-            self.statements.bulk_write(operations, ordered=False)
-        except BulkWriteError as bwe:
-            # Log the details of a bulk write error
-            self.logger.error(str(bwe.details))
+        if self.bulk_documents is not None:
+            self.buffer_operation(operations[0], statement.text, data)
+
+            for operation, response_dict in zip(operations[1:], data.get('in_response_to', [])):
+                self.buffer_operation(operation, response_dict.get('text'), response_dict)
+
+            if self.bulk_write_batches and len(self.bulk_operations) >= self.bulk_update_batch_size:
+                self.write_bulk_update()
+        else:
+            try:
+                self.statements.bulk_write(operations, ordered=False)
+            except BulkWriteError as bwe:
+                # Log the details of a bulk write error
+                self.logger.error(str(bwe.details))
+
+        self.clear_request_cache()
+
+        if self.candidate_index is not None:
+            self.candidate_index.add(statement)
+
+            for response_dict in data.get('in_response_to', []):
+                self.candidate_index.add_text(response_dict.get('text'))
 
         return statement
 
@@ -270,6 +435,10 @@ class MongoDatabaseAdapter(StorageAdapter):
         Create a new conversation.
         """
         conversation_id = self.conversations.insert_one({}).inserted_id
+
+        if self.conversation_cache is not None:
+            self.conversation_cache.create(conversation_id)
+
         return conversation_id
 
     def get_latest_response(self, conversation_id):
@@ -277,66 +446,94 @@ class MongoDatabaseAdapter(StorageAdapter):
         Returns the latest response in a conversation if it exists.
         Returns None if a matching conversation cannot be found.
         """
+        return self.get_request_cached(
+            ('latest_response', conversation_id), self._get_latest_response, conversation_id
+        )
+
+    def _get_latest_response(self, conversation_id):
         from pymongo import DESCENDING
 
-        statements = list(self.statements.find({
-            'conversations.id': conversation_id
-        }).sort('conversations.created_at', DESCENDING))
+        if self.conversation_cache is not None and conversation_id in self.conversation_cache:
+            statement_text = self.conversation_cache.get_latest_response_text(conversation_id)
+
+            if statement_text is None:
+                return None
+
+            return self.find(statement_text)
+
+        # The last two statements that were added to the conversation,
+        # ordered by when each was added to this conversation
+        statements = list(self.statements.aggregate([
+            {'$match': {'conversations.id': conversation_id}},
+            {'$unwind': '$conversations'},
+            {'$match': {'conversations.id': conversation_id}},
+            {'$sort': {'conversations.created_at': DESCENDING}},
+            {'$limit': 2},
+            {'$project': {'conversations': 0}}
+        ]))
 
         if not statements:
             return None
 
-        return self.mongo_to_object(statements[-2])
+        # Handle the case of the first statement in the list
+        return self.mongo_to_object(statements[-1])
 
     def add_to_conversation(self, conversation_id, statement, response):
         """
         Add the statement and response to the conversation.
         """
         from datetime import datetime, timedelta
-        self.statements.update_one(
-            {
-                'text': statement.text
-            },
-            {
-                '$push': {
-                    'conversations': {
-                        'id': conversation_id,
-                        'created_at': datetime.utcnow()
+        from pymongo import UpdateOne
+
+        created_at = datetime.utcnow()
+
+        self.statements.bulk_write([
+            UpdateOne(
+                {
+                    'text': statement.text
+                },
+                {
+                    '$push': {
+                        'conversations': {
+                            'id': conversation_id,
+                            'created_at': created_at
+                        }
                     }
                 }
-            }
-        )
-        self.statements.update_one(
-            {
-                'text': response.text
-            },
-            {
-                '$push': {
-                    'conversations': {
-                        'id': conversation_id,
-                        # Force the response to be at least one millisecond after the input statement
-                        'created_at': datetime.utcnow() + timedelta(milliseconds=1)
+            ),
+            UpdateOne(
+                {
+                    'text': response.text
+                },
+                {
+                    '$push': {
+                        'conversations': {
+                            'id': conversation_id,
+                            # Force the response to be at least one millisecond after the input statement
+                            'created_at': created_at + timedelta(milliseconds=1)
+                        }
                     }
                 }
-            }
-        )
+            )
+        ])
+
+        self.clear_request_cache()
+
+        if self.conversation_cache is not None:
+            self.conversation_cache.add(conversation_id, statement, response)
 
     def get_random(self):
         """
-        Returns a random statement from the database
+        Returns a random statement from the database.
+        The statement is selected by the database with the $sample
+        aggregation stage, so that the collection is not scanned.
         """
-        from random import randint
-
-        count = self.count()
+        statements = list(self.statements.aggregate([{'$sample': {'size': 1}}]))
 
-        if count < 1:
+        if not statements:
             raise self.EmptyDatabaseException()
 
-        random_integer = randint(0, count - 1)
-
-        statements = self.statements.find().limit(1).skip(random_integer)
-
-        return self.mongo_to_object(list(statements)[0])
+        return self.mongo_to_object(statements[0])
 
     def remove(self, statement_text):
         """
@@ -344,11 +541,22 @@ class MongoDatabaseAdapter(StorageAdapter):
         Removes any responses from statements if the response text matches the
         input text.
         """
-        for statement in self.filter(in_response_to__contains=statement_text):
+        for statement in self.filter_iter(in_response_to__contains=statement_text):
             statement.remove_response(statement_text)
             self.update(statement)
 
+            if self.candidate_index is not None:
+                self.candidate_index.remove_response(statement.text, statement_text)
+
         self.statements.delete_one({'text': statement_text})
+        self.clear_request_cache()
+
+        if self.candidate_index is not None:
+            self.candidate_index.remove(statement_text)
+
+        # The removed statement may be one of the cached conversation statements
+        if self.conversation_cache is not None:
+            self.conversation_cache.clear()
 
     def get_response_statements(self):
         """
@@ -379,8 +587,51 @@ class MongoDatabaseAdapter(StorageAdapter):
             statement_objects.append(self.mongo_to_object(statement))
         return statement_objects
 
+    def load_candidate_index(self, candidate_index):
+        """
+        Populate the candidate index with the text of each statement and
+        response without building the full statement objects.
+        """
+        projection = {'text': True, 'in_response_to.text': True}
+
+        for key in self.extra_data_functions:
+            projection['extra_data.' + key] = True
+
+        documents = self.statements.find({}, projection)
+
+        for document in documents:
+            candidate_index.add_text(document['text'], document.get('extra_data'))
+
+            for response in document.get('in_response_to', []):
+                candidate_index.add_response(document['text'], response['text'])
+
+    def get_response_candidates(self):
+        """
+        Return the candidates for statements that are in response to another
+        statement, excluding any statements that the base query excludes.
+        """
+        candidates = super(MongoDatabaseAdapter, self).get_response_candidates()
+
+        if self.candidate_index is None:
+            return candidates
+
+        query = self.base_query.value()
+        excluded_text = set(query.get('text', {}).get('$nin', []))
+
+        if not excluded_text:
+            return candidates
+
+        return [
+            candidate for candidate in candidates if candidate.text not in excluded_text
+        ]
+
     def drop(self):
         """
         Remove the database.
         """
         self.client.drop_database(self.database.name)
+        self.candidate_index = None
+        self.clear_request_cache()
+
+        if self.conversation_cache is not None:
+            self.conversation_cache.clear()
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from chatterbot.storage import StorageAdapter
 
 
@@ -14,8 +15,8 @@ class SQLStorageAdapter(StorageAdapter):
 
     Notes:
         Tables may change (and will), so, save your training data.
-        There is no data migration (yet).
-        Performance test not done yet.
+        The tables of a database created by an earlier version are upgraded
+        when the adapter is created, unless the adapter is read only.
         Tests using other databases not finished.
 
     All parameters are optional, by default a sqlite database is used.
@@ -30,6 +31,41 @@ class SQLStorageAdapter(StorageAdapter):
     :keyword read_only: False by default, makes all operations read only, has priority over all DB operations
         so, create, update, delete will NOT be executed
     :type read_only: bool
+
+    :keyword extra_data_format: The format that the extra data of statements is saved in,
+        either 'json' (the default) or 'msgpack', which requires the msgpack package.
+    :type extra_data_format: str
+
+    :keyword extra_data_index_keys: The extra data keys that statements can be filtered by
+        with an index, for example: filter(extra_data__speaker='tom')
+    :type extra_data_index_keys: list
+
+    :keyword database_pool_size: The number of connections to keep open in the pool.
+        Setting this for a sqlite file database makes it use a connection pool, because
+        a new connection is opened for each session by default.
+    :type database_pool_size: int
+
+    :keyword database_max_overflow: The number of connections that can be opened
+        in addition to database_pool_size when every connection is in use.
+    :type database_max_overflow: int
+
+    :keyword database_pool_timeout: The number of seconds to wait for a connection
+        when every connection in the pool is in use.
+    :type database_pool_timeout: int
+
+    :keyword database_pool_recycle: The number of seconds after which a connection
+        is replaced, for databases that close idle connections, such as MySQL.
+    :type database_pool_recycle: int
+
+    :keyword database_pool_pre_ping: Test that each connection is still open
+        when it is taken from the pool. False by default.
+    :type database_pool_pre_ping: bool
+
+    :keyword scoped_session: Reuse one session for every database operation in
+        the same thread, instead of creating a new session for each operation.
+        The session of a thread is removed when a request is finished.
+        False by default.
+    :type scoped_session: bool
     """
 
     def __init__(self, **kwargs):
@@ -48,7 +84,23 @@ class SQLStorageAdapter(StorageAdapter):
         if not self.database_uri:
             self.database_uri = "sqlite:///db.sqlite3"
 
-        self.engine = create_engine(self.database_uri, convert_unicode=True)
+        if self.database_uri == 'sqlite://':
+            from sqlalchemy.pool import StaticPool
+
+            # Share the in-memory database with every thread, such
+            # as the executor that asynchronous responses run in
+            self.engine = create_engine(
+                self.database_uri,
+                convert_unicode=True,
+                connect_args={'check_same_thread': False},
+                poolclass=StaticPool
+            )
+        else:
+            self.engine = create_engine(
+                self.database_uri,
+                convert_unicode=True,
+                **self.get_engine_pool_options()
+            )
 
         from re import search
 
@@ -65,14 +117,61 @@ class SQLStorageAdapter(StorageAdapter):
             "read_only", False
         )
 
+        self.extra_data_format = self.kwargs.get('extra_data_format', 'json')
+
+        if self.extra_data_format == 'msgpack':
+            # Make sure that the optional msgpack package is installed
+            import msgpack  # NOQA
+
+        # Each engine has its own dialect, so the format is not shared with other adapters
+        self.engine.dialect.extra_data_format = self.extra_data_format
+
         if not self.engine.dialect.has_table(self.engine, 'Statement'):
             self.create()
+        elif not self.read_only:
+            from chatterbot.ext.sqlalchemy_app.migrations import migrate
+            from chatterbot.ext.sqlalchemy_app.models import Base
+
+            # Upgrade the tables of a database created by an earlier version
+            if migrate(self.engine):
+                self.logger.info('Upgraded the tables of {}'.format(self.database_uri))
+
+            # Create any tables that have been added since the database was created
+            Base.metadata.create_all(self.engine)
 
         self.Session = sessionmaker(bind=self.engine, expire_on_commit=True)
 
+        self.scoped_session = self.kwargs.get('scoped_session', False)
+
+        if self.scoped_session:
+            from sqlalchemy.orm import scoped_session
+
+            self.Session = scoped_session(self.Session)
+
+        # The state of each statement that has been found or updated since a bulk
+        # update was started, and the text of the statements with unwritten updates
+        self.bulk_statements = None
+        self.bulk_updated = None
+        self.bulk_database_empty = False
+
+        self.bulk_update_batch_size = self.kwargs.get('bulk_update_batch_size', 10000)
+        self.bulk_write_batches = True
+
+        from sqlalchemy import event
+
+        @event.listens_for(self.engine, 'before_cursor_execute')
+        def count_query(connection, cursor, statement, parameters, context, executemany):
+            self.round_trips += 1
+
+        @event.listens_for(self.engine, 'commit')
+        def count_commit(connection):
+            self.round_trips += 1
+
         # ChatterBot's internal query builder is not yet supported for this adapter
         self.adapter_supports_queries = False
 
+        self.adapter_supports_candidate_index = True
+
     def get_statement_model(self):
         """
         Return the statement model.
@@ -101,13 +200,107 @@ class SQLStorageAdapter(StorageAdapter):
         from chatterbot.ext.sqlalchemy_app.models import Tag
         return Tag
 
+    def get_engine_pool_options(self):
+        """
+        Return the connection pool options of the database engine
+        that have been set in the parameters of the adapter.
+        """
+        pool_options = {}
+
+        for option in ('pool_size', 'max_overflow', 'pool_timeout', 'pool_recycle', 'pool_pre_ping'):
+            value = self.kwargs.get('database_' + option)
+
+            if value is not None:
+                pool_options[option] = value
+
+        if 'pool_size' in pool_options and self.database_uri.startswith('sqlite://'):
+            from sqlalchemy.pool import QueuePool
+
+            # Connections to sqlite file databases are not pooled by default
+            pool_options['poolclass'] = QueuePool
+            pool_options['connect_args'] = {'check_same_thread': False}
+
+        return pool_options
+
+    @property
+    def request_connection(self):
+        """
+        The connection that is shared by every session during the request
+        that has been started in the current thread, or None if a request
+        has not been started.
+        """
+        return getattr(self.request_state, 'connection', None)
+
+    @request_connection.setter
+    def request_connection(self, connection):
+        self.request_state.connection = connection
+
+    def start_request(self):
+        """
+        Start a unit of work that shares one database connection
+        between each session that is used during the request.
+        """
+        self.finish_request()
+
+        super(SQLStorageAdapter, self).start_request()
+
+        self.request_connection = self.engine.connect()
+
+    def finish_request(self):
+        """
+        Finish the current unit of work and release its database connection.
+        """
+        super(SQLStorageAdapter, self).finish_request()
+
+        if self.scoped_session:
+            self.Session.remove()
+
+        if self.request_connection is not None:
+            self.request_connection.close()
+            self.request_connection = None
+
+    def get_session(self):
+        """
+        Return a new session, which uses the connection
+        of the current request if one has been started.
+
+        The same session is returned each time in a thread when
+        scoped sessions are used. Its connection is released each
+        time the session is closed, unless a request has been started.
+        """
+        if self.scoped_session:
+            session = self.Session()
+            session.bind = self.request_connection or self.engine
+            return session
+
+        if self.request_connection is not None:
+            return self.Session(bind=self.request_connection)
+
+        return self.Session()
+
+    def get_statement_load_options(self, loader):
+        """
+        Return the query options that load the tags and responses of
+        statements with the given loading strategy, so that converting
+        each record to a statement object does not query the database.
+        """
+        Statement = self.get_model('statement')
+
+        return (
+            loader(Statement.tags),
+            loader(Statement.in_response_to),
+        )
+
     def count(self):
         """
         Return the number of entries in the database.
         """
+        return self.get_request_cached('count', self._count)
+
+    def _count(self):
         Statement = self.get_model('statement')
 
-        session = self.Session()
+        session = self.get_session()
         statement_count = session.query(Statement).count()
         session.close()
         return statement_count
@@ -116,10 +309,20 @@ class SQLStorageAdapter(StorageAdapter):
         """
         Returns a statement if it exists otherwise None
         """
+        if self.bulk_statements is not None:
+            return self.get_buffered_statement(statement_text)
+
+        return self._find(statement_text)
+
+    def _find(self, statement_text):
+        from sqlalchemy.orm import joinedload
+
         Statement = self.get_model('statement')
-        session = self.Session()
+        session = self.get_session()
 
-        query = session.query(Statement).filter_by(text=statement_text)
+        query = session.query(Statement).options(
+            *self.get_statement_load_options(joinedload)
+        ).filter_by(text=statement_text)
         record = query.first()
         if record:
             statement = record.get_statement()
@@ -136,14 +339,25 @@ class SQLStorageAdapter(StorageAdapter):
         the input text.
         """
         Statement = self.get_model('statement')
-        session = self.Session()
+        session = self.get_session()
 
         query = session.query(Statement).filter_by(text=statement_text)
         record = query.first()
 
+        if self.extra_data_index_keys:
+            self.delete_extra_data_index(session, [record.id])
+
         session.delete(record)
 
         self._session_finish(session)
+        self.clear_request_cache()
+
+        if self.candidate_index is not None and not self.read_only:
+            self.candidate_index.remove(statement_text)
+
+        # The removed statement may be one of the cached conversation statements
+        if self.conversation_cache is not None:
+            self.conversation_cache.clear()
 
     def filter(self, **kwargs):
         """
@@ -153,63 +367,229 @@ class SQLStorageAdapter(StorageAdapter):
         all listed attributes and in which all values
         match for all listed attributes will be returned.
         """
-        Statement = self.get_model('statement')
+        return list(self.filter_iter(**kwargs))
+
+    def filter_iter(self, **kwargs):
+        """
+        Yield the objects from the database that match the parameters
+        of the filter method. The rows are read in batches of
+        filter_batch_size rows in a new session for each batch, so
+        that only one batch is held in memory at a time.
+        """
+        filter_parameters = kwargs.copy()
+
+        # Parameters such as extra_data__speaker filter by the value of an extra data key
+        extra_data_filters = {}
+        for parameter in list(filter_parameters):
+            if parameter.startswith('extra_data__'):
+                extra_data_filters[parameter[len('extra_data__'):]] = filter_parameters.pop(parameter)
+
+        # Keys that are not indexed are compared after the statements are loaded
+        unindexed_filters = [
+            (key, value) for key, value in extra_data_filters.items()
+            if not self.is_extra_data_indexed(key, value)
+        ]
+
         Response = self.get_model('response')
 
-        session = self.Session()
+        last_id = None
 
-        filter_parameters = kwargs.copy()
+        while True:
+            session = self.get_session()
 
-        statements = []
-        _query = None
+            query, id_column = self.get_filter_query(
+                session, filter_parameters, extra_data_filters
+            )
+
+            if query is None:
+                session.close()
+                return
+
+            if last_id is not None:
+                query = query.filter(id_column > last_id)
+
+            records = query.order_by(id_column).limit(self.filter_batch_size).all()
+
+            results = []
+
+            for record in records:
+                # Records of responses are converted to the statement they belong to
+                if isinstance(record, Response):
+                    if record.statement_table:
+                        results.append(record.statement_table.get_statement())
+                else:
+                    results.append(record.get_statement())
+
+            if records:
+                last_id = records[-1].id
+
+            session.close()
+
+            for result in results:
+                if all(result.extra_data.get(key) == value for key, value in unindexed_filters):
+                    yield result
+
+            if len(records) < self.filter_batch_size:
+                return
+
+    def get_filter_query(self, session, filter_parameters, extra_data_filters):
+        """
+        Return the query that selects the records matching the filter
+        parameters, along with the id column that the records are ordered
+        by. The query is None if no records can match the parameters.
+        """
+        from sqlalchemy.orm import joinedload, selectinload
+
+        Statement = self.get_model('statement')
+        Response = self.get_model('response')
+
+        extra_data_conditions = self.get_extra_data_conditions(extra_data_filters)
 
         if len(filter_parameters) == 0:
-            _response_query = session.query(Statement)
-            statements.extend(_response_query.all())
-        else:
-            for i, fp in enumerate(filter_parameters):
-                _filter = filter_parameters[fp]
-                if fp in ['in_response_to', 'in_response_to__contains']:
-                    _response_query = session.query(Statement)
-                    if isinstance(_filter, list):
-                        if len(_filter) == 0:
-                            _query = _response_query.filter(
-                                Statement.in_response_to == None  # NOQA Here must use == instead of is
-                            )
-                        else:
-                            for f in _filter:
-                                _query = _response_query.filter(
-                                    Statement.in_response_to.contains(get_response_table(f)))
+            _query = session.query(Statement).options(
+                *self.get_statement_load_options(selectinload)
+            )
+            return _query.filter(*extra_data_conditions), Statement.id
+
+        _query = None
+        id_column = Statement.id
+
+        for fp in filter_parameters:
+            _filter = filter_parameters[fp]
+            if fp in ['in_response_to', 'in_response_to__contains']:
+                _response_query = session.query(Statement).options(
+                    *self.get_statement_load_options(joinedload)
+                )
+                if isinstance(_filter, list):
+                    if len(_filter) == 0:
+                        _query = _response_query.filter(
+                            Statement.in_response_to == None  # NOQA Here must use == instead of is
+                        )
                     else:
-                        if fp == 'in_response_to__contains':
-                            _query = _response_query.join(Response).filter(Response.text == _filter)
-                        else:
-                            _query = _response_query.filter(Statement.in_response_to == None)  # NOQA
+                        for f in _filter:
+                            _query = _response_query.filter(
+                                Statement.in_response_to.contains(get_response_table(f)))
                 else:
-                    if _query:
-                        _query = _query.filter(Response.statement_text.like('%' + _filter + '%'))
+                    if fp == 'in_response_to__contains':
+                        _query = _response_query.join(Response).filter(Response.text == _filter)
                     else:
-                        _response_query = session.query(Response)
-                        _query = _response_query.filter(Response.statement_text.like('%' + _filter + '%'))
+                        _query = _response_query.filter(Statement.in_response_to == None)  # NOQA
+            else:
+                if _query:
+                    _query = _query.filter(Statement.text.like('%' + _filter + '%'))
+                else:
+                    _response_query = session.query(Response).join(Response.statement_table)
+                    _query = _response_query.filter(Statement.text.like('%' + _filter + '%'))
+                    id_column = Response.id
 
-                if _query is None:
-                    return []
-                if len(filter_parameters) == i + 1:
-                    statements.extend(_query.all())
+            if _query is None:
+                return None, id_column
 
-        results = []
+        return _query.filter(*extra_data_conditions), id_column
 
-        for statement in statements:
-            if isinstance(statement, Response):
-                if statement and statement.statement_table:
-                    results.append(statement.statement_table.get_statement())
-            else:
-                if statement:
-                    results.append(statement.get_statement())
+    def encode_extra_data_index_value(self, value):
+        """
+        Return the value of an extra data key as it is saved in the index.
+        """
+        import json
 
-        session.close()
+        return json.dumps(value, separators=(',', ':'), sort_keys=True)
+
+    def is_extra_data_indexed(self, key, value):
+        """
+        Return True if the value of the extra data key can be found with the
+        index. Values that are too long to be saved in the index are not indexed.
+        """
+        from chatterbot import constants
+
+        if key not in self.extra_data_index_keys:
+            return False
 
-        return results
+        encoded_value = self.encode_extra_data_index_value(value)
+
+        return len(encoded_value) <= constants.STATEMENT_TEXT_MAX_LENGTH
+
+    def get_extra_data_conditions(self, extra_data_filters):
+        """
+        Return the query conditions that select the statements
+        which have the given values of indexed extra data keys.
+        """
+        from sqlalchemy import and_, select
+        from chatterbot.ext.sqlalchemy_app.models import extra_data_index_table
+
+        Statement = self.get_model('statement')
+
+        conditions = []
+
+        for key, value in extra_data_filters.items():
+            if self.is_extra_data_indexed(key, value):
+                conditions.append(Statement.id.in_(
+                    select([extra_data_index_table.c.statement_id]).where(and_(
+                        extra_data_index_table.c.key == key,
+                        extra_data_index_table.c.value == self.encode_extra_data_index_value(value)
+                    ))
+                ))
+
+        return conditions
+
+    def delete_extra_data_index(self, session, statement_ids, batch_size=500):
+        """
+        Remove the indexed extra data of the statements with the given ids.
+        """
+        from chatterbot.ext.sqlalchemy_app.models import extra_data_index_table
+
+        for index in range(0, len(statement_ids), batch_size):
+            session.execute(extra_data_index_table.delete().where(
+                extra_data_index_table.c.statement_id.in_(statement_ids[index:index + batch_size])
+            ))
+
+    def update_extra_data_index(self, session, statements):
+        """
+        Replace the indexed extra data of each statement.
+
+        :param statements: The id and the extra data of each statement.
+        :type statements: list
+        """
+        from chatterbot.ext.sqlalchemy_app.models import extra_data_index_table
+
+        self.delete_extra_data_index(session, [statement_id for statement_id, _ in statements])
+
+        rows = []
+
+        for statement_id, extra_data in statements:
+            for key in self.extra_data_index_keys:
+                if key in extra_data and self.is_extra_data_indexed(key, extra_data[key]):
+                    rows.append({
+                        'statement_id': statement_id,
+                        'key': key,
+                        'value': self.encode_extra_data_index_value(extra_data[key])
+                    })
+
+        if rows:
+            session.execute(extra_data_index_table.insert(), rows)
+
+    def rebuild_extra_data_index(self, batch_size=1000):
+        """
+        Index the extra data of every statement. This must be called after
+        keys are added to extra_data_index_keys for a database that already
+        has statements.
+        """
+        Statement = self.get_model('statement')
+
+        session = self.get_session()
+
+        statements = []
+
+        for statement_id, extra_data in session.query(Statement.id, Statement.extra_data).yield_per(batch_size):
+            statements.append((statement_id, extra_data))
+
+            if len(statements) >= batch_size:
+                self.update_extra_data_index(session, statements)
+                statements = []
+
+        self.update_extra_data_index(session, statements)
+
+        self._session_finish(session)
 
     def update(self, statement):
         """
@@ -220,16 +600,25 @@ class SQLStorageAdapter(StorageAdapter):
         Response = self.get_model('response')
         Tag = self.get_model('tag')
 
-        if statement:
-            session = self.Session()
+        if statement and self.bulk_statements is not None:
+            self.buffer_update(statement)
+
+        elif statement:
+            from sqlalchemy.orm import joinedload
 
-            query = session.query(Statement).filter_by(text=statement.text)
+            session = self.get_session()
+
+            query = session.query(Statement).options(
+                *self.get_statement_load_options(joinedload)
+            ).filter_by(text=statement.text)
             record = query.first()
 
             # Create a new statement entry if one does not already exist
             if not record:
                 record = Statement(text=statement.text)
 
+            self.add_computed_extra_data(statement)
+
             record.extra_data = dict(statement.extra_data)
 
             for _tag in statement.tags:
@@ -241,12 +630,14 @@ class SQLStorageAdapter(StorageAdapter):
 
                 record.tags.append(tag)
 
+            # The responses of the statement that are already saved
+            saved_responses = {}
+            for _response in record.in_response_to:
+                saved_responses.setdefault(_response.text, _response)
+
             # Get or create the response records as needed
             for response in statement.in_response_to:
-                _response = session.query(Response).filter_by(
-                    text=response.text,
-                    statement_text=statement.text
-                ).first()
+                _response = saved_responses.get(response.text)
 
                 if _response:
                     _response.occurrence += 1
@@ -254,15 +645,330 @@ class SQLStorageAdapter(StorageAdapter):
                     # Create the record
                     _response = Response(
                         text=response.text,
-                        statement_text=statement.text,
                         occurrence=response.occurrence
                     )
 
-                record.in_response_to.append(_response)
+                    record.in_response_to.append(_response)
 
             session.add(record)
 
+            if self.extra_data_index_keys:
+                session.flush()
+                self.update_extra_data_index(session, [(record.id, record.extra_data)])
+
             self._session_finish(session)
+            self.clear_request_cache()
+
+            if self.candidate_index is not None and not self.read_only:
+                self.candidate_index.add(statement)
+
+    def start_bulk_update(self, write_batches=True):
+        """
+        Start buffering the statements that are updated. The buffered
+        statements are written in batches of bulk_update_batch_size
+        statements, each in a single transaction, unless write_batches is
+        False, and when flush_bulk_update or finish_bulk_update is called.
+
+        The saved occurrences of responses and the tags of each statement
+        are the same as when each statement is updated in turn.
+        """
+        if self.read_only or self.bulk_statements is not None:
+            return
+
+        self.bulk_write_batches = write_batches
+        self.bulk_statements = {}
+        self.bulk_updated = OrderedDict()
+
+        # Statements do not need to be looked up in an empty database
+        self.bulk_database_empty = self.count() == 0
+
+    def flush_bulk_update(self):
+        """
+        Write the buffered statements and continue buffering updates.
+        The buffered state of each statement is kept, so the statements
+        do not need to be loaded from the database again.
+        """
+        if self.bulk_statements is not None:
+            self.write_bulk_update()
+
+    def finish_bulk_update(self):
+        """
+        Write the buffered statements and stop buffering updates.
+        """
+        if self.bulk_statements is None:
+            return
+
+        self.write_bulk_update()
+
+        self.bulk_statements = None
+        self.bulk_updated = None
+
+    def discard_bulk_update(self):
+        """
+        Discard the buffered statements that have not been written
+        and stop buffering updates.
+        """
+        if self.bulk_statements is None:
+            return
+
+        self.bulk_statements = None
+        self.bulk_updated = None
+
+        self.clear_request_cache()
+
+        # The discarded statements may have been added to the candidate index
+        self.candidate_index = None
+
+    def get_bulk_state(self, statement_text):
+        """
+        Return the buffered state of a statement, loading
+        it from the database if it has not been buffered yet.
+        """
+        from chatterbot.conversation import Statement as StatementObject
+
+        if statement_text not in self.bulk_statements:
+            statement = None
+
+            if not self.bulk_database_empty:
+                statement = self._find(statement_text)
+
+            self.bulk_statements[statement_text] = {
+                'statement': statement or StatementObject(statement_text),
+                'exists': statement is not None,
+                'id': None,
+                'saved_responses': dict(
+                    (response.text, response.occurrence) for response in statement.in_response_to
+                ) if statement else {},
+                'saved_tags': set(statement.tags) if statement else set()
+            }
+
+        return self.bulk_statements[statement_text]
+
+    def get_buffered_statement(self, statement_text):
+        """
+        Return a copy of a statement that includes its buffered updates,
+        or None if the statement does not exist.
+        """
+        from chatterbot.conversation import Statement as StatementObject
+        from chatterbot.conversation import Response as ResponseObject
+
+        state = self.get_bulk_state(statement_text)
+
+        if not state['exists'] and statement_text not in self.bulk_updated:
+            return None
+
+        saved_statement = state['statement']
+
+        statement = StatementObject(
+            saved_statement.text,
+            tags=list(saved_statement.tags),
+            extra_data=dict(saved_statement.extra_data)
+        )
+
+        for response in saved_statement.in_response_to:
+            statement.add_response(
+                ResponseObject(text=response.text, occurrence=response.occurrence)
+            )
+
+        return statement
+
+    def buffer_update(self, statement):
+        """
+        Apply an update to the buffered state of a statement.
+        """
+        from chatterbot.conversation import Response as ResponseObject
+
+        self.add_computed_extra_data(statement)
+
+        saved_statement = self.get_bulk_state(statement.text)['statement']
+
+        saved_statement.extra_data = dict(statement.extra_data)
+
+        for tag in statement.tags:
+            if tag not in saved_statement.tags:
+                saved_statement.tags.append(tag)
+
+        saved_responses = dict(
+            (response.text, response) for response in saved_statement.in_response_to
+        )
+
+        for response in statement.in_response_to:
+            if response.text in saved_responses:
+                saved_responses[response.text].occurrence += 1
+            else:
+                saved_responses[response.text] = ResponseObject(
+                    text=response.text,
+                    occurrence=response.occurrence
+                )
+                saved_statement.in_response_to.append(saved_responses[response.text])
+
+        self.bulk_updated[statement.text] = True
+
+        self.clear_request_cache()
+
+        if self.candidate_index is not None:
+            self.candidate_index.add(statement)
+
+        if self.bulk_write_batches and len(self.bulk_updated) >= self.bulk_update_batch_size:
+            self.write_bulk_update()
+
+    def write_bulk_update(self):
+        """
+        Write the buffered statements in a single transaction.
+        """
+        from sqlalchemy import and_, bindparam
+        from chatterbot.ext.sqlalchemy_app.models import tag_association_table
+
+        if not self.bulk_updated:
+            return
+
+        statement_table = self.get_model('statement').__table__
+        response_table = self.get_model('response').__table__
+        tag_table = self.get_model('tag').__table__
+
+        states = [self.bulk_statements[text] for text in self.bulk_updated]
+
+        new_statements = []
+        updated_statements = []
+        new_responses = []
+        updated_responses = []
+        new_tags = []
+
+        for state in states:
+            statement = state['statement']
+
+            if state['exists']:
+                updated_statements.append({
+                    'statement_text': statement.text,
+                    'new_extra_data': statement.extra_data
+                })
+            else:
+                new_statements.append({
+                    'text': statement.text,
+                    'extra_data': statement.extra_data
+                })
+
+            for response in statement.in_response_to:
+                if response.text not in state['saved_responses']:
+                    new_responses.append((state, {
+                        'text': response.text,
+                        'occurrence': response.occurrence
+                    }))
+                elif response.occurrence != state['saved_responses'][response.text]:
+                    updated_responses.append((state, {
+                        'response_text': response.text,
+                        'new_occurrence': response.occurrence
+                    }))
+
+            for tag in statement.tags:
+                if tag not in state['saved_tags']:
+                    new_tags.append((state, tag))
+
+        session = self.get_session()
+
+        if new_statements:
+            session.execute(statement_table.insert(), new_statements)
+
+        # Look up the id of each statement that has new responses or tags,
+        # or of every statement if the extra data of statements is indexed
+        if self.extra_data_index_keys:
+            id_states = [(state, None) for state in states]
+        else:
+            id_states = new_responses + updated_responses + new_tags
+
+        missing_id_texts = list(OrderedDict(
+            (state['statement'].text, True)
+            for state, _ in id_states
+            if state['id'] is None
+        ))
+
+        if missing_id_texts:
+            statement_ids = self.get_ids(
+                session, statement_table, statement_table.c.text, missing_id_texts
+            )
+
+            for text in missing_id_texts:
+                self.bulk_statements[text]['id'] = statement_ids[text]
+
+        for state, values in new_responses:
+            values['statement_id'] = state['id']
+
+        for state, values in updated_responses:
+            values['response_statement_id'] = state['id']
+
+        if updated_statements:
+            session.execute(
+                statement_table.update().where(
+                    statement_table.c.text == bindparam('statement_text')
+                ).values(extra_data=bindparam('new_extra_data')),
+                updated_statements
+            )
+
+        if new_responses:
+            session.execute(response_table.insert(), [values for _, values in new_responses])
+
+        if updated_responses:
+            session.execute(
+                response_table.update().where(and_(
+                    response_table.c.statement_id == bindparam('response_statement_id'),
+                    response_table.c.text == bindparam('response_text')
+                )).values(occurrence=bindparam('new_occurrence')),
+                [values for _, values in updated_responses]
+            )
+
+        if new_tags:
+            tag_names = list(OrderedDict((tag, True) for _, tag in new_tags))
+            tag_ids = self.get_ids(session, tag_table, tag_table.c.name, tag_names)
+
+            missing_tag_names = [name for name in tag_names if name not in tag_ids]
+
+            if missing_tag_names:
+                session.execute(tag_table.insert(), [
+                    {'name': name} for name in missing_tag_names
+                ])
+                tag_ids.update(
+                    self.get_ids(session, tag_table, tag_table.c.name, missing_tag_names)
+                )
+
+            session.execute(tag_association_table.insert(), [
+                {'statement_id': state['id'], 'tag_id': tag_ids[tag]}
+                for state, tag in new_tags
+            ])
+
+        if self.extra_data_index_keys:
+            self.update_extra_data_index(session, [
+                (state['id'], state['statement'].extra_data) for state in states
+            ])
+
+        self._session_finish(session)
+
+        for state in states:
+            statement = state['statement']
+
+            state['exists'] = True
+            state['saved_responses'] = dict(
+                (response.text, response.occurrence) for response in statement.in_response_to
+            )
+            state['saved_tags'] = set(statement.tags)
+
+        self.bulk_updated.clear()
+
+    def get_ids(self, session, table, column, values, batch_size=500):
+        """
+        Return the id of each row of the table in which
+        the column has one of the given values.
+        """
+        ids = {}
+
+        for index in range(0, len(values), batch_size):
+            rows = session.execute(
+                table.select().with_only_columns([column, table.c.id]).where(
+                    column.in_(values[index:index + batch_size])
+                )
+            )
+            ids.update(dict(rows.fetchall()))
+
+        return ids
 
     def create_conversation(self):
         """
@@ -270,76 +976,107 @@ class SQLStorageAdapter(StorageAdapter):
         """
         Conversation = self.get_model('conversation')
 
-        session = self.Session()
+        session = self.get_session()
         conversation = Conversation()
 
         session.add(conversation)
         session.flush()
 
-        session.refresh(conversation)
         conversation_id = conversation.id
 
         session.commit()
         session.close()
 
+        if self.conversation_cache is not None:
+            self.conversation_cache.create(conversation_id)
+
         return conversation_id
 
     def add_to_conversation(self, conversation_id, statement, response):
         """
         Add the statement and response to the conversation.
         """
+        from chatterbot.ext.sqlalchemy_app.models import conversation_association_table
+
         Statement = self.get_model('statement')
-        Conversation = self.get_model('conversation')
 
-        session = self.Session()
-        conversation = session.query(Conversation).get(conversation_id)
+        texts = [statement.text, response.text]
 
-        statement_query = session.query(Statement).filter_by(
-            text=statement.text
-        ).first()
-        response_query = session.query(Statement).filter_by(
-            text=response.text
-        ).first()
+        session = self.get_session()
+        statement_ids = dict(
+            session.query(Statement.text, Statement.id).filter(Statement.text.in_(texts))
+        )
+        session.close()
 
         # Make sure the statements exist
-        if not statement_query:
-            self.update(statement)
-            statement_query = session.query(Statement).filter_by(
-                text=statement.text
-            ).first()
+        for _statement in (statement, response):
+            if _statement.text not in statement_ids:
+                self.update(_statement)
 
-        if not response_query:
-            self.update(response)
-            response_query = session.query(Statement).filter_by(
-                text=response.text
-            ).first()
+        session = self.get_session()
 
-        conversation.statements.append(statement_query)
-        conversation.statements.append(response_query)
+        if len(statement_ids) < len(set(texts)):
+            statement_ids = dict(
+                session.query(Statement.text, Statement.id).filter(Statement.text.in_(texts))
+            )
+
+        # Add the statements to the conversation without loading every statement in it
+        session.execute(conversation_association_table.insert(), [
+            {'conversation_id': conversation_id, 'statement_id': statement_ids[text]}
+            for text in texts
+        ])
 
-        session.add(conversation)
         self._session_finish(session)
+        self.clear_request_cache()
+
+        if self.conversation_cache is not None:
+            self.conversation_cache.add(conversation_id, statement, response)
 
     def get_latest_response(self, conversation_id):
         """
         Returns the latest response in a conversation if it exists.
         Returns None if a matching conversation cannot be found.
         """
+        return self.get_request_cached(
+            ('latest_response', conversation_id), self._get_latest_response, conversation_id
+        )
+
+    def _get_latest_response(self, conversation_id):
+        if self.conversation_cache is not None and conversation_id in self.conversation_cache:
+            statement_text = self.conversation_cache.get_latest_response_text(conversation_id)
+
+            if statement_text is None:
+                return None
+
+            return self.find(statement_text)
+
+        from sqlalchemy.orm import joinedload
+        from chatterbot.ext.sqlalchemy_app.models import conversation_association_table
+
         Statement = self.get_model('statement')
 
-        session = self.Session()
+        session = self.get_session()
         statement = None
 
-        statement_query = session.query(Statement).filter(
-            Statement.conversations.any(id=conversation_id)
-        ).order_by(Statement.id)
+        # The last two statements that were added to the conversation
+        statement_ids = [
+            row.statement_id for row in session.execute(
+                conversation_association_table.select().where(
+                    conversation_association_table.c.conversation_id == conversation_id
+                ).order_by(conversation_association_table.c.id.desc()).limit(2)
+            )
+        ]
 
-        if statement_query.count() >= 2:
-            statement = statement_query[-2].get_statement()
+        if statement_ids:
+            # Handle the case of the first statement in the list
+            statement_id = statement_ids[-1]
 
-        # Handle the case of the first statement in the list
-        elif statement_query.count() == 1:
-            statement = statement_query[0].get_statement()
+            record = session.query(Statement).options(
+                *self.get_statement_load_options(joinedload)
+            ).filter(Statement.id == statement_id).first()
+
+            if record:
+                statement = record.get_statement()
 
         session.close()
 
@@ -347,31 +1084,179 @@ class SQLStorageAdapter(StorageAdapter):
 
     def get_random(self):
         """
-        Returns a random statement from the database
+        Returns a random statement from the database.
+
+        A random id between the lowest and highest statement id is selected,
+        so that the statement is found with the primary key instead of by
+        scanning the table. If statements have been removed and no statement
+        has the selected id, another id is tried. The first statement after
+        the last id that was tried is returned if no statement is found.
         """
         import random
+        from sqlalchemy.orm import joinedload
+        from chatterbot import constants
 
         Statement = self.get_model('statement')
 
-        session = self.Session()
-        count = self.count()
-        if count < 1:
+        min_id, max_id = self.get_request_cached('id_range', self._get_id_range)
+
+        if max_id is None:
             raise self.EmptyDatabaseException()
 
-        rand = random.randrange(0, count)
-        stmt = session.query(Statement)[rand]
+        session = self.get_session()
+
+        query = session.query(Statement).options(
+            *self.get_statement_load_options(joinedload)
+        )
+
+        record = None
+
+        for _ in range(constants.RANDOM_STATEMENT_ATTEMPTS):
+            record = query.filter(Statement.id == random.randint(min_id, max_id)).first()
+
+            if record:
+                break
+        else:
+            record = query.filter(
+                Statement.id >= random.randint(min_id, max_id)
+            ).order_by(Statement.id).first()
 
-        statement = stmt.get_statement()
+        if record is None:
+            session.close()
+            raise self.EmptyDatabaseException()
+
+        statement = record.get_statement()
 
         session.close()
         return statement
 
+    def _get_id_range(self):
+        from sqlalchemy import func
+
+        Statement = self.get_model('statement')
+
+        session = self.get_session()
+
+        # Each bound is selected separately, so that it can be read from the
+        # primary key index by databases that would otherwise scan the table
+        id_range = session.query(
+            session.query(func.min(Statement.id)).as_scalar(),
+            session.query(func.max(Statement.id)).as_scalar()
+        ).one()
+
+        session.close()
+        return id_range
+
+    def get_response_statements(self):
+        """
+        Return only statements that are in response to another statement.
+        A statement must exist which lists the closest matching statement in the
+        in_response_to field. Otherwise, the logic adapter may find a closest
+        matching statement that does not have a known response.
+
+        The statements are selected by the database with the index of
+        the response text, rather than by loading every statement.
+        """
+        return list(self.iter_response_statements())
+
+    def load_candidate_index(self, candidate_index):
+        """
+        Populate the candidate index with the text of each statement and
+        response without building the full statement objects. The statements
+        are read in batches of filter_batch_size statements, along with the
+        text of the responses of each batch.
+        """
+        Statement = self.get_model('statement')
+        Response = self.get_model('response')
+
+        columns = [Statement.id, Statement.text]
+
+        # The extra data is only read if features are saved in it
+        if self.extra_data_functions:
+            columns.append(Statement.extra_data)
+
+        last_id = 0
+
+        while True:
+            session = self.get_session()
+
+            rows = session.query(*columns).filter(
+                Statement.id > last_id
+            ).order_by(Statement.id).limit(self.filter_batch_size).all()
+
+            responses = []
+
+            if rows:
+                responses = session.query(Response.statement_id, Response.text).filter(
+                    Response.statement_id > last_id,
+                    Response.statement_id <= rows[-1].id
+                ).order_by(Response.id).all()
+
+            session.close()
+
+            statement_texts = {}
+
+            for row in rows:
+                candidate_index.add_text(row.text, getattr(row, 'extra_data', None))
+                statement_texts[row.id] = row.text
+
+            for statement_id, response_text in responses:
+                candidate_index.add_response(statement_texts[statement_id], response_text)
+
+            if len(rows) < self.filter_batch_size:
+                break
+
+            last_id = rows[-1].id
+
+    def iter_response_statements(self, batch_size=1000):
+        """
+        Yield the statements that are in response to another statement,
+        in the order that they were created. The statements are read in
+        batches, so that only one batch is held in memory at a time.
+        """
+        from sqlalchemy import exists
+        from sqlalchemy.orm import selectinload
+
+        Statement = self.get_model('statement')
+        Response = self.get_model('response')
+
+        is_response = exists().where(Response.text == Statement.text)
+
+        last_id = 0
+
+        while True:
+            session = self.get_session()
+
+            records = session.query(Statement).options(
+                *self.get_statement_load_options(selectinload)
+            ).filter(
+                Statement.id > last_id, is_response
+            ).order_by(Statement.id).limit(batch_size).all()
+
+            statements = [record.get_statement() for record in records]
+
+            if records:
+                last_id = records[-1].id
+
+            session.close()
+
+            for statement in statements:
+                yield statement
+
+            if len(records) < batch_size:
+                break
+
     def drop(self):
         """
         Drop the database attached to a given adapter.
         """
         from chatterbot.ext.sqlalchemy_app.models import Base
         Base.metadata.drop_all(self.engine)
+        self.candidate_index = None
+        self.clear_request_cache()
+
+        if self.conversation_cache is not None:
+            self.conversation_cache.clear()
 
     def create(self):
         """
@@ -379,6 +1264,11 @@ class SQLStorageAdapter(StorageAdapter):
         """
         from chatterbot.ext.sqlalchemy_app.models import Base
         Base.metadata.create_all(self.engine)
+        self.candidate_index = None
+        self.clear_request_cache()
+
+        if self.conversation_cache is not None:
+            self.conversation_cache.clear()
 
     def _session_finish(self, session, statement_text=None):
         from sqlalchemy.exc import InvalidRequestError
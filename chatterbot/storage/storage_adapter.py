@@ -1,4 +1,5 @@
 import logging
+from threading import local
 
 
 class StorageAdapter(object):
@@ -16,6 +17,39 @@ class StorageAdapter(object):
         self.adapter_supports_queries = True
         self.base_query = None
 
+        # The in-memory index of response candidates is only used if the
+        # adapter keeps it up to date when statements are saved or removed.
+        # It is disabled by default because it is loaded once, so statements
+        # saved by other processes or adapters are not in the index.
+        self.adapter_supports_candidate_index = False
+        self.use_candidate_index = kwargs.get('use_candidate_index', False)
+        self.candidate_index = None
+        self.candidate_feature_functions = {}
+
+        # Functions that compute values to save in the extra data of each statement
+        self.extra_data_functions = {}
+
+        # The number of statements that are read at a time by filter_iter
+        self.filter_batch_size = kwargs.get('filter_batch_size', 1000)
+
+        # The extra data keys that statements can be filtered by with an index
+        self.extra_data_index_keys = list(kwargs.get('extra_data_index_keys', []))
+
+        # The state of the request that has been started in each thread
+        self.request_state = local()
+
+        # The text of the latest statements in each conversation, so that the
+        # latest response in a conversation can be found by its text
+        self.conversation_cache = None
+
+        conversation_cache = kwargs.get('conversation_cache')
+
+        if conversation_cache:
+            from chatterbot import utils
+
+            ConversationCache = utils.import_module(conversation_cache)
+            self.conversation_cache = ConversationCache(**kwargs)
+
     def get_model(self, model_name):
         """
         Return the model class for a given model name.
@@ -79,6 +113,17 @@ class StorageAdapter(object):
             'The `filter` method is not implemented by this adapter.'
         )
 
+    def filter_iter(self, **kwargs):
+        """
+        Return an iterator over the objects from the database that match the
+        same parameters as the filter method.
+
+        This method may be overridden by a child class to read the
+        objects in batches of filter_batch_size, so that only one batch
+        is held in memory at a time.
+        """
+        return iter(self.filter(**kwargs))
+
     def update(self, statement):
         """
         Modifies an entry in the database.
@@ -139,21 +184,195 @@ class StorageAdapter(object):
         This method may be overridden by a child class to provide more a
         efficient method to get these results.
         """
-        statement_list = self.filter()
-
         responses = set()
-        to_remove = list()
-        for statement in statement_list:
+        for statement in self.filter_iter():
             for response in statement.in_response_to:
                 responses.add(response.text)
-        for statement in statement_list:
-            if statement.text not in responses:
-                to_remove.append(statement)
 
-        for statement in to_remove:
-            statement_list.remove(statement)
+        return [
+            statement for statement in self.filter_iter() if statement.text in responses
+        ]
+
+    @property
+    def request_cache(self):
+        """
+        Values that are looked up more than once while responding to an input
+        statement, such as the number of statements, are cached for the
+        duration of the request and cleared when the database is modified.
+        This is None if a request has not been started in the current thread.
+        """
+        return getattr(self.request_state, 'cache', None)
+
+    @request_cache.setter
+    def request_cache(self, request_cache):
+        self.request_state.cache = request_cache
+
+    @property
+    def round_trips(self):
+        """
+        The number of queries that have been sent to the database from
+        the current thread since its current request was started.
+        """
+        return getattr(self.request_state, 'round_trips', 0)
+
+    @round_trips.setter
+    def round_trips(self, round_trips):
+        self.request_state.round_trips = round_trips
+
+    def start_request(self):
+        """
+        Start a unit of work that responds to a single input statement.
+        Lookups made during the request are cached until the request finishes.
+        """
+        self.request_cache = {}
+        self.round_trips = 0
+
+    def finish_request(self):
+        """
+        Finish the current unit of work. The number of round trips that were
+        made to the database during the request remains available in the
+        round_trips attribute until the next request is started.
+        """
+        self.request_cache = None
+
+    def start_bulk_update(self, write_batches=True):
+        """
+        Start buffering the statements that are updated, so that they can be
+        written to the database in large batches. Statements that are found
+        while updates are buffered include any buffered changes.
+
+        This method may be overridden by a child class that supports bulk
+        updates. By default each statement is written when it is updated.
+
+        :param write_batches: If False, the buffered updates are only written
+                              when flush_bulk_update or finish_bulk_update is
+                              called, rather than each time a batch is full.
+        :type write_batches: bool
+        """
+        pass
+
+    def flush_bulk_update(self):
+        """
+        Write any buffered updates to the database
+        and continue buffering updates.
+        """
+        pass
+
+    def finish_bulk_update(self):
+        """
+        Write any buffered updates to the database and stop buffering updates.
+        """
+        pass
+
+    def discard_bulk_update(self):
+        """
+        Discard any buffered updates that have not been written
+        to the database and stop buffering updates.
+        """
+        pass
+
+    def get_request_cached(self, key, function, *args):
+        """
+        Return the value cached under the key for the current request, calling
+        the function to compute it if the value is not already cached.
+        The function is always called when no request has been started.
+        """
+        if self.request_cache is None:
+            return function(*args)
+
+        if key not in self.request_cache:
+            self.request_cache[key] = function(*args)
+
+        return self.request_cache[key]
+
+    def clear_request_cache(self):
+        """
+        Clear the cached lookups of the current request.
+        This must be called whenever the database is modified.
+        """
+        if self.request_cache:
+            self.request_cache.clear()
+
+    def get_candidate_index(self):
+        """
+        Return the in-memory index of statements that are in response to
+        another statement. The index is loaded from the database the first
+        time it is requested. Returns None if the adapter does not support
+        a candidate index or if the index has been disabled.
+        """
+        if not (self.adapter_supports_candidate_index and self.use_candidate_index):
+            return None
+
+        if self.candidate_index is None:
+            from .candidate_index import CandidateIndex
+
+            candidate_index = CandidateIndex(dict(self.candidate_feature_functions))
+            self.load_candidate_index(candidate_index)
+            self.candidate_index = candidate_index
+
+        return self.candidate_index
+
+    def add_candidate_features(self, feature_functions):
+        """
+        Register functions that compute features of each indexed statement.
+        The features are computed once when a statement is added to the
+        candidate index, rather than each time the statement is compared.
+
+        :param feature_functions: A dictionary of feature names and functions
+                                  that take the text of a statement.
+        :type feature_functions: dict
+        """
+        self.candidate_feature_functions.update(feature_functions)
+
+        if self.candidate_index is not None:
+            self.candidate_index.add_feature_functions(feature_functions)
+
+    def add_extra_data_functions(self, extra_data_functions):
+        """
+        Register functions that compute features of a statement which are
+        saved in the statement's extra data when the statement is updated.
+        Each saved value is also used as the statement's feature in the
+        candidate index.
+
+        :param extra_data_functions: A dictionary of extra data keys and functions
+                                     that take the text of a statement.
+        :type extra_data_functions: dict
+        """
+        self.extra_data_functions.update(extra_data_functions)
+        self.add_candidate_features(extra_data_functions)
+
+    def add_computed_extra_data(self, statement):
+        """
+        Add the value of each registered extra data function
+        that the statement does not already have a value for.
+        """
+        for key, function in self.extra_data_functions.items():
+            if key not in statement.extra_data:
+                statement.add_extra_data(key, function(statement.text))
+
+    def load_candidate_index(self, candidate_index):
+        """
+        Populate the candidate index with the statements in the database.
+
+        This method may be overridden by a child class to provide a more
+        efficient method to load the statement and response text.
+        """
+        for statement in self.filter():
+            candidate_index.add(statement)
+
+    def get_response_candidates(self):
+        """
+        Return the statements that can be matched against an input statement.
+        If a candidate index is available, lightweight candidates holding
+        only the statement text and its precomputed features are returned
+        instead of full statement objects.
+        """
+        candidate_index = self.get_candidate_index()
+
+        if candidate_index is None:
+            return self.get_response_statements()
 
-        return statement_list
+        return candidate_index.get_candidates()
 
     class EmptyDatabaseException(Exception):
 
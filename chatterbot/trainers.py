@@ -15,6 +15,9 @@ class Trainer(object):
         self.logger = logging.getLogger(__name__)
         self.show_training_progress = kwargs.get('show_training_progress', True)
 
+        # Write the statements in large batches instead of one at a time
+        self.bulk_training = kwargs.get('bulk_training', True)
+
     def get_preprocessed_statement(self, input_statement):
         """
         Preprocess the input statement.
@@ -30,6 +33,41 @@ class Trainer(object):
         """
         raise self.TrainerInitializationException()
 
+    def start_bulk_training(self, write_batches=True):
+        """
+        Buffer the statements that are saved during training, if the storage
+        adapter supports it, so that they can be written in large batches.
+
+        :param write_batches: If False, the buffered statements are only
+                              written when the bulk training is flushed
+                              or finished.
+        """
+        if self.bulk_training:
+            self.chatbot.storage.start_bulk_update(write_batches=write_batches)
+
+    def flush_bulk_training(self):
+        """
+        Write any statements that have been buffered during training
+        and continue buffering statements.
+        """
+        if self.bulk_training:
+            self.chatbot.storage.flush_bulk_update()
+
+    def finish_bulk_training(self):
+        """
+        Write any statements that have been buffered during training.
+        """
+        if self.bulk_training:
+            self.chatbot.storage.finish_bulk_update()
+
+    def discard_bulk_training(self):
+        """
+        Discard any statements that have been buffered
+        during training and have not been written.
+        """
+        if self.bulk_training:
+            self.chatbot.storage.discard_bulk_update()
+
     def get_or_create(self, statement_text):
         """
         Return a statement if it exists.
@@ -62,13 +100,13 @@ class Trainer(object):
         def __str__(self):
             return repr(self.value)
 
-    def _generate_export_data(self):
-        result = []
-        for statement in self.chatbot.storage.filter():
+    def _iter_export_data(self):
+        for statement in self.chatbot.storage.filter_iter():
             for response in statement.in_response_to:
-                result.append([response.text, statement.text])
+                yield [response.text, statement.text]
 
-        return result
+    def _generate_export_data(self):
+        return list(self._iter_export_data())
 
     def export_for_training(self, file_path='./export.json'):
         """
@@ -76,9 +114,18 @@ class Trainer(object):
         train other chat bots.
         """
         import json
-        export = {'conversations': self._generate_export_data()}
+
+        # Each conversation is written as it is read, so that the
+        # export does not need to be held in memory
         with open(file_path, 'w+') as jsonfile:
-            json.dump(export, jsonfile, ensure_ascii=False)
+            jsonfile.write('{"conversations": [')
+
+            for index, conversation in enumerate(self._iter_export_data()):
+                if index:
+                    jsonfile.write(', ')
+                json.dump(conversation, jsonfile, ensure_ascii=False)
+
+            jsonfile.write(']}')
 
 
 class ListTrainer(Trainer):
@@ -94,22 +141,27 @@ class ListTrainer(Trainer):
         """
         previous_statement_text = None
 
-        for conversation_count, text in enumerate(conversation):
-            if self.show_training_progress:
-                utils.print_progress_bar(
-                    'List Trainer',
-                    conversation_count + 1, len(conversation)
-                )
+        self.start_bulk_training()
 
-            statement = self.get_or_create(text)
+        try:
+            for conversation_count, text in enumerate(conversation):
+                if self.show_training_progress:
+                    utils.print_progress_bar(
+                        'List Trainer',
+                        conversation_count + 1, len(conversation)
+                    )
 
-            if previous_statement_text:
-                statement.add_response(
-                    Response(previous_statement_text)
-                )
+                statement = self.get_or_create(text)
 
-            previous_statement_text = statement.text
-            self.chatbot.storage.update(statement)
+                if previous_statement_text:
+                    statement.add_response(
+                        Response(previous_statement_text)
+                    )
+
+                previous_statement_text = statement.text
+                self.chatbot.storage.update(statement)
+        finally:
+            self.finish_bulk_training()
 
 
 class ChatterBotCorpusTrainer(Trainer):
@@ -131,35 +183,45 @@ class ChatterBotCorpusTrainer(Trainer):
             if isinstance(corpus_paths[0], list):
                 corpus_paths = corpus_paths[0]
 
-        # Train the chat bot with each statement and response pair
-        for corpus_path in corpus_paths:
+        self.start_bulk_training()
+
+        try:
+            # Train the chat bot with each statement and response pair
+            for corpus_path in corpus_paths:
+                self.train_from_corpus_path(corpus_path)
+        finally:
+            self.finish_bulk_training()
 
-            corpora = self.corpus.load_corpus(corpus_path)
+    def train_from_corpus_path(self, corpus_path):
+        """
+        Train the chat bot with each conversation in the corpus files at a path.
+        """
+        corpora = self.corpus.load_corpus(corpus_path)
 
-            corpus_files = self.corpus.list_corpus_files(corpus_path)
-            for corpus_count, corpus in enumerate(corpora):
-                for conversation_count, conversation in enumerate(corpus):
+        corpus_files = self.corpus.list_corpus_files(corpus_path)
+        for corpus_count, corpus in enumerate(corpora):
+            for conversation_count, conversation in enumerate(corpus):
 
-                    if self.show_training_progress:
-                        utils.print_progress_bar(
-                            str(os.path.basename(corpus_files[corpus_count])) + ' Training',
-                            conversation_count + 1,
-                            len(corpus)
-                        )
+                if self.show_training_progress:
+                    utils.print_progress_bar(
+                        str(os.path.basename(corpus_files[corpus_count])) + ' Training',
+                        conversation_count + 1,
+                        len(corpus)
+                    )
 
-                    previous_statement_text = None
+                previous_statement_text = None
 
-                    for text in conversation:
-                        statement = self.get_or_create(text)
-                        statement.add_tags(corpus.categories)
+                for text in conversation:
+                    statement = self.get_or_create(text)
+                    statement.add_tags(corpus.categories)
 
-                        if previous_statement_text:
-                            statement.add_response(
-                                Response(previous_statement_text)
-                            )
+                    if previous_statement_text:
+                        statement.add_response(
+                            Response(previous_statement_text)
+                        )
 
-                        previous_statement_text = statement.text
-                        self.chatbot.storage.update(statement)
+                    previous_statement_text = statement.text
+                    self.chatbot.storage.update(statement)
 
 
 class TwitterTrainer(Trainer):
@@ -257,10 +319,82 @@ class TwitterTrainer(Trainer):
                 self.chatbot.storage.update(statement)
 
 
+def read_ubuntu_corpus_rows(lines):
+    """
+    Return a tuple with the text, date and time, speaker and addressed
+    speaker of each row in the lines of a dialog file from the
+    Ubuntu Dialog Corpus.
+    """
+    import csv
+
+    rows = []
+
+    for row in csv.reader(lines, delimiter='\t'):
+        if len(row) > 3:
+            rows.append((row[3], row[0], row[1], row[2]))
+
+    return rows
+
+
+def read_ubuntu_corpus_file(name, file_path):
+    """
+    Read the rows of an extracted dialog file.
+    This is run in the worker processes of the Ubuntu corpus trainer.
+
+    :returns: The name of the dialog file and its rows.
+    :rtype: tuple
+    """
+    with open(file_path, 'r', encoding='utf-8') as tsv:
+        return name, read_ubuntu_corpus_rows(tsv)
+
+
+def read_ubuntu_corpus_data(name, data):
+    """
+    Read the rows of a dialog file from its contents in the corpus archive.
+    This is run in the worker processes of the Ubuntu corpus trainer.
+
+    :returns: The name of the dialog file and its rows.
+    :rtype: tuple
+    """
+    import io
+
+    return name, read_ubuntu_corpus_rows(io.StringIO(data.decode('utf-8')))
+
+
 class UbuntuCorpusTrainer(Trainer):
     """
     Allow chatbots to be trained with the data from
     the Ubuntu Dialog Corpus.
+
+    The dialog files are read in a pool of worker processes while the
+    statements are saved to storage by the training process. The name of
+    each file that has been saved is recorded in a checkpoint file, so that
+    training can be stopped and later resumed from where it left off.
+
+    The statements of each file are buffered and are only written to storage
+    along with the files that finished training before them, at the same time
+    as the files are recorded in the checkpoint. If training is interrupted,
+    the statements that have not been written are discarded, and their files
+    are trained again when training is resumed. Without bulk training, each
+    file is recorded in the checkpoint as soon as it has been trained, and a
+    file that is interrupted is trained again in full.
+
+    :kwargs:
+        * *ubuntu_corpus_workers* (``int``) --
+          The number of worker processes that read the dialog files.
+          The files are read by the training process if this is 1.
+          Defaults to the number of processors.
+        * *ubuntu_corpus_checkpoint_path* (``str``) --
+          The file that the paths of the trained dialog files are recorded in.
+          Defaults to ``ubuntu_dialogs.checkpoint`` in the data directory.
+        * *ubuntu_corpus_checkpoint_interval* (``int``) --
+          The number of dialog files that are trained between each checkpoint.
+          The statements of these files are held in memory until the
+          checkpoint is saved when bulk training is used. Defaults to 1000.
+        * *ubuntu_corpus_extract* (``bool``) --
+          If False, the dialog files are read directly from the downloaded
+          archive instead of being extracted to the data directory first.
+          Defaults to True.
     """
 
     def __init__(self, storage, **kwargs):
@@ -280,6 +414,17 @@ class UbuntuCorpusTrainer(Trainer):
             self.data_directory, 'ubuntu_dialogs'
         )
 
+        self.workers = kwargs.get('ubuntu_corpus_workers', os.cpu_count() or 1)
+
+        self.checkpoint_path = kwargs.get(
+            'ubuntu_corpus_checkpoint_path',
+            os.path.join(self.data_directory, 'ubuntu_dialogs.checkpoint')
+        )
+
+        self.checkpoint_interval = kwargs.get('ubuntu_corpus_checkpoint_interval', 1000)
+
+        self.extract_corpus = kwargs.get('ubuntu_corpus_extract', True)
+
         # Create the data directory if it does not already exist
         if not os.path.exists(self.data_directory):
             os.makedirs(self.data_directory)
@@ -368,46 +513,185 @@ class UbuntuCorpusTrainer(Trainer):
 
         return True
 
-    def train(self):
-        import glob
-        import csv
+    def get_checkpoint(self):
+        """
+        Return the set of names of the dialog files that have already been
+        trained. The name of a dialog file is its path in the corpus archive.
+        """
+        if not os.path.exists(self.checkpoint_path):
+            return set()
 
-        # Download and extract the Ubuntu dialog corpus if needed
-        corpus_download_path = self.download(self.data_download_url)
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as checkpoint_file:
+            return set(line.rstrip('\n') for line in checkpoint_file if line.strip())
+
+    def save_checkpoint(self, names):
+        """
+        Record that the dialog files have been trained. The statements from
+        the files are written to storage before they are recorded.
+        """
+        if not names:
+            return
+
+        # Write any statements that are buffered for a bulk update
+        self.flush_bulk_training()
 
-        # Extract if the directory doesn not already exists
-        if not self.is_extracted(self.extracted_data_directory):
-            self.extract(corpus_download_path)
+        with open(self.checkpoint_path, 'a', encoding='utf-8') as checkpoint_file:
+            for name in names:
+                checkpoint_file.write(name + '\n')
+
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+
+    def get_extracted_files(self, checkpoint):
+        """
+        Return the name and path of each extracted dialog
+        file that is not in the checkpoint.
+        """
+        import glob
 
         extracted_corpus_path = os.path.join(
             self.extracted_data_directory,
             '**', '**', '*.tsv'
         )
 
-        for file in glob.iglob(extracted_corpus_path):
-            self.logger.info('Training from: {}'.format(file))
+        for file_path in glob.iglob(extracted_corpus_path):
+            name = os.path.relpath(file_path, self.extracted_data_directory).replace(os.sep, '/')
 
-            with open(file, 'r', encoding='utf-8') as tsv:
-                reader = csv.reader(tsv, delimiter='\t')
+            if name not in checkpoint:
+                yield name, file_path
 
-                previous_statement_text = None
+    def get_archive_files(self, file_path, checkpoint):
+        """
+        Return the name and contents of each dialog file in the corpus
+        archive that is not in the checkpoint. The archive is read as a
+        stream, so only one dialog file is held in memory at a time.
+        """
+        import tarfile
+
+        with tarfile.open(file_path, 'r|*') as tar:
+            for member in tar:
+                if member.isfile() and member.name.endswith('.tsv'):
+                    if member.name not in checkpoint:
+                        yield member.name, tar.extractfile(member).read()
+
+    def read_files(self, read_function, files):
+        """
+        Read the dialog files in the pool of worker processes. The rows of each
+        file are returned in the same order as the files, and only a limited
+        number of files are read ahead of the files being trained.
+
+        :param read_function: The function that reads the rows of a file.
+        :param files: The arguments to pass to the read function for each file.
+        """
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+
+        if self.workers <= 1:
+            for arguments in files:
+                yield read_function(*arguments)
+            return
 
-                for row in reader:
-                    if len(row) > 0:
-                        text = row[3]
-                        statement = self.get_or_create(text)
-                        print(text, len(row))
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = deque()
 
-                        statement.add_extra_data('datetime', row[0])
-                        statement.add_extra_data('speaker', row[1])
+            for arguments in files:
+                futures.append(executor.submit(read_function, *arguments))
 
-                        if row[2].strip():
-                            statement.add_extra_data('addressing_speaker', row[2])
+                if len(futures) >= self.workers * 4:
+                    yield futures.popleft().result()
+
+            while futures:
+                yield futures.popleft().result()
+
+    def train_from_rows(self, rows):
+        """
+        Train the chat bot with the rows of a dialog file, where each
+        row is a response to the row before it.
+        """
+        previous_statement_text = None
+
+        for text, date_time, speaker, addressing_speaker in rows:
+            statement = self.get_or_create(text)
 
-                        if previous_statement_text:
-                            statement.add_response(
-                                Response(previous_statement_text)
-                            )
+            statement.add_extra_data('datetime', date_time)
+            statement.add_extra_data('speaker', speaker)
+
+            if addressing_speaker.strip():
+                statement.add_extra_data('addressing_speaker', addressing_speaker)
+
+            if previous_statement_text:
+                statement.add_response(
+                    Response(previous_statement_text)
+                )
+
+            previous_statement_text = statement.text
+            self.chatbot.storage.update(statement)
+
+    def train(self):
+        import time
+
+        # Download the Ubuntu dialog corpus if needed
+        corpus_download_path = self.download(self.data_download_url)
+
+        checkpoint = self.get_checkpoint()
+
+        if checkpoint:
+            self.logger.info('Skipping {} files that have already been trained'.format(
+                len(checkpoint)
+            ))
+
+        if self.extract_corpus:
+            # Extract if the directory doesn not already exists
+            if not self.is_extracted(self.extracted_data_directory):
+                self.extract(corpus_download_path)
+
+            files = self.read_files(
+                read_ubuntu_corpus_file, self.get_extracted_files(checkpoint)
+            )
+        else:
+            files = self.read_files(
+                read_ubuntu_corpus_data, self.get_archive_files(corpus_download_path, checkpoint)
+            )
+
+        file_count = 0
+        row_count = 0
+        trained_names = []
+        start_time = time.time()
+
+        # Only write the statements of files that have finished training
+        self.start_bulk_training(write_batches=False)
+
+        try:
+            for name, rows in files:
+                self.train_from_rows(rows)
+
+                file_count += 1
+                row_count += len(rows)
+                trained_names.append(name)
+
+                if not self.bulk_training or len(trained_names) >= self.checkpoint_interval:
+                    self.save_checkpoint(trained_names)
+                    trained_names = []
+
+                if self.show_training_progress:
+                    sys.stdout.write('\rUbuntu Corpus Trainer: {} files, {} rows, {:.0f} rows/sec'.format(
+                        file_count, row_count, row_count / max(time.time() - start_time, 1e-6)
+                    ))
+                    sys.stdout.flush()
+        except BaseException:
+            # The statements of the interrupted file may have been buffered
+            # along with those of the files that are not yet in the checkpoint
+            self.discard_bulk_training()
+            raise
+
+        self.save_checkpoint(trained_names)
+        self.finish_bulk_training()
+
+        elapsed_time = time.time() - start_time
+
+        if self.show_training_progress:
+            sys.stdout.write('\n')
 
-                        previous_statement_text = statement.text
-                        self.chatbot.storage.update(statement)
+        self.logger.info('Trained {} rows from {} files in {:.1f} seconds ({:.0f} rows/sec)'.format(
+            row_count, file_count, elapsed_time, row_count / max(elapsed_time, 1e-6)
+        ))
@@ -23,6 +23,22 @@ class ChatBotTestCase(TestCase):
                 'Length {} is not equal to {}'.format(len(item), length)
             )
 
+    def set_response_candidates(self, statements):
+        """
+        Enable the candidate index of the chat bot's storage adapter
+        and load it from the statements instead of from the database.
+        """
+        from unittest.mock import MagicMock
+
+        self.chatbot.storage.use_candidate_index = True
+        self.chatbot.storage.candidate_index = None
+
+        def load_candidate_index(candidate_index):
+            for statement in statements:
+                candidate_index.add(statement)
+
+        self.chatbot.storage.load_candidate_index = MagicMock(side_effect=load_candidate_index)
+
     def get_kwargs(self):
         return {
             'input_adapter': 'chatterbot.input.VariableInputTypeAdapter',
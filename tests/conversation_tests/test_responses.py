@@ -6,3 +6,19 @@ class ResponseTests(TestCase):
 
     def setUp(self):
         self.response = Response("A test response.")
+
+    def test_created_at_defaults_to_now(self):
+        from datetime import datetime
+
+        self.assertIsInstance(self.response.created_at, datetime)
+
+    def test_created_at_string_is_parsed(self):
+        from datetime import datetime
+
+        response = Response('Hi', created_at='2018-01-02T03:04:05')
+
+        self.assertEqual(response.created_at, datetime(2018, 1, 2, 3, 4, 5))
+        self.assertEqual(response.serialize()['created_at'], '2018-01-02T03:04:05')
+
+    def test_responses_do_not_have_attribute_dictionaries(self):
+        self.assertFalse(hasattr(self.response, '__dict__'))
@@ -83,3 +83,45 @@ class StatementTests(TestCase):
     def test_add_non_response(self):
         with self.assertRaises(Statement.InvalidTypeException):
             self.statement.add_response(Statement("Blah"))
+
+    def test_statements_do_not_have_attribute_dictionaries(self):
+        self.assertFalse(hasattr(self.statement, '__dict__'))
+
+    def test_equal_text_is_shared(self):
+        text = ''.join(['A test', ' statement.'])
+
+        self.assertIs(Statement(text).text, self.statement.text)
+        self.assertIs(Response(text).text, self.statement.text)
+
+    def test_response_list_is_a_list(self):
+        statement = Statement('Hi', in_response_to=[Response('Hello')])
+
+        self.assertIsInstance(statement.in_response_to, list)
+        self.assertEqual(statement.in_response_to, [Response('Hello')])
+        self.assertIn('Hello', statement.in_response_to)
+        self.assertNotIn('Goodbye', statement.in_response_to)
+
+    def test_remove_response_after_list_is_changed(self):
+        self.statement.in_response_to.append(Response('A'))
+        self.statement.in_response_to.insert(0, Response('B'))
+        del self.statement.in_response_to[1]
+
+        self.assertFalse(self.statement.remove_response('A'))
+        self.assertTrue(self.statement.remove_response('B'))
+        self.assertEqual(self.statement.in_response_to, [])
+
+    def test_remove_duplicate_response(self):
+        self.statement.in_response_to = [Response('A', occurrence=1), Response('A', occurrence=2)]
+
+        self.statement.remove_response('A')
+
+        self.assertEqual(self.statement.get_response_count(Statement('A')), 2)
+
+    def test_response_list_can_be_pickled(self):
+        import pickle
+
+        self.statement.add_response(Response('A'))
+
+        statement = pickle.loads(pickle.dumps(self.statement))
+
+        self.assertEqual(statement.get_response_count(Statement('A')), 1)
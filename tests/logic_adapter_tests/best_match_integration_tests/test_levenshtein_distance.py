@@ -33,7 +33,7 @@ class BestMatchLevenshteinDistanceTestCase(ChatBotTestCase):
             Statement('Yuck, black licorice jelly beans.', in_response_to=[Response('What is the meaning of life?')]),
             Statement('I hear you are going on a quest?', in_response_to=[Response('Who do you love?')]),
         ]
-        self.adapter.chatbot.storage.filter = MagicMock(return_value=possible_choices)
+        self.set_response_candidates(possible_choices)
 
         statement = Statement('What is your quest?')
 
@@ -45,7 +45,7 @@ class BestMatchLevenshteinDistanceTestCase(ChatBotTestCase):
         possible_choices = [
             Statement('What is your quest?', in_response_to=[Response('What is your quest?')])
         ]
-        self.adapter.chatbot.storage.filter = MagicMock(return_value=possible_choices)
+        self.set_response_candidates(possible_choices)
 
         statement = Statement('What is your quest?')
         match = self.adapter.get(statement)
@@ -56,7 +56,7 @@ class BestMatchLevenshteinDistanceTestCase(ChatBotTestCase):
         possible_choices = [
             Statement('xxyy', in_response_to=[Response('xxyy')])
         ]
-        self.adapter.chatbot.storage.filter = MagicMock(return_value=possible_choices)
+        self.set_response_candidates(possible_choices)
 
         statement = Statement('wwxx')
         match = self.adapter.get(statement)
@@ -67,7 +67,7 @@ class BestMatchLevenshteinDistanceTestCase(ChatBotTestCase):
         possible_choices = [
             Statement('xxx', in_response_to=[Response('xxx')])
         ]
-        self.adapter.chatbot.storage.filter = MagicMock(return_value=possible_choices)
+        self.set_response_candidates(possible_choices)
 
         statement = Statement('yyy')
         match = self.adapter.get(statement)
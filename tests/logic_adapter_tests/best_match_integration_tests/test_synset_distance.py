@@ -34,9 +34,7 @@ class BestMatchSynsetDistanceTestCase(ChatBotTestCase):
             Statement('This is a beautiful swamp.', in_response_to=[Response('This is a beautiful swamp.')]),
             Statement('It smells like a swamp.', in_response_to=[Response('It smells like a swamp.')])
         ]
-        self.adapter.chatbot.storage.filter = MagicMock(
-            return_value=possible_choices
-        )
+        self.set_response_candidates(possible_choices)
 
         statement = Statement('This is a lovely swamp.')
         match = self.adapter.get(statement)
@@ -25,3 +25,199 @@ class BestMatchTestCase(ChatBotTestCase):
 
         with self.assertRaises(BestMatch.EmptyDatasetException):
             self.adapter.get(statement)
+
+    def test_candidates_are_not_modified(self):
+        """
+        The confidence of a match should not be set on the candidates in the
+        index, because they are shared by every request.
+        """
+        from chatterbot.conversation import Response
+
+        self.set_response_candidates([
+            Statement('What is your quest?', in_response_to=[Response('What is your name?')]),
+            Statement('What is your name?', in_response_to=[Response('What is your quest?')])
+        ])
+
+        candidates = self.chatbot.storage.get_response_candidates()
+
+        first_match = self.adapter.get(Statement('What is your quest?'))
+        second_match = self.adapter.get(Statement('What is your favorite color?'))
+
+        self.assertEqual(first_match.confidence, 1)
+        self.assertLess(second_match.confidence, 1)
+        self.assertIsNot(first_match, candidates[0])
+        self.assertFalse(any(hasattr(candidate, 'confidence') for candidate in candidates))
+
+
+class ClosestMatchComparisonMixin(object):
+    """
+    Tests that a BestMatch method which finds the closest match in another
+    way selects the same match as comparing each statement in turn.
+    The test case sets the method to test as get_closest_match_method.
+    """
+
+    inputs = (
+        'What is your quest?', 'the cat', 'a', 'Where is the post office?', 'zzz', ''
+    )
+
+    def get_candidates(self, count):
+        """
+        Return the given number of candidates made up of words
+        that are picked in the same order on every run.
+        """
+        from random import Random
+        from chatterbot.storage.candidate_index import Candidate
+
+        words = ('what', 'is', 'your', 'quest', 'the', 'post', 'office', 'a', 'cat')
+        random = Random(0)
+
+        return [
+            Candidate(' '.join(random.choice(words) for _ in range(random.randint(1, 6))))
+            for _ in range(count)
+        ]
+
+    def assertSameClosestMatch(self, input_statement, statement_list):
+        expected, expected_confidence = self.adapter.get_closest_match(input_statement, statement_list)
+
+        get_closest_match = getattr(self.adapter, self.get_closest_match_method)
+        match, confidence = get_closest_match(input_statement, statement_list)
+
+        self.assertEqual(match.text, expected.text)
+        self.assertEqual(confidence, expected_confidence)
+
+    def test_same_match_as_exhaustive_comparison(self):
+        for text in self.inputs:
+            self.assertSameClosestMatch(Statement(text), self.candidates)
+
+
+class BestMatchPrunedComparisonTestCase(ClosestMatchComparisonMixin, ChatBotTestCase):
+    """
+    Unit tests for BestMatch comparisons that skip statements
+    which cannot be a closer match.
+    """
+
+    get_closest_match_method = 'get_closest_match_pruned'
+
+    def setUp(self):
+        super(BestMatchPrunedComparisonTestCase, self).setUp()
+
+        self.adapter = BestMatch(prune_comparisons=True)
+        self.adapter.set_chatbot(self.chatbot)
+
+        self.candidates = self.get_candidates(200)
+
+    def test_comparisons_are_skipped(self):
+        self.adapter.get_closest_match_pruned(Statement('the post office'), self.candidates)
+
+        self.assertGreater(self.adapter.comparisons_skipped, 0)
+
+    def test_stops_at_perfect_match(self):
+        from chatterbot.storage.candidate_index import Candidate
+
+        candidates = [Candidate('Hello'), Candidate('Hi'), Candidate('Hey there')]
+
+        match, confidence = self.adapter.get_closest_match_pruned(Statement('Hello'), candidates)
+
+        self.assertEqual(match, 'Hello')
+        self.assertEqual(confidence, 1)
+        self.assertEqual(self.adapter.comparisons_skipped, 2)
+
+
+class BestMatchParallelComparisonTestCase(ClosestMatchComparisonMixin, ChatBotTestCase):
+    """
+    Unit tests for BestMatch comparisons that are
+    made in a pool of worker processes.
+    """
+
+    get_closest_match_method = 'get_closest_match_parallel'
+
+    def setUp(self):
+        super(BestMatchParallelComparisonTestCase, self).setUp()
+
+        self.adapter = BestMatch(parallel_workers=3, parallel_minimum_statements=10)
+        self.adapter.set_chatbot(self.chatbot)
+
+        self.candidates = self.get_candidates(100)
+
+    def tearDown(self):
+        if self.adapter.comparison_pool is not None:
+            self.adapter.comparison_pool.shutdown()
+
+        super(BestMatchParallelComparisonTestCase, self).tearDown()
+
+    def test_close_stops_comparison_pool(self):
+        self.adapter.get_closest_match_parallel(Statement('the cat'), self.candidates)
+        pool = self.adapter.comparison_pool
+
+        self.chatbot.logic.adapters = [self.adapter]
+        self.chatbot.close()
+
+        self.assertIsNone(self.adapter.comparison_pool)
+        self.assertEqual(pool.executors, [])
+
+    def test_use_comparison_pool(self):
+        self.assertTrue(self.adapter.use_comparison_pool(self.candidates))
+        self.assertFalse(self.adapter.use_comparison_pool(self.candidates[:5]))
+
+    def test_shards_are_loaded_once(self):
+        self.adapter.get_closest_match_parallel(Statement('the cat'), self.candidates)
+        pool = self.adapter.comparison_pool
+
+        self.adapter.get_closest_match_parallel(Statement('a cat'), self.candidates)
+
+        self.assertIs(pool.statement_list, self.candidates)
+        self.assertEqual(len(pool.executors), 3)
+
+    def test_learning_a_statement_only_sends_the_change(self):
+        from chatterbot.conversation import Response
+        from chatterbot.storage.candidate_index import CandidateIndex
+
+        index = CandidateIndex()
+        index.add(Statement('Hello'))
+
+        for candidate in self.candidates:
+            index.add(Statement(candidate.text))
+            index.add(Statement('Hello', in_response_to=[Response(candidate.text)]))
+
+        self.adapter.chatbot.storage.candidate_index = index
+
+        self.adapter.get_closest_match_parallel(Statement('the cat'), index.get_candidates())
+        pool = self.adapter.comparison_pool
+
+        pool.load_shards = MagicMock(wraps=pool.load_shards)
+        pool.update_shards = MagicMock(wraps=pool.update_shards)
+
+        index.add(Statement('the big cat'))
+        index.add(Statement('Hello', in_response_to=[Response('the big cat')]))
+        index.remove(self.candidates[0].text)
+
+        self.assertSameClosestMatch(Statement('the big cat'), index.get_candidates())
+
+        self.assertEqual(pool.load_shards.call_count, 0)
+        self.assertEqual(pool.update_shards.call_count, 1)
+        self.assertEqual(pool.version, index.version)
+
+    def test_shards_are_loaded_again_after_index_is_cleared(self):
+        from chatterbot.conversation import Response
+        from chatterbot.storage.candidate_index import CandidateIndex
+
+        index = CandidateIndex()
+
+        for candidate in self.candidates:
+            index.add(Statement('Hello', in_response_to=[Response(candidate.text)]))
+            index.add(Statement(candidate.text))
+
+        self.adapter.chatbot.storage.candidate_index = index
+
+        self.adapter.get_closest_match_parallel(Statement('the cat'), index.get_candidates())
+        pool = self.adapter.comparison_pool
+        pool.load_shards = MagicMock(wraps=pool.load_shards)
+
+        index.clear()
+        index.add(Statement('Hello', in_response_to=[Response('a cat')]))
+        index.add(Statement('a cat'))
+
+        match, confidence = self.adapter.get_closest_match_parallel(Statement('the cat'), index.get_candidates())
+
+        self.assertEqual(pool.load_shards.call_count, 1)
+        self.assertEqual(match.text, 'a cat')
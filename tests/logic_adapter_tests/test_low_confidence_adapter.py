@@ -1,4 +1,3 @@
-from unittest.mock import MagicMock
 from chatterbot.logic import LowConfidenceAdapter
 from chatterbot.conversation import Statement, Response
 from tests.base_case import ChatBotTestCase
@@ -36,7 +35,7 @@ class LowConfidenceAdapterTestCase(ChatBotTestCase):
                 Response('Who do you love?')
             ]),
         ]
-        self.adapter.chatbot.storage.filter = MagicMock(return_value=possible_choices)
+        self.set_response_candidates(possible_choices)
 
     def test_high_confidence(self):
         """
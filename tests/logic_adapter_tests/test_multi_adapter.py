@@ -28,6 +28,26 @@ class TestAdapterC(LogicAdapter):
         return response
 
 
+class TestAdapterD(LogicAdapter):
+
+    def process(self, statement):
+        response = Statement('Good evening.')
+        response.confidence = 1
+        return response
+
+
+class SlowTestAdapter(LogicAdapter):
+
+    def process(self, statement):
+        import time
+
+        time.sleep(1)
+
+        response = Statement('Good afternoon.')
+        response.confidence = 1
+        return response
+
+
 class MultiLogicAdapterTestCase(ChatBotTestCase):
 
     def setUp(self):
@@ -106,3 +126,121 @@ class MultiLogicAdapterTestCase(ChatBotTestCase):
         # Test that all sub adapters have the chatbot set
         for sub_adapter in adapter.adapters:
             self.assertEqual(sub_adapter.chatbot, self.chatbot)
+
+    def test_prepare(self):
+        from unittest.mock import MagicMock
+
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterA')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterB')
+
+        self.adapter.adapters[0].compare_statements = MagicMock()
+        self.adapter.adapters[0].compare_statements.prepare = MagicMock(
+            return_value={'prepare_wordnet': 0.5}
+        )
+        self.adapter.adapters[1].compare_statements = MagicMock(spec=lambda a, b: 0)
+
+        durations = self.adapter.prepare()
+
+        self.assertEqual(durations, {'prepare_wordnet': 0.5})
+
+    def test_confidence_threshold_skips_remaining_adapters(self):
+        from unittest.mock import MagicMock
+
+        self.adapter.confidence_threshold = 1
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterD')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+        self.adapter.adapters[1].process = MagicMock()
+
+        statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(statement, 'Good evening.')
+        self.assertEqual(statement.confidence, 1)
+        self.assertFalse(self.adapter.adapters[1].process.called)
+
+    def test_confidence_threshold_not_reached(self):
+        self.adapter.confidence_threshold = 1
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterA')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+
+        statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(statement, 'Good night.')
+
+    def test_workers_select_in_adapter_order(self):
+        self.adapter.workers = 3
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterA')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterB')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+
+        statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(statement.confidence, 0.5)
+        self.assertEqual(statement, 'Good morning.')
+
+    def test_workers_check_confidence_threshold_in_adapter_order(self):
+        """
+        The response of an earlier logic adapter should be selected even
+        when a later logic adapter reaches the threshold before it returns.
+        """
+        self.adapter.workers = 2
+        self.adapter.confidence_threshold = 0.5
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.SlowTestAdapter')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+
+        statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(statement, 'Good afternoon.')
+        self.assertEqual(statement.confidence, 1)
+
+    def test_adapter_timeout(self):
+        import time
+
+        self.adapter.add_adapter(
+            'tests.logic_adapter_tests.test_multi_adapter.SlowTestAdapter', process_timeout=0.1
+        )
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+
+        start_time = time.time()
+        statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertLess(time.time() - start_time, 0.9)
+        self.assertEqual(statement, 'Good night.')
+
+    def test_every_adapter_timed_out(self):
+        self.adapter.adapter_timeout = 0.1
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.SlowTestAdapter')
+
+        with self.assertRaises(MultiLogicAdapter.EmptyDatasetException):
+            self.adapter.process(Statement('Howdy!'))
+
+    def test_one_worker_runs_adapters_in_turn(self):
+        self.adapter.workers = 1
+        self.adapter.adapter_timeout = 0.1
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterA')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+
+        statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(statement, 'Good night.')
+        self.assertIsNone(self.adapter.executor)
+
+    def test_close_stops_threads(self):
+        self.adapter.workers = 2
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterA')
+        self.adapter.add_adapter('tests.logic_adapter_tests.test_multi_adapter.TestAdapterC')
+
+        self.adapter.process(Statement('Howdy!'))
+        executor = self.adapter.executor
+
+        self.adapter.close()
+
+        self.assertIsNone(self.adapter.executor)
+
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+
+        # The threads are started again when they are needed
+        statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(statement, 'Good night.')
+        self.adapter.close()
@@ -0,0 +1,98 @@
+from unittest import TestCase
+from chatterbot.conversation import Statement, Response
+from chatterbot.storage.candidate_index import CandidateIndex
+
+
+class CandidateIndexTestCase(TestCase):
+
+    def setUp(self):
+        super(CandidateIndexTestCase, self).setUp()
+        self.index = CandidateIndex()
+
+    def test_statement_without_responses_is_not_a_candidate(self):
+        self.index.add(Statement('Hello'))
+
+        self.assertEqual(len(self.index), 0)
+
+    def test_statement_that_is_a_response_is_a_candidate(self):
+        self.index.add(Statement('Hello'))
+        self.index.add(Statement('Hi', in_response_to=[Response('Hello')]))
+
+        self.assertEqual(len(self.index), 1)
+        self.assertIn('Hello', self.index.get_candidates())
+
+    def test_response_added_before_statement(self):
+        self.index.add(Statement('Hi', in_response_to=[Response('Hello')]))
+        self.index.add(Statement('Hello'))
+
+        self.assertIn('Hello', self.index.get_candidates())
+
+    def test_candidates_keep_storage_order(self):
+        self.index.add(Statement('B', in_response_to=[Response('A')]))
+        self.index.add(Statement('A', in_response_to=[Response('B')]))
+
+        candidates = [candidate.text for candidate in self.index.get_candidates()]
+
+        self.assertEqual(candidates, ['B', 'A'])
+
+    def test_remove_statement(self):
+        self.index.add(Statement('Hello'))
+        self.index.add(Statement('Hi', in_response_to=[Response('Hello')]))
+
+        self.index.remove('Hello')
+
+        self.assertEqual(len(self.index), 0)
+
+    def test_remove_statement_removes_its_responses(self):
+        self.index.add(Statement('Hello'))
+        self.index.add(Statement('Hi', in_response_to=[Response('Hello')]))
+
+        self.index.remove('Hi')
+
+        self.assertEqual(len(self.index), 0)
+
+    def test_response_referenced_twice(self):
+        self.index.add(Statement('Hello'))
+        self.index.add(Statement('Hi', in_response_to=[Response('Hello')]))
+        self.index.add(Statement('Hey', in_response_to=[Response('Hello')]))
+
+        self.index.remove_response('Hi', 'Hello')
+
+        self.assertIn('Hello', self.index.get_candidates())
+
+    def test_feature_is_computed_once(self):
+        self.index.add(Statement('Hello'))
+        self.index.add(Statement('Hi', in_response_to=[Response('Hello')]))
+        candidate = self.index.get_candidates()[0]
+        calls = []
+
+        def lowercase(text):
+            calls.append(text)
+            return text.lower()
+
+        candidate.get_feature('lowercase', lowercase)
+        value = candidate.get_feature('lowercase', lowercase)
+
+        self.assertEqual(value, 'hello')
+        self.assertEqual(len(calls), 1)
+
+    def test_get_changes(self):
+        self.index.add(Statement('Hello'))
+        version = self.index.version
+
+        self.index.add(Statement('Hi', in_response_to=[Response('Hello')]))
+        self.index.remove('Hello')
+
+        changes = self.index.get_changes(version)
+
+        self.assertEqual(changes, [('add', 0, 'Hello'), ('remove', 0, 'Hello')])
+        self.assertEqual(self.index.get_changes(self.index.version), [])
+
+    def test_get_changes_after_clear(self):
+        self.index.add(Statement('Hi', in_response_to=[Response('Hello')]))
+        version = self.index.version
+
+        self.index.clear()
+
+        self.assertIsNone(self.index.get_changes(version))
+        self.assertIsNone(self.index.get_changes(None))
@@ -0,0 +1,43 @@
+from unittest import TestCase
+from chatterbot.conversation import Statement
+from chatterbot.storage.conversation_cache import ConversationCache
+
+
+class ConversationCacheTestCase(TestCase):
+
+    def setUp(self):
+        super(ConversationCacheTestCase, self).setUp()
+        self.cache = ConversationCache()
+
+    def test_conversation_not_cached(self):
+        self.assertNotIn(1, self.cache)
+
+    def test_latest_response_of_new_conversation(self):
+        self.cache.create(1)
+
+        self.assertIn(1, self.cache)
+        self.assertIsNone(self.cache.get_latest_response_text(1))
+
+    def test_latest_response(self):
+        self.cache.create(1)
+        self.cache.add(1, Statement('A'), Statement('B'))
+        self.cache.add(1, Statement('B'), Statement('C'))
+
+        self.assertEqual(self.cache.get_latest_response_text(1), 'B')
+
+    def test_add_to_conversation_that_is_not_cached(self):
+        self.cache.add(1, Statement('C'), Statement('D'))
+
+        self.assertEqual(self.cache.get_latest_response_text(1), 'C')
+
+    def test_limit_removes_least_recently_used_conversation(self):
+        cache = ConversationCache(conversation_cache_limit=2)
+
+        cache.create(1)
+        cache.create(2)
+        cache.get_latest_response_text(1)
+        cache.create(3)
+
+        self.assertIn(1, cache)
+        self.assertNotIn(2, cache)
+        self.assertIn(3, cache)
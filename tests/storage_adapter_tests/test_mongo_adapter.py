@@ -483,3 +483,42 @@ class MongoOrderingTestCase(MongoAdapterTestCase):
         self.assertEqual(len(results), 2)
         self.assertEqual(results[0], statement_a)
         self.assertEqual(results[1], statement_b)
+
+
+class MongoAdapterModelTestCase(TestCase):
+    """
+    Tests for the model classes returned by the adapter
+    that do not require a running mongo server.
+    """
+
+    def test_get_statement_model_does_not_modify_class(self):
+        from unittest.mock import MagicMock
+
+        adapter = MagicMock()
+
+        StatementModel = MongoDatabaseAdapter.get_statement_model(adapter)
+        ResponseModel = MongoDatabaseAdapter.get_response_model(adapter)
+
+        statement = StatementModel('Hello')
+        response = ResponseModel('Hi')
+
+        self.assertIsNone(statement.storage)
+        self.assertEqual(response.text, 'Hi')
+        self.assertNotIn('storage', vars(ResponseModel))
+
+    def test_mongo_to_object_sets_storage_on_instance(self):
+        from unittest.mock import MagicMock
+
+        adapter = MagicMock()
+        adapter.get_model.side_effect = lambda name: {
+            'statement': MongoDatabaseAdapter.get_statement_model(adapter),
+            'response': MongoDatabaseAdapter.get_response_model(adapter)
+        }[name]
+        adapter.deserialize_responses.return_value = []
+
+        statement = MongoDatabaseAdapter.mongo_to_object(
+            adapter, {'text': 'Hello'}
+        )
+
+        self.assertEqual(statement.storage, adapter)
+        self.assertIsNone(Statement('Hi').storage)
@@ -1,3 +1,4 @@
+from unittest.mock import MagicMock
 from unittest import TestCase
 from chatterbot.conversation import Statement, Response
 from chatterbot.storage.sql_storage import SQLStorageAdapter
@@ -157,6 +158,29 @@ class SQLStorageAdapterTestCase(SQLAlchemyAdapterTestCase):
         random_statement = self.adapter.get_random()
         self.assertEqual(random_statement.text, statement.text)
 
+    def test_get_random_empty_database(self):
+        with self.assertRaises(SQLStorageAdapter.EmptyDatabaseException):
+            self.adapter.get_random()
+
+    def test_get_random_after_statements_are_removed(self):
+        for text in ['A', 'B', 'C', 'D', 'E']:
+            self.adapter.update(Statement(text))
+
+        self.adapter.remove('A')
+        self.adapter.remove('C')
+        self.adapter.remove('E')
+
+        random_texts = set(self.adapter.get_random().text for _ in range(50))
+
+        self.assertEqual(random_texts, {'B', 'D'})
+
+    def test_get_random_returns_nested_responses(self):
+        self.adapter.update(Statement('Yes', in_response_to=[Response('Is it?')]))
+
+        random_statement = self.adapter.get_random()
+
+        self.assertEqual(len(random_statement.in_response_to), 1)
+
     def test_find_returns_nested_responses(self):
         response_list = [
             Response("Yes"),
@@ -256,6 +280,216 @@ class SQLStorageAdapterTestCase(SQLAlchemyAdapterTestCase):
         self.assertIn("This is a phone.", responses)
         self.assertIn("A what?", responses)
 
+    def test_iter_response_statements_in_batches(self):
+        self.adapter.update(Statement("A", in_response_to=[Response("B")]))
+        self.adapter.update(Statement("B", in_response_to=[Response("C")]))
+        self.adapter.update(Statement("C", in_response_to=[Response("A")]))
+        self.adapter.update(Statement("D", in_response_to=[Response("A")]))
+
+        responses = list(self.adapter.iter_response_statements(batch_size=2))
+
+        self.assertEqual([statement.text for statement in responses], ["A", "B", "C"])
+        self.assertEqual(responses[2].in_response_to, [Response("A")])
+
+    def test_get_response_statements_without_responses(self):
+        self.adapter.update(Statement("This is a phone."))
+
+        self.assertEqual(self.adapter.get_response_statements(), [])
+
+    def test_update_saves_computed_extra_data(self):
+        self.addCleanup(setattr, self.adapter, 'extra_data_functions', {})
+        self.addCleanup(setattr, self.adapter, 'candidate_feature_functions', {})
+
+        self.adapter.add_extra_data_functions({'length': len})
+
+        self.adapter.update(Statement("Hello"))
+
+        statement = self.adapter.find("Hello")
+
+        self.assertEqual(statement.extra_data['length'], 5)
+
+    def test_request_caches_count(self):
+        self.adapter.update(Statement("Hello"))
+
+        self.adapter.start_request()
+        self.addCleanup(self.adapter.finish_request)
+
+        self.assertEqual(self.adapter.count(), 1)
+        round_trips = self.adapter.round_trips
+
+        self.assertEqual(self.adapter.count(), 1)
+        self.assertEqual(self.adapter.round_trips, round_trips)
+
+        self.adapter.update(Statement("Hi"))
+
+        self.assertEqual(self.adapter.count(), 2)
+
+    def test_request_caches_latest_response(self):
+        conversation_id = self.adapter.create_conversation()
+
+        self.adapter.start_request()
+        self.addCleanup(self.adapter.finish_request)
+
+        self.adapter.add_to_conversation(conversation_id, Statement("Hi"), Statement("Hello"))
+
+        statement = self.adapter.get_latest_response(conversation_id)
+        round_trips = self.adapter.round_trips
+
+        self.assertEqual(self.adapter.get_latest_response(conversation_id), statement)
+        self.assertEqual(self.adapter.round_trips, round_trips)
+        self.assertEqual(statement.text, "Hi")
+
+    def test_conversation_cache_disabled_by_default(self):
+        self.assertIsNone(self.adapter.conversation_cache)
+
+    def test_get_latest_response_from_conversation_cache(self):
+        adapter = SQLStorageAdapter(
+            database_uri=None,
+            conversation_cache='chatterbot.storage.conversation_cache.ConversationCache'
+        )
+
+        conversation_id = adapter.create_conversation()
+        adapter.add_to_conversation(conversation_id, Statement("Hi"), Statement("Hello"))
+
+        self.assertIn(conversation_id, adapter.conversation_cache)
+        self.assertEqual(adapter.get_latest_response(conversation_id).text, "Hi")
+
+    def test_conversation_cache_hit_matches_miss(self):
+        adapter = SQLStorageAdapter(
+            database_uri=None,
+            conversation_cache='chatterbot.storage.conversation_cache.ConversationCache'
+        )
+
+        conversation_id = adapter.create_conversation()
+        adapter.add_to_conversation(conversation_id, Statement("Hi"), Statement("Hello"))
+
+        # The statement is changed after it was added to the conversation
+        adapter.update(Statement("Hi", in_response_to=[Response("Hey")]))
+
+        hit = adapter.get_latest_response(conversation_id)
+        adapter.conversation_cache.clear()
+        miss = adapter.get_latest_response(conversation_id)
+
+        self.assertEqual(hit.text, miss.text)
+        self.assertEqual(
+            [response.text for response in hit.in_response_to],
+            [response.text for response in miss.in_response_to]
+        )
+        self.assertEqual(len(hit.in_response_to), 1)
+
+    def test_conversation_cache_of_new_conversation(self):
+        adapter = SQLStorageAdapter(
+            database_uri=None,
+            conversation_cache='chatterbot.storage.conversation_cache.ConversationCache'
+        )
+
+        conversation_id = adapter.create_conversation()
+
+        self.assertIsNone(adapter.get_latest_response(conversation_id))
+
+    def test_finish_request(self):
+        self.adapter.start_request()
+        self.adapter.count()
+        self.adapter.finish_request()
+
+        self.assertIsNone(self.adapter.request_cache)
+        self.assertIsNone(self.adapter.request_connection)
+        self.assertGreater(self.adapter.round_trips, 0)
+
+
+class SQLStorageAdapterCandidateIndexTestCase(SQLAlchemyAdapterTestCase):
+
+    def setUp(self):
+        super(SQLStorageAdapterCandidateIndexTestCase, self).setUp()
+        self.adapter.use_candidate_index = True
+        self.addCleanup(setattr, self.adapter, 'use_candidate_index', False)
+        self.addCleanup(setattr, self.adapter, 'candidate_index', None)
+
+    def test_candidate_index_disabled_by_default(self):
+        adapter = SQLStorageAdapter(database_uri=None)
+        adapter.update(Statement("A what?", in_response_to=[Response("This is a phone.")]))
+
+        self.assertIsNone(adapter.get_candidate_index())
+        self.assertEqual(adapter.get_response_candidates(), adapter.get_response_statements())
+
+    def test_get_response_candidates(self):
+        """
+        Test that the candidate index returns the same statements
+        as the list of statements that are in response to another.
+        """
+        statement_list = [
+            Statement("What... is your quest?"),
+            Statement("This is a phone."),
+            Statement("A what?", in_response_to=[Response("This is a phone.")]),
+            Statement("A phone.", in_response_to=[Response("A what?")])
+        ]
+
+        for statement in statement_list:
+            self.adapter.update(statement)
+
+        candidates = self.adapter.get_response_candidates()
+
+        self.assertEqual(
+            [statement.text for statement in self.adapter.get_response_statements()],
+            [candidate.text for candidate in candidates]
+        )
+
+    def test_candidate_index_updated_incrementally(self):
+        self.adapter.update(Statement("This is a phone."))
+
+        self.assertEqual(len(self.adapter.get_response_candidates()), 0)
+
+        self.adapter.update(
+            Statement("A what?", in_response_to=[Response("This is a phone.")])
+        )
+
+        self.assertEqual(len(self.adapter.get_response_candidates()), 1)
+        self.assertIn("This is a phone.", self.adapter.get_response_candidates())
+
+        self.adapter.remove("This is a phone.")
+
+        self.assertEqual(len(self.adapter.get_response_candidates()), 0)
+
+    def test_candidate_index_reads_saved_extra_data(self):
+        self.addCleanup(setattr, self.adapter, 'extra_data_functions', {})
+        self.addCleanup(setattr, self.adapter, 'candidate_feature_functions', {})
+
+        self.adapter.update(Statement("Hello", extra_data={'length': 0}))
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        self.adapter.add_extra_data_functions({'length': len})
+        self.adapter.candidate_index = None
+
+        candidate = self.adapter.get_response_candidates()[0]
+
+        self.assertEqual(candidate.features['length'], 0)
+
+    def test_load_candidate_index_in_batches(self):
+        adapter = SQLStorageAdapter(
+            database_uri=None, filter_batch_size=2, use_candidate_index=True
+        )
+
+        statement_list = [
+            Statement("What... is your quest?"),
+            Statement("This is a phone.", in_response_to=[Response("What... is your quest?")]),
+            Statement("A what?", in_response_to=[Response("This is a phone.")]),
+            Statement("A phone.", in_response_to=[Response("A what?")]),
+            Statement("Yes.", in_response_to=[Response("A phone."), Response("A what?")])
+        ]
+
+        for statement in statement_list:
+            adapter.update(statement)
+
+        adapter.filter = MagicMock(side_effect=AssertionError('Statements should not be loaded'))
+
+        candidates = adapter.get_response_candidates()
+
+        self.assertEqual(
+            [candidate.text for candidate in candidates],
+            [statement.text for statement in adapter.get_response_statements()]
+        )
+        self.assertEqual(len(candidates), 4)
+
 
 class SQLAlchemyStorageAdapterFilterTestCase(SQLAlchemyAdapterTestCase):
 
@@ -398,6 +632,40 @@ class SQLAlchemyStorageAdapterFilterTestCase(SQLAlchemyAdapterTestCase):
         self.assertIsInstance(found[0].in_response_to[0], Response)
 
 
+class SQLStorageAdapterFilterIterTestCase(TestCase):
+
+    def setUp(self):
+        self.adapter = SQLStorageAdapter(database_uri=None, filter_batch_size=2)
+
+        self.adapter.update(Statement('A'))
+        self.adapter.update(Statement('B', in_response_to=[Response('A')]))
+        self.adapter.update(Statement('C', in_response_to=[Response('A')]))
+        self.adapter.update(Statement('D', in_response_to=[Response('A')]))
+        self.adapter.update(Statement('E', in_response_to=[Response('B')]))
+
+    def test_filter_iter_reads_every_batch(self):
+        results = self.adapter.filter_iter()
+
+        self.assertNotIsInstance(results, list)
+        self.assertEqual([statement.text for statement in results], ['A', 'B', 'C', 'D', 'E'])
+
+    def test_filter_iter_in_response_to_contains(self):
+        results = self.adapter.filter_iter(in_response_to__contains='A')
+
+        self.assertEqual([statement.text for statement in results], ['B', 'C', 'D'])
+
+    def test_filter_iter_by_text(self):
+        results = self.adapter.filter_iter(text='D')
+
+        self.assertEqual([statement.text for statement in results], ['D'])
+
+    def test_filter_matches_filter_iter(self):
+        self.assertEqual(
+            self.adapter.filter(in_response_to__contains='A'),
+            list(self.adapter.filter_iter(in_response_to__contains='A'))
+        )
+
+
 class ReadOnlySQLStorageAdapterTestCase(SQLAlchemyAdapterTestCase):
 
     def setUp(self):
@@ -416,6 +684,22 @@ class ReadOnlySQLStorageAdapterTestCase(SQLAlchemyAdapterTestCase):
         statement_found = self.adapter.find("New statement")
         self.assertIsNone(statement_found)
 
+    def test_update_does_not_modify_candidate_index(self):
+        self.adapter.use_candidate_index = True
+        self.addCleanup(setattr, self.adapter, 'use_candidate_index', False)
+        self.addCleanup(setattr, self.adapter, 'candidate_index', None)
+
+        self.adapter.update(Statement("New statement"))
+        self.adapter.get_candidate_index()
+
+        self.adapter.read_only = True
+
+        self.adapter.update(
+            Statement("New response", in_response_to=[Response("New statement")])
+        )
+
+        self.assertEqual(len(self.adapter.get_response_candidates()), 0)
+
     def test_update_does_not_modify_existing_statement(self):
         statement = Statement("New statement")
         self.adapter.update(statement)
@@ -433,3 +717,308 @@ class ReadOnlySQLStorageAdapterTestCase(SQLAlchemyAdapterTestCase):
         self.assertEqual(
             len(statement_found.in_response_to), 0
         )
+
+
+class SQLStorageAdapterExtraDataTestCase(TestCase):
+
+    def setUp(self):
+        super(SQLStorageAdapterExtraDataTestCase, self).setUp()
+        self.adapter = SQLStorageAdapter(database_uri=None, extra_data_index_keys=['speaker'])
+
+    def test_empty_extra_data_is_saved_as_null(self):
+        from sqlalchemy import text
+
+        self.adapter.update(Statement('Hello'))
+
+        saved_value = self.adapter.engine.execute(
+            text("SELECT extra_data FROM statement WHERE text = 'Hello'")
+        ).scalar()
+
+        self.assertIsNone(saved_value)
+        self.assertEqual(self.adapter.find('Hello').extra_data, {})
+
+    def test_extra_data_is_saved_as_json(self):
+        from sqlalchemy import text
+
+        self.adapter.update(Statement('Hello', extra_data={'speaker': 'tom'}))
+
+        saved_value = self.adapter.engine.execute(
+            text("SELECT extra_data FROM statement WHERE text = 'Hello'")
+        ).scalar()
+
+        self.assertEqual(bytes(saved_value), b'{"speaker":"tom"}')
+        self.assertEqual(self.adapter.find('Hello').extra_data, {'speaker': 'tom'})
+
+    def test_pickled_extra_data_can_be_loaded(self):
+        import pickle
+        from sqlalchemy import text
+
+        self.adapter.update(Statement('Hello'))
+        self.adapter.engine.execute(
+            text("UPDATE statement SET extra_data = :extra_data WHERE text = 'Hello'"),
+            extra_data=pickle.dumps({'speaker': 'tom'})
+        )
+
+        self.assertEqual(self.adapter.find('Hello').extra_data, {'speaker': 'tom'})
+
+    def test_pickled_extra_data_only_loads_built_in_values(self):
+        import pickle
+        from datetime import datetime
+        from sqlalchemy import text
+
+        self.adapter.update(Statement('Hello'))
+        self.adapter.engine.execute(
+            text("UPDATE statement SET extra_data = :extra_data WHERE text = 'Hello'"),
+            extra_data=pickle.dumps({'created': datetime(2018, 1, 1)})
+        )
+
+        with self.assertRaises(pickle.UnpicklingError):
+            self.adapter.find('Hello')
+
+    def test_unrecognized_extra_data_is_not_loaded(self):
+        from sqlalchemy import text
+
+        self.adapter.update(Statement('Hello'))
+        self.adapter.engine.execute(
+            text("UPDATE statement SET extra_data = :extra_data WHERE text = 'Hello'"),
+            extra_data=b'speaker=tom'
+        )
+
+        with self.assertRaisesRegex(ValueError, 'not saved as JSON, MessagePack'):
+            self.adapter.find('Hello')
+
+    def test_extra_data_that_cannot_be_saved(self):
+        from sqlalchemy.exc import StatementError
+
+        with self.assertRaisesRegex(StatementError, 'can only hold values that can be saved as json') as context:
+            self.adapter.update(Statement('Hello', extra_data={'speaker': object()}))
+
+        self.assertIsInstance(context.exception.orig, TypeError)
+
+    def test_extra_data_saved_as_msgpack(self):
+        try:
+            import msgpack  # NOQA
+        except ImportError:
+            self.skipTest('The msgpack package is not installed.')
+
+        adapter = SQLStorageAdapter(database_uri=None, extra_data_format='msgpack')
+
+        adapter.update(Statement('Hello', extra_data={'speaker': 'tom'}))
+
+        self.assertEqual(adapter.find('Hello').extra_data, {'speaker': 'tom'})
+
+    def test_extra_data_format_of_each_adapter(self):
+        try:
+            import msgpack  # NOQA
+        except ImportError:
+            self.skipTest('The msgpack package is not installed.')
+
+        json_adapter = SQLStorageAdapter(database_uri=None)
+        msgpack_adapter = SQLStorageAdapter(database_uri=None, extra_data_format='msgpack')
+
+        for adapter in (json_adapter, msgpack_adapter):
+            adapter.update(Statement('Hello', extra_data={'speaker': 'tom'}))
+
+        json_value = json_adapter.engine.execute('SELECT extra_data FROM statement').scalar()
+        msgpack_value = msgpack_adapter.engine.execute('SELECT extra_data FROM statement').scalar()
+
+        self.assertEqual(bytes(json_value), b'{"speaker":"tom"}')
+        self.assertEqual(bytes(msgpack_value), msgpack.packb({'speaker': 'tom'}, use_bin_type=True))
+        self.assertEqual(json_adapter.find('Hello').extra_data, {'speaker': 'tom'})
+        self.assertEqual(msgpack_adapter.find('Hello').extra_data, {'speaker': 'tom'})
+
+    def test_filter_by_indexed_extra_data(self):
+        self.adapter.update(Statement('Hello', extra_data={'speaker': 'tom'}))
+        self.adapter.update(Statement('Hi', extra_data={'speaker': 'jane'}))
+
+        results = self.adapter.filter(extra_data__speaker='tom')
+
+        self.assertEqual([statement.text for statement in results], ['Hello'])
+
+    def test_filter_by_extra_data_that_is_not_indexed(self):
+        self.adapter.update(Statement('Hello', extra_data={'addressing_speaker': 'tom'}))
+        self.adapter.update(Statement('Hi', extra_data={'addressing_speaker': 'jane'}))
+
+        results = self.adapter.filter(extra_data__addressing_speaker='jane')
+
+        self.assertEqual([statement.text for statement in results], ['Hi'])
+
+    def test_filter_by_changed_extra_data(self):
+        self.adapter.update(Statement('Hello', extra_data={'speaker': 'tom'}))
+        self.adapter.update(Statement('Hello', extra_data={'speaker': 'jane'}))
+
+        self.assertEqual(self.adapter.filter(extra_data__speaker='tom'), [])
+        self.assertEqual(len(self.adapter.filter(extra_data__speaker='jane')), 1)
+
+    def test_filter_by_extra_data_and_response(self):
+        self.adapter.update(Statement('Hello', extra_data={'speaker': 'tom'}, in_response_to=[Response('Hi')]))
+        self.adapter.update(Statement('Hey', extra_data={'speaker': 'jane'}, in_response_to=[Response('Hi')]))
+
+        results = self.adapter.filter(in_response_to__contains='Hi', extra_data__speaker='jane')
+
+        self.assertEqual([statement.text for statement in results], ['Hey'])
+
+    def test_bulk_update_indexes_extra_data(self):
+        self.adapter.start_bulk_update()
+        self.adapter.update(Statement('Hello', extra_data={'speaker': 'tom'}))
+        self.adapter.update(Statement('Hi', extra_data={'speaker': 'jane'}))
+        self.adapter.finish_bulk_update()
+
+        results = self.adapter.filter(extra_data__speaker='jane')
+
+        self.assertEqual([statement.text for statement in results], ['Hi'])
+
+    def test_discard_bulk_update(self):
+        self.adapter.update(Statement('Hello'))
+
+        self.adapter.bulk_update_batch_size = 1
+        self.addCleanup(setattr, self.adapter, 'bulk_update_batch_size', 10000)
+
+        self.adapter.start_bulk_update(write_batches=False)
+        self.adapter.update(Statement('Hi', in_response_to=[Response('Hello')]))
+        self.adapter.update(Statement('Hey'))
+        self.adapter.discard_bulk_update()
+
+        self.assertIsNone(self.adapter.find('Hi'))
+        self.assertIsNone(self.adapter.find('Hey'))
+        self.assertEqual(self.adapter.count(), 1)
+        self.assertEqual(len(self.adapter.get_response_candidates()), 0)
+
+    def test_rebuild_extra_data_index(self):
+        adapter = SQLStorageAdapter(database_uri=None)
+        adapter.update(Statement('Hello', extra_data={'speaker': 'tom'}))
+
+        adapter.extra_data_index_keys = ['speaker']
+        adapter.rebuild_extra_data_index()
+
+        index_rows = adapter.engine.execute('SELECT key, value FROM extra_data_index').fetchall()
+
+        self.assertEqual(index_rows, [('speaker', '"tom"')])
+        self.assertEqual(len(adapter.filter(extra_data__speaker='tom')), 1)
+
+
+class SQLStorageAdapterSessionTestCase(TestCase):
+
+    def setUp(self):
+        import os
+        import tempfile
+        import shutil
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        self.database_uri = 'sqlite:///' + os.path.join(directory, 'database.sqlite3')
+
+    def run_in_thread(self, function):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(function).result()
+
+    def test_database_pool_options(self):
+        from sqlalchemy.pool import QueuePool
+
+        adapter = SQLStorageAdapter(
+            database_uri=self.database_uri,
+            database_pool_size=3,
+            database_max_overflow=2,
+            database_pool_recycle=3600,
+            database_pool_pre_ping=True
+        )
+
+        self.assertIsInstance(adapter.engine.pool, QueuePool)
+        self.assertEqual(adapter.engine.pool.size(), 3)
+        self.assertEqual(adapter.engine.pool._max_overflow, 2)
+        self.assertEqual(adapter.engine.pool._recycle, 3600)
+        self.assertTrue(adapter.engine.pool._pre_ping)
+
+    def test_database_pool_is_shared_between_threads(self):
+        adapter = SQLStorageAdapter(database_uri=self.database_uri, database_pool_size=1)
+        adapter.update(Statement('Hello'))
+
+        self.assertEqual(self.run_in_thread(adapter.count), 1)
+
+    def test_scoped_session_is_reused(self):
+        adapter = SQLStorageAdapter(database_uri=self.database_uri, scoped_session=True)
+
+        adapter.update(Statement('Hello', in_response_to=[Response('Hi')]))
+        statement = adapter.find('Hello')
+
+        self.assertIs(adapter.get_session(), adapter.get_session())
+        self.assertIsNot(self.run_in_thread(adapter.get_session), adapter.get_session())
+        self.assertEqual(len(statement.in_response_to), 1)
+
+    def test_scoped_session_uses_request_connection(self):
+        adapter = SQLStorageAdapter(database_uri=self.database_uri, scoped_session=True)
+
+        adapter.start_request()
+        session = adapter.get_session()
+
+        self.assertIs(session.bind, adapter.request_connection)
+
+        adapter.finish_request()
+
+        self.assertIsNot(adapter.get_session(), session)
+        self.assertIs(adapter.get_session().bind, adapter.engine)
+
+    def test_request_connection_is_held_for_each_thread(self):
+        adapter = SQLStorageAdapter(database_uri=self.database_uri)
+
+        adapter.start_request()
+        self.addCleanup(adapter.finish_request)
+
+        self.assertIsNotNone(adapter.request_connection)
+        self.assertIsNone(self.run_in_thread(lambda: adapter.request_connection))
+
+    def test_request_cache_is_held_for_each_thread(self):
+        from threading import Barrier, Thread
+
+        adapter = SQLStorageAdapter(database_uri=self.database_uri, database_pool_size=2)
+        adapter.update(Statement('Hello'))
+        round_trips = adapter.round_trips
+
+        barrier = Barrier(2)
+        results = {}
+
+        def respond(name, statement_text):
+            adapter.start_request()
+
+            try:
+                count = adapter.count()
+
+                # Both requests have been started before either
+                # thread modifies the database or counts again
+                barrier.wait()
+
+                if statement_text:
+                    adapter.update(Statement(statement_text))
+
+                barrier.wait()
+
+                results[name] = (
+                    count, adapter.count(), adapter.round_trips, dict(adapter.request_cache)
+                )
+            finally:
+                adapter.finish_request()
+
+        threads = [
+            Thread(target=respond, args=('reader', None)),
+            Thread(target=respond, args=('writer', 'Hi'))
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        reader = results['reader']
+        writer = results['writer']
+
+        self.assertEqual(reader[:2], (1, 1))
+        self.assertEqual(writer[:2], (1, 2))
+        self.assertEqual(reader[3], {'count': 1})
+        self.assertEqual(writer[3], {'count': 2})
+        self.assertLess(reader[2], writer[2])
+        self.assertIsNone(adapter.request_cache)
+        self.assertEqual(adapter.round_trips, round_trips)
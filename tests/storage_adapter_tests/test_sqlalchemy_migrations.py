@@ -0,0 +1,179 @@
+from unittest import TestCase
+import os
+import pickle
+import sqlite3
+import tempfile
+
+from chatterbot.storage.sql_storage import SQLStorageAdapter
+
+
+# The tables created by earlier versions of the SQLAlchemy models
+PREVIOUS_SCHEMA = '''
+CREATE TABLE conversation (
+    id INTEGER NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE TABLE statement (
+    id INTEGER NOT NULL,
+    text VARCHAR(400),
+    extra_data BLOB,
+    PRIMARY KEY (id),
+    UNIQUE (text)
+);
+CREATE TABLE tag (
+    id INTEGER NOT NULL,
+    name VARCHAR(50),
+    PRIMARY KEY (id)
+);
+CREATE TABLE conversation_association (
+    conversation_id INTEGER,
+    statement_id INTEGER,
+    FOREIGN KEY(conversation_id) REFERENCES conversation (id),
+    FOREIGN KEY(statement_id) REFERENCES statement (id)
+);
+CREATE TABLE response (
+    id INTEGER NOT NULL,
+    text VARCHAR(400),
+    created_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+    occurrence INTEGER,
+    statement_text VARCHAR(400),
+    PRIMARY KEY (id),
+    FOREIGN KEY(statement_text) REFERENCES statement (text)
+);
+CREATE TABLE tag_association (
+    tag_id INTEGER,
+    statement_id INTEGER,
+    FOREIGN KEY(tag_id) REFERENCES tag (id),
+    FOREIGN KEY(statement_id) REFERENCES statement (id)
+);
+'''
+
+
+class SQLAlchemyMigrationTestCase(TestCase):
+
+    def setUp(self):
+        super(SQLAlchemyMigrationTestCase, self).setUp()
+
+        database_file, self.database_path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(database_file)
+        self.addCleanup(os.remove, self.database_path)
+
+        connection = sqlite3.connect(self.database_path)
+        connection.executescript(PREVIOUS_SCHEMA)
+
+        extra_data = pickle.dumps({'speaker': 'tom'})
+
+        connection.executemany(
+            'INSERT INTO statement (id, text, extra_data) VALUES (?, ?, ?)',
+            [(1, 'Hi', extra_data), (2, 'Hello', extra_data), (3, 'How are you?', extra_data)]
+        )
+        connection.executemany(
+            'INSERT INTO response (id, text, occurrence, statement_text) VALUES (?, ?, ?, ?)',
+            [(1, 'Hi', 2, 'Hello'), (2, 'Hello', 1, 'How are you?')]
+        )
+        connection.execute('INSERT INTO tag (id, name) VALUES (1, "greetings")')
+        connection.executemany(
+            'INSERT INTO tag_association (tag_id, statement_id) VALUES (?, ?)',
+            [(1, 1), (1, 1), (1, 2)]
+        )
+        connection.executemany('INSERT INTO conversation (id) VALUES (?)', [(1, ), (2, )])
+        connection.executemany(
+            'INSERT INTO conversation_association (conversation_id, statement_id) VALUES (?, ?)',
+            [(1, 1), (2, 3), (1, 2), (2, 1), (2, 2)]
+        )
+        connection.commit()
+        connection.close()
+
+    def get_adapter(self, **kwargs):
+        adapter = SQLStorageAdapter(
+            database_uri='sqlite:///' + self.database_path,
+            conversation_cache=None,
+            **kwargs
+        )
+        self.addCleanup(adapter.engine.dispose)
+
+        return adapter
+
+    def test_statements_are_migrated(self):
+        adapter = self.get_adapter()
+
+        statement = adapter.find('Hello')
+
+        self.assertEqual(adapter.count(), 3)
+        self.assertEqual(statement.extra_data, {'speaker': 'tom'})
+        self.assertEqual(statement.tags, ['greetings'])
+        self.assertEqual(len(statement.in_response_to), 1)
+        self.assertEqual(statement.in_response_to[0].text, 'Hi')
+        self.assertEqual(statement.in_response_to[0].occurrence, 2)
+
+    def test_duplicate_tags_are_removed(self):
+        adapter = self.get_adapter()
+
+        self.assertEqual(adapter.find('Hi').tags, ['greetings'])
+
+    def test_responses_can_be_filtered(self):
+        adapter = self.get_adapter()
+
+        results = adapter.filter(in_response_to__contains='Hi')
+
+        self.assertEqual([statement.text for statement in results], ['Hello'])
+
+    def test_conversations_are_migrated(self):
+        adapter = self.get_adapter()
+
+        self.assertEqual(adapter.get_latest_response(1), 'Hi')
+
+    def test_conversations_keep_the_order_of_their_statements(self):
+        adapter = self.get_adapter()
+
+        self.assertEqual(adapter.get_latest_response(2), 'Hello')
+
+    def test_responses_can_be_added_after_migration(self):
+        from chatterbot.conversation import Statement, Response
+
+        adapter = self.get_adapter()
+
+        adapter.update(Statement('Hi', in_response_to=[Response('How are you?')]))
+
+        response_texts = adapter.engine.execute(
+            'SELECT text FROM response ORDER BY id'
+        ).fetchall()
+
+        self.assertEqual(
+            [row[0] for row in response_texts],
+            ['Hi', 'Hello', 'How are you?']
+        )
+
+    def test_indexes_are_created(self):
+        from sqlalchemy import inspect
+
+        adapter = self.get_adapter()
+        inspector = inspect(adapter.engine)
+
+        index_names = set()
+        for table_name in inspector.get_table_names():
+            index_names.update(index['name'] for index in inspector.get_indexes(table_name))
+
+        self.assertTrue(index_names.issuperset([
+            'ix_response_statement_id_text',
+            'ix_response_text',
+            'ix_tag_name',
+            'ix_tag_association_statement_id',
+            'ix_conversation_association_conversation_id',
+        ]))
+
+    def test_updates_after_migration(self):
+        from chatterbot.conversation import Statement, Response
+
+        adapter = self.get_adapter()
+
+        adapter.update(Statement('Hello', in_response_to=[Response('Hi')]))
+
+        self.assertEqual(adapter.find('Hello').in_response_to[0].occurrence, 3)
+
+    def test_read_only_adapter_does_not_migrate(self):
+        from chatterbot.ext.sqlalchemy_app.migrations import requires_migration
+
+        adapter = self.get_adapter(read_only=True)
+
+        self.assertTrue(requires_migration(adapter.engine))
@@ -0,0 +1,73 @@
+import asyncio
+from .base_case import ChatBotTestCase
+from chatterbot.conversation import Statement, Response
+
+
+class AsyncResponseTestCase(ChatBotTestCase):
+
+    def setUp(self):
+        super(AsyncResponseTestCase, self).setUp()
+        self.loop = asyncio.new_event_loop()
+
+        self.chatbot.storage.update(
+            Statement('Hello', in_response_to=[Response('Hi')])
+        )
+
+    def tearDown(self):
+        self.loop.close()
+        super(AsyncResponseTestCase, self).tearDown()
+
+    def test_get_response_async(self):
+        response = self.loop.run_until_complete(
+            self.chatbot.get_response_async('Hi')
+        )
+
+        self.assertEqual(response, 'Hello')
+        self.assertIsNotNone(self.chatbot.storage.find('Hi'))
+
+    def test_concurrent_responses(self):
+        self.chatbot.read_only = True
+
+        async def get_responses():
+            return await asyncio.gather(*[
+                self.chatbot.get_response_async('Hi') for _ in range(20)
+            ])
+
+        responses = self.loop.run_until_complete(get_responses())
+
+        self.assertEqual(len(responses), 20)
+        self.assertTrue(all(response == 'Hello' for response in responses))
+
+    def test_async_storage_adapter(self):
+        from chatterbot.asynchronous import get_async_storage
+
+        storage = get_async_storage(self.chatbot)
+
+        count = self.loop.run_until_complete(storage.count())
+        statement = self.loop.run_until_complete(storage.find('Hello'))
+
+        self.assertEqual(count, 1)
+        self.assertEqual(statement.text, 'Hello')
+
+    def test_response_is_generated_in_a_request(self):
+        generate_response = self.chatbot.generate_response
+        request_caches = []
+
+        def generate_response_in_request(*args, **kwargs):
+            request_caches.append(self.chatbot.storage.request_cache)
+            return generate_response(*args, **kwargs)
+
+        self.chatbot.generate_response = generate_response_in_request
+
+        response = self.loop.run_until_complete(
+            self.chatbot.get_response_async('Hi')
+        )
+
+        self.assertEqual(response, 'Hello')
+        self.assertEqual(len(request_caches), 1)
+        self.assertIsNotNone(request_caches[0])
+
+        # The request is finished in the executor thread after each call
+        self.assertIsNone(
+            self.chatbot.async_executor.submit(lambda: self.chatbot.storage.request_cache).result()
+        )
@@ -4,7 +4,8 @@ various chat bot configurations to help prevent
 performance based regressions when changes are made.
 """
 
-from random import choice
+from random import choice, Random
+from unittest import TestCase
 from .base_case import ChatBotSQLTestCase, ChatBotMongoTestCase
 from chatterbot import ChatBot
 from chatterbot import utils
@@ -109,6 +110,133 @@ class SqlBenchmarkingTests(BenchmarkingMixin, ChatBotSQLTestCase):
         self.skipTest('TODO: This test needs to be written.')
 
 
+class SearchBenchmarkingTests(ChatBotSQLTestCase):
+    """
+    Benchmarking tests that compare the results of a candidate
+    search to the results of an exhaustive scan of all statements.
+    """
+
+    def setUp(self):
+        super(SearchBenchmarkingTests, self).setUp()
+        from chatterbot.trainers import ListTrainer
+
+        self.random = Random(0)
+
+        self.statement_list = sorted(set([
+            ' '.join([
+                self.random.choice(WORDBANK) for __ in range(0, self.random.randint(3, 10))
+            ]) for _ in range(0, 600)
+        ]))
+
+        self.chatbot.set_trainer(ListTrainer, show_training_progress=False)
+        self.chatbot.train(self.statement_list)
+
+    def get_inputs(self, count):
+        """
+        Return input statements that are each a stored statement with one word removed.
+        """
+        from chatterbot.conversation import Statement
+
+        inputs = []
+
+        for _ in range(0, count):
+            words = self.random.choice(self.statement_list).split()
+            del words[self.random.randrange(len(words))]
+            inputs.append(Statement(' '.join(words)))
+
+        return inputs
+
+    def test_trigram_search_matches_exhaustive_scan(self):
+        from sys import stdout
+        from time import time
+        from chatterbot.logic import BestMatch
+
+        exhaustive = BestMatch()
+        exhaustive.set_chatbot(self.chatbot)
+
+        searching = BestMatch(
+            candidate_search='chatterbot.search.TrigramSearch',
+            search_shortlist_size=50
+        )
+        searching.set_chatbot(self.chatbot)
+
+        exhaustive_duration = 0
+        search_duration = 0
+
+        for statement in self.get_inputs(50):
+            start_time = time()
+            expected = exhaustive.get(statement)
+            exhaustive_duration += time() - start_time
+
+            start_time = time()
+            result = searching.get(statement)
+            search_duration += time() - start_time
+
+            self.assertEqual(expected.text, result.text)
+            self.assertEqual(expected.confidence, result.confidence)
+
+        stdout.write(
+            '\nBENCHMARK: Exhaustive scan took %f seconds, trigram search took %f seconds\n' % (
+                exhaustive_duration, search_duration
+            )
+        )
+
+
+class StatementBenchmarkingTests(TestCase):
+    """
+    Benchmarking tests for creating the statement objects
+    that are loaded from storage.
+    """
+
+    def test_statement_construction(self):
+        """
+        Report the amount of time and memory it takes to create statements
+        with responses that have their dates saved as strings, and test that
+        the statements are created without a dictionary of attributes or
+        parsing the dates.
+        """
+        import tracemalloc
+        from sys import stdout
+        from time import time
+        from chatterbot.conversation import Statement, Response
+
+        def create_statements():
+            return [
+                Statement('Statement {}'.format(index % 1000), in_response_to=[
+                    Response('Response {}'.format(index % 100), created_at='2018-01-02T03:04:05')
+                ]) for index in range(0, 10000)
+            ]
+
+        start_time = time()
+        statements = create_statements()
+        duration = time() - start_time
+
+        del statements
+
+        # Memory is measured separately because tracing slows down allocation
+        tracemalloc.start()
+        statements = create_statements()
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        stdout.write(
+            '\nBENCHMARK: Creating {} statements took {:f} seconds and {:d} bytes\n'.format(
+                len(statements), duration, memory
+            )
+        )
+
+        statement = statements[0]
+        response = statement.in_response_to[0]
+
+        # Statements and responses keep their attributes in slots
+        self.assertFalse(hasattr(statement, '__dict__'))
+        self.assertFalse(hasattr(response, '__dict__'))
+
+        # Dates are only parsed when they are used
+        self.assertIsInstance(response._created_at, str)
+        self.assertEqual(response.created_at.year, 2018)
+
+
 class MongoBenchmarkingTests(BenchmarkingMixin, ChatBotMongoTestCase):
     """
     Benchmarking tests for Mongo DB storage.
@@ -166,3 +166,47 @@ class ChatterBotResponseTestCase(ChatBotTestCase):
 
         self.assertEqual(response, self.test_statement.text)
         self.assertIsNone(statement_found)
+
+    def test_get_responses(self):
+        self.chatbot.storage.update(self.test_statement)
+
+        responses = self.chatbot.get_responses(['Hi', 'Hello'])
+
+        self.assertEqual(next(responses), self.test_statement.text)
+        self.assertIsNotNone(self.chatbot.storage.find('Hi'))
+        self.assertEqual(len(list(responses)), 1)
+
+    def test_get_responses_read_only(self):
+        self.chatbot.storage.update(self.test_statement)
+
+        responses = list(self.chatbot.get_responses(['Hi', 'Hi!'], read_only=True))
+
+        self.assertEqual(responses, [self.test_statement.text, self.test_statement.text])
+        self.assertIsNone(self.chatbot.storage.find('Hi!'))
+        self.assertFalse(self.chatbot.read_only)
+
+    def test_get_responses_read_only_generates_responses(self):
+        from unittest.mock import MagicMock
+
+        self.chatbot.storage.update(self.test_statement)
+        self.chatbot.generate_response = MagicMock(wraps=self.chatbot.generate_response)
+
+        list(self.chatbot.get_responses(['Hi', 'Hi!'], read_only=True))
+
+        self.assertEqual(self.chatbot.generate_response.call_count, 2)
+
+    def test_get_response_round_trips_are_constant(self):
+        """
+        Test that the number of database queries made to respond to an
+        input does not grow as the conversation gets longer.
+        """
+        self.chatbot.storage.update(self.test_statement)
+
+        round_trips = []
+
+        for _ in range(3):
+            self.chatbot.get_response('Hi')
+            round_trips.append(self.chatbot.storage.round_trips)
+
+        self.assertGreater(round_trips[0], 0)
+        self.assertEqual(round_trips[1], round_trips[2])
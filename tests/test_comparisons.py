@@ -54,6 +54,80 @@ class LevenshteinDistanceTestCase(TestCase):
 
         self.assertEqual(value, 1)
 
+    def test_compare_many_matches_compare(self):
+        """
+        Test that comparing a list of statements at once returns
+        the same values as comparing each statement individually.
+        """
+        from chatterbot.storage.candidate_index import Candidate
+
+        statement = Statement('Where is the post office?')
+        other_statements = [
+            Statement('Looking for the post office'),
+            Statement('WHERE IS THE POST OFFICE?'),
+            Statement(''),
+            Candidate('Where is the library?'),
+            Candidate('Where is the library?'),
+        ]
+
+        values = comparisons.levenshtein_distance.compare_many(statement, other_statements)
+
+        self.assertEqual(values, [
+            comparisons.levenshtein_distance(statement, other_statement)
+            for other_statement in other_statements
+        ])
+
+    def test_compare_many_reuses_one_matcher(self):
+        from unittest.mock import patch
+
+        other_statements = [Statement('Looking for the post office'), Statement('Hello')]
+
+        with patch.object(
+            comparisons, 'SequenceMatcher', wraps=comparisons.SequenceMatcher
+        ) as sequence_matcher:
+            values = comparisons.levenshtein_distance.compare_many(
+                Statement('Where is the post office?'), other_statements
+            )
+
+        self.assertEqual(sequence_matcher.call_count, 1)
+        self.assertEqual(values, [
+            comparisons.levenshtein_distance(Statement('Where is the post office?'), other_statement)
+            for other_statement in other_statements
+        ])
+
+    def test_compare_many_statement_false(self):
+        statement = Statement('')
+        other_statements = [Statement('Hello'), Statement('Hi')]
+
+        values = comparisons.levenshtein_distance.compare_many(statement, other_statements)
+
+        self.assertEqual(values, [0, 0])
+
+    def test_compare_many_concurrently(self):
+        """
+        Test that the same candidates can be compared
+        to different statements in separate threads.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from chatterbot.storage.candidate_index import Candidate
+
+        candidates = [Candidate('Where is the library?'), Candidate('the post office')]
+        texts = ['Where is the post office?', 'library', 'post', 'Where?'] * 25
+
+        def compare(text):
+            return comparisons.levenshtein_distance.compare_many(Statement(text), candidates)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            values = list(executor.map(compare, texts))
+
+        self.assertEqual(values, [
+            [comparisons.levenshtein_distance(Statement(text), candidate) for candidate in candidates]
+            for text in texts
+        ])
+        self.assertEqual(
+            candidates[0].features['levenshtein_lowercase_text'], 'where is the library?'
+        )
+
 
 class SynsetDistanceTestCase(TestCase):
 
@@ -65,12 +139,73 @@ class SynsetDistanceTestCase(TestCase):
 
         self.assertIn('initialize_nltk_wordnet', functions)
 
+    def test_get_preparation_functions(self):
+        functions = comparisons.synset_distance.get_preparation_functions()
+
+        self.assertIn('prepare_wordnet', functions)
+        self.assertIn('prepare_punkt', functions)
+        self.assertIn('prepare_stopwords', functions)
+
+    def test_prepare_returns_durations(self):
+        from unittest.mock import MagicMock
+
+        comparison = comparisons.SynsetDistance()
+        comparison.prepare_wordnet = MagicMock()
+        comparison.prepare_punkt = MagicMock()
+        comparison.prepare_stopwords = MagicMock()
+
+        durations = comparison.prepare()
+
+        self.assertEqual(
+            set(durations), set(['prepare_wordnet', 'prepare_punkt', 'prepare_stopwords'])
+        )
+        self.assertEqual(comparison.prepare_wordnet.call_count, 1)
+
     def test_exact_match_different_capitalization(self):
         """
         Test that text capitalization is ignored.
         """
         raise SkipTest('This test needs to be created.')
 
+    def test_get_feature_functions(self):
+        functions = comparisons.synset_distance.get_feature_functions()
+
+        self.assertIn('synset_distance', functions)
+
+    def test_path_similarity_is_cached(self):
+        from unittest.mock import MagicMock
+
+        comparison = comparisons.SynsetDistance()
+        synset = MagicMock()
+        synset.path_similarity = MagicMock(return_value=0.5)
+
+        comparison.get_path_similarity(synset, 'other')
+        value = comparison.get_path_similarity(synset, 'other')
+
+        self.assertEqual(value, 0.5)
+        self.assertEqual(synset.path_similarity.call_count, 1)
+
+    def test_compare_many_uses_indexed_features(self):
+        from unittest.mock import MagicMock
+        from chatterbot.storage.candidate_index import Candidate
+
+        comparison = comparisons.SynsetDistance()
+        synset = MagicMock()
+        synset.path_similarity = MagicMock(return_value=1.0)
+
+        statement = Candidate('Dogs bark')
+        statement.features['synset_distance'] = (2, frozenset([synset]))
+
+        other_statement = Candidate('A dog barks loudly')
+        other_statement.features['synset_distance'] = (4, frozenset([synset]))
+
+        empty_statement = Candidate('')
+        empty_statement.features['synset_distance'] = (0, frozenset())
+
+        values = comparison.compare_many(statement, [other_statement, empty_statement])
+
+        self.assertEqual(values, [0.25, 0.0])
+
 
 class SentimentComparisonTestCase(TestCase):
 
@@ -90,6 +225,66 @@ class SentimentComparisonTestCase(TestCase):
 
         self.assertEqual(value, 1)
 
+    def test_sentiment_analyzer_is_shared(self):
+        from unittest.mock import MagicMock, patch
+
+        analyzer = MagicMock()
+        analyzer.polarity_scores = MagicMock(return_value={'neg': 0.0, 'neu': 1.0, 'pos': 0.0})
+
+        with patch.object(comparisons.SentimentComparison, 'sentiment_analyzer', analyzer):
+            comparison = comparisons.SentimentComparison()
+            other_comparison = comparisons.SentimentComparison()
+
+            self.assertIs(comparison.get_sentiment_analyzer(), other_comparison.get_sentiment_analyzer())
+
+    def test_prepare_loads_sentiment_analyzer(self):
+        from unittest.mock import MagicMock, patch
+
+        analyzer = MagicMock()
+
+        with patch.object(comparisons.SentimentComparison, 'sentiment_analyzer', analyzer):
+            durations = comparisons.SentimentComparison().prepare()
+
+        self.assertEqual(list(durations), ['prepare_vader_lexicon'])
+
+    def test_compare_many_reads_saved_sentiment(self):
+        from unittest.mock import MagicMock, patch
+
+        analyzer = MagicMock()
+        analyzer.polarity_scores = MagicMock(return_value={'neg': 0.0, 'neu': 0.75, 'pos': 0.25})
+
+        statement = Statement('Hello')
+        other_statements = [
+            Statement('Hi', extra_data={'chatterbot_sentiment': ['neu', 0.5]}),
+            Statement('Bad', extra_data={'chatterbot_sentiment': ['neg', 0.75], 'sentiment': 'happy'}),
+        ]
+
+        with patch.object(comparisons.SentimentComparison, 'sentiment_analyzer', analyzer):
+            values = comparisons.SentimentComparison().compare_many(statement, other_statements)
+
+        self.assertEqual(values, [0.75, 0])
+        self.assertEqual(analyzer.polarity_scores.call_count, 1)
+
+    def test_saved_sentiment_does_not_replace_extra_data(self):
+        from unittest.mock import MagicMock, patch
+        from chatterbot.storage import SQLStorageAdapter
+
+        analyzer = MagicMock()
+        analyzer.polarity_scores = MagicMock(return_value={'neg': 0.0, 'neu': 0.75, 'pos': 0.25})
+
+        storage = SQLStorageAdapter(database_uri=None)
+        storage.add_extra_data_functions(
+            comparisons.SentimentComparison().get_extra_data_functions()
+        )
+
+        with patch.object(comparisons.SentimentComparison, 'sentiment_analyzer', analyzer):
+            storage.update(Statement('Hello', extra_data={'sentiment': 'happy'}))
+
+        extra_data = storage.find('Hello').extra_data
+
+        self.assertEqual(extra_data['sentiment'], 'happy')
+        self.assertEqual(extra_data['chatterbot_sentiment'], ['neu', 0.75])
+
 
 class JaccardSimilarityTestCase(TestCase):
 
@@ -98,3 +293,25 @@ class JaccardSimilarityTestCase(TestCase):
         Test that text capitalization is ignored.
         """
         raise SkipTest('This test needs to be created.')
+
+    def test_get_feature_functions(self):
+        functions = comparisons.jaccard_similarity.get_feature_functions()
+
+        self.assertIn('jaccard_similarity', functions)
+
+    def test_compare_many_uses_indexed_lemmas(self):
+        from unittest.mock import MagicMock
+        from chatterbot.storage.candidate_index import Candidate
+
+        comparison = comparisons.JaccardSimilarity()
+        comparison.get_lemmas = MagicMock(return_value=frozenset(['cat', 'hunger']))
+
+        other_statements = [Candidate('The cat is very hungry.'), Candidate('A dog.'), Candidate('')]
+        other_statements[0].features['jaccard_similarity'] = frozenset(['cat', 'hunger', 'very'])
+        other_statements[1].features['jaccard_similarity'] = frozenset(['dog'])
+        other_statements[2].features['jaccard_similarity'] = frozenset()
+
+        values = comparison.compare_many(Statement('The young cat is hungry.'), other_statements)
+
+        self.assertEqual(values, [True, False, False])
+        self.assertEqual(comparison.get_lemmas.call_count, 1)
@@ -0,0 +1,88 @@
+from unittest import TestCase
+from chatterbot.conversation import Statement
+from chatterbot.storage.candidate_index import Candidate
+from chatterbot import search
+
+
+class SearchTestCase(TestCase):
+
+    def test_search_returns_all_candidates(self):
+        candidates = [Candidate('Hello'), Candidate('Hi')]
+
+        results = search.Search().search(Statement('Hey'), candidates)
+
+        self.assertEqual(results, candidates)
+
+
+class TrigramSearchTestCase(TestCase):
+
+    def setUp(self):
+        super(TrigramSearchTestCase, self).setUp()
+        self.search = search.TrigramSearch(search_shortlist_size=2)
+        self.candidates = [
+            Candidate('Where is the post office?'),
+            Candidate('What is your quest?'),
+            Candidate('I like green eggs and ham.'),
+            Candidate('What... is your quest?'),
+        ]
+
+    def test_get_ngrams(self):
+        ngrams = self.search.get_terms('Hi')
+
+        self.assertEqual(ngrams, set([' hi', 'hi ']))
+
+    def test_get_ngrams_short_text(self):
+        ngrams = self.search.get_terms('')
+
+        self.assertEqual(ngrams, set(['  ']))
+
+    def test_small_candidate_list_is_not_searched(self):
+        candidates = self.candidates[:2]
+
+        results = self.search.search(Statement('What is your quest?'), candidates)
+
+        self.assertEqual(results, candidates)
+
+    def test_shortlist_contains_closest_matches(self):
+        results = self.search.search(Statement('what is your quest'), self.candidates)
+
+        self.assertEqual(len(results), 2)
+        self.assertIn('What is your quest?', results)
+        self.assertIn('What... is your quest?', results)
+
+    def test_shortlist_keeps_candidate_order(self):
+        results = self.search.search(Statement('What... is your quest?'), self.candidates)
+
+        self.assertEqual(results, [self.candidates[1], self.candidates[3]])
+
+    def test_removed_candidates_are_not_returned(self):
+        self.search.search(Statement('What is your quest?'), self.candidates)
+
+        candidates = self.candidates[:3]
+        results = self.search.search(Statement('What is your quest?'), candidates)
+
+        self.assertNotIn('What... is your quest?', results)
+
+    def test_no_shared_ngrams(self):
+        results = self.search.search(Statement('zzz'), self.candidates)
+
+        self.assertEqual(results, [])
+
+
+class LemmaSearchTestCase(TestCase):
+
+    def setUp(self):
+        super(LemmaSearchTestCase, self).setUp()
+        self.search = search.LemmaSearch()
+        self.search.get_terms = lambda text: set(text.lower().strip('.?').split())
+
+    def test_candidates_without_shared_lemmas_are_not_returned(self):
+        candidates = [
+            Candidate('A cat.'),
+            Candidate('A dog.'),
+            Candidate('The cat and the dog.'),
+        ]
+
+        results = self.search.search(Statement('cat'), candidates)
+
+        self.assertEqual(results, [candidates[0], candidates[2]])
@@ -21,3 +21,28 @@ class DatabaseExportTests(ChatBotTestCase):
         self.assertEqual(
             [['Hello, how are you?', 'I am good.']], data
         )
+
+    def test_export_for_training(self):
+        import os
+        import json
+        import shutil
+        import tempfile
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        file_path = os.path.join(directory, 'export.json')
+
+        self.chatbot.trainer.train([
+            'Hello, how are you?',
+            'I am good.',
+            'That is good to hear.'
+        ])
+        self.chatbot.trainer.export_for_training(file_path)
+
+        with open(file_path) as export_file:
+            export = json.load(export_file)
+
+        self.assertEqual(export, {'conversations': [
+            ['Hello, how are you?', 'I am good.'],
+            ['I am good.', 'That is good to hear.']
+        ]})
@@ -257,3 +257,78 @@ class ChatterBotResponseTests(ChatBotTestCase):
         response = self.chatbot.get_response("")
 
         self.assertTrue(len(response.text) >= 0)
+
+
+class BulkListTrainingTests(ChatBotTestCase):
+
+    def get_saved_data(self):
+        return sorted(
+            (
+                statement.text,
+                sorted((response.text, response.occurrence) for response in statement.in_response_to),
+                sorted(statement.tags)
+            ) for statement in self.chatbot.storage.filter()
+        )
+
+    def train(self, bulk_training):
+        from chatterbot.conversation import Response
+
+        self.chatbot.storage.drop()
+        self.chatbot.storage.create()
+
+        self.chatbot.set_trainer(
+            ListTrainer,
+            show_training_progress=False,
+            bulk_training=bulk_training
+        )
+
+        self.chatbot.train(['Hi', 'Hello', 'Hi', 'Hello', 'Yo', 'Hi', 'Hello'])
+        self.chatbot.train(['Hi', 'Yo', 'Good day'])
+
+        # Tags are saved by other trainers, such as the corpus trainer
+        self.chatbot.trainer.start_bulk_training()
+        for tags in (['greetings'], ['greetings', 'slang']):
+            statement = self.chatbot.trainer.get_or_create('Yo')
+            statement.add_tags(tags)
+            statement.add_response(Response('Hello'))
+            self.chatbot.storage.update(statement)
+        self.chatbot.trainer.finish_bulk_training()
+
+        return self.get_saved_data()
+
+    def test_bulk_training_saves_same_data(self):
+        self.assertEqual(self.train(bulk_training=True), self.train(bulk_training=False))
+
+    def test_bulk_training_with_existing_statements(self):
+        saved_data = []
+
+        for bulk_training in (True, False):
+            self.train(bulk_training=False)
+
+            self.chatbot.set_trainer(
+                ListTrainer,
+                show_training_progress=False,
+                bulk_training=bulk_training
+            )
+            self.chatbot.train(['Yo', 'Hi', 'Good day', 'Hi'])
+
+            saved_data.append(self.get_saved_data())
+
+        self.assertEqual(saved_data[0], saved_data[1])
+
+    def test_bulk_training_writes_in_batches(self):
+        self.chatbot.storage.bulk_update_batch_size = 2
+        self.addCleanup(setattr, self.chatbot.storage, 'bulk_update_batch_size', 10000)
+
+        self.assertEqual(self.train(bulk_training=True), self.train(bulk_training=False))
+
+    def test_bulk_training_uses_fewer_round_trips(self):
+        round_trips = []
+
+        for bulk_training in (True, False):
+            self.chatbot.storage.start_request()
+            self.train(bulk_training)
+            round_trips.append(self.chatbot.storage.round_trips)
+            self.chatbot.storage.finish_request()
+
+        self.assertLess(round_trips[0], round_trips[1])
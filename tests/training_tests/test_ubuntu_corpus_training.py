@@ -165,6 +165,136 @@ class UbuntuCorpusTrainerTestCase(ChatBotTestCase):
         response = self.chatbot.get_response('Is anyone there?')
         self.assertEqual(response, 'Yes')
 
+    def test_train_in_worker_processes(self):
+        """
+        Test that the dialog files can be read in a pool of worker processes.
+        """
+        self._create_test_corpus(self._get_data())
+        self.chatbot.trainer.workers = 2
+
+        self.chatbot.train()
+        self._destroy_test_corpus()
+
+        response = self.chatbot.get_response('Is anyone there?')
+        self.assertEqual(response, 'Yes')
+
+    def test_train_records_checkpoint(self):
+        """
+        Test that each trained dialog file is recorded in the checkpoint.
+        """
+        self._create_test_corpus(self._get_data())
+
+        self.chatbot.train()
+        self._destroy_test_corpus()
+
+        self.assertEqual(
+            self.chatbot.trainer.get_checkpoint(),
+            {'dialogs/3/1.tsv', 'dialogs/3/2.tsv'}
+        )
+
+    def test_train_resumes_from_checkpoint(self):
+        """
+        Test that dialog files in the checkpoint are not trained again.
+        """
+        self._create_test_corpus(self._get_data())
+        self.chatbot.trainer.extract(self.chatbot.trainer.download(
+            self.chatbot.trainer.data_download_url
+        ))
+        self.chatbot.trainer.save_checkpoint(['dialogs/3/1.tsv'])
+
+        self.chatbot.train()
+        self._destroy_test_corpus()
+
+        # Only the second file sets the addressed speaker of this statement
+        statement = self.chatbot.storage.find('Is anyone there?')
+        self.assertNotIn('addressing_speaker', statement.extra_data)
+        self.assertEqual(statement.in_response_to[0].occurrence, 1)
+
+    def _get_occurrences(self):
+        return dict(
+            (statement.text, sorted(
+                (response.text, response.occurrence) for response in statement.in_response_to
+            )) for statement in self.chatbot.storage.filter()
+        )
+
+    def test_interrupted_training_resumes_with_same_occurrences(self):
+        """
+        Test that the statements of a dialog file that was interrupted
+        are not saved, so that they are not counted twice when
+        training is resumed.
+        """
+        self._create_test_corpus(self._get_data())
+        self.chatbot.trainer.checkpoint_interval = 1
+
+        self.chatbot.train()
+        expected_occurrences = self._get_occurrences()
+
+        self.chatbot.storage.drop()
+        self.chatbot.storage.create()
+        os.remove(self.chatbot.trainer.checkpoint_path)
+
+        train_from_rows = self.chatbot.trainer.train_from_rows
+        trained_files = []
+
+        def interrupt_second_file(rows):
+            trained_files.append(rows)
+
+            if len(trained_files) == 2:
+                train_from_rows(rows[:2])
+                raise KeyboardInterrupt()
+
+            train_from_rows(rows)
+
+        self.chatbot.trainer.train_from_rows = interrupt_second_file
+
+        with self.assertRaises(KeyboardInterrupt):
+            self.chatbot.train()
+
+        self.assertEqual(len(self.chatbot.trainer.get_checkpoint()), 1)
+
+        self.chatbot.trainer.train_from_rows = train_from_rows
+        self.chatbot.train()
+        self._destroy_test_corpus()
+
+        self.assertEqual(self._get_occurrences(), expected_occurrences)
+        self.assertEqual(self.chatbot.storage.bulk_statements, None)
+
+    def test_train_from_archive(self):
+        """
+        Test that the chat bot can be trained from the corpus
+        archive without extracting it.
+        """
+        self._create_test_corpus(self._get_data())
+        self.chatbot.trainer.extract_corpus = False
+
+        self.chatbot.train()
+        self._destroy_test_corpus()
+
+        self.assertFalse(os.path.exists(self.chatbot.trainer.extracted_data_directory))
+        self.assertEqual(
+            self.chatbot.trainer.get_checkpoint(),
+            {'dialogs/3/1.tsv', 'dialogs/3/2.tsv'}
+        )
+
+        response = self.chatbot.get_response('Is anyone there?')
+        self.assertEqual(response, 'Yes')
+
+    def test_train_from_archive_resumes_from_checkpoint(self):
+        """
+        Test that dialog files in the checkpoint are skipped
+        when training from the corpus archive.
+        """
+        self._create_test_corpus(self._get_data())
+        self.chatbot.trainer.extract_corpus = False
+        self.chatbot.trainer.save_checkpoint(['dialogs/3/1.tsv'])
+
+        self.chatbot.train()
+        self._destroy_test_corpus()
+
+        statement = self.chatbot.storage.find('Is anyone there?')
+        self.assertNotIn('addressing_speaker', statement.extra_data)
+        self.assertEqual(statement.in_response_to[0].occurrence, 1)
+
     def test_is_extracted(self):
         """
         Test that a check can be done for if the corpus has aleady been extracted.
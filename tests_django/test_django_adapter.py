@@ -336,6 +336,31 @@ class DjangoAdapterFilterTestCase(DjangoAdapterTestCase):
 
         self.assertEqual(len(results), 2)
 
+    def test_filter_iter(self):
+        self.adapter.filter_batch_size = 1
+
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter_iter(order_by='text')
+
+        self.assertNotIsInstance(results, list)
+        self.assertEqual(
+            [statement.text for statement in results],
+            [statement.text for statement in self.adapter.filter(order_by='text')]
+        )
+
+    def test_filter_iter_contains_result(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = list(self.adapter.filter_iter(
+            in_response_to__contains="Why are you counting?"
+        ))
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].text, self.statement1.text)
+
     def test_filter_returns_statement_with_multiple_responses(self):
         statement = StatementModel.objects.create(text="You are welcome.")
         statement.add_response(StatementModel(text="Thanks."))